@@ -0,0 +1,265 @@
+"""Análisis del historial de resultados con NumPy.
+
+Uso:
+    python -m herramientas.analisis_resultados [ruta ...] \
+        [--desde 2026-02-01] [--hasta 2026-03-01]
+
+Acepta la carpeta del historial en segmentos (`data/resultados`), el
+JSON acumulativo anterior (`data/resultados.json`) y exportaciones con
+un resultado JSON por línea (`.jsonl`). Con `--desde`/`--hasta` solo se
+leen los segmentos del historial que tocan esa ventana. Cada archivo se
+parsea una única vez a columnas y todos los cálculos se hacen
+vectorizados.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+
+import numpy as np
+
+from modules.config import CANT_NIVELES, DIR_RESULTADOS
+from modules.historial import HistorialResultados
+
+
+def leer_registros(ruta, desde=None, hasta=None):
+    """Lee los resultados de un historial, un archivo JSON o líneas JSON.
+
+    Args:
+        ruta: Carpeta del historial o ruta al archivo de resultados.
+        desde: Inicio de la ventana de tiempo (inclusive), o None.
+        hasta: Fin de la ventana de tiempo (exclusivo), o None.
+
+    Returns:
+        list: Lista de diccionarios de resultados.
+    """
+    if os.path.isdir(ruta):
+        return list(HistorialResultados(ruta).leer(desde, hasta))
+    with open(ruta, "r", encoding="utf-8") as archivo:
+        contenido = archivo.read()
+    if contenido.lstrip().startswith("["):
+        registros = json.loads(contenido)
+    else:
+        # Un único json.loads sobre las líneas unidas es bastante más
+        # rápido que decodificar cada línea por separado.
+        lineas = [linea for linea in contenido.splitlines() if linea.strip()]
+        registros = json.loads("[" + ",".join(lineas) + "]")
+    if desde is not None or hasta is not None:
+        registros = [
+            r
+            for r in registros
+            if (desde is None or r["fecha"] >= desde)
+            and (hasta is None or r["fecha"] < hasta)
+        ]
+    return registros
+
+
+def a_columnas(registros, niveles=CANT_NIVELES):
+    """Convierte una lista de resultados en arreglos columnares.
+
+    Args:
+        registros: Lista de diccionarios de resultados.
+        niveles: Cantidad de columnas de la matriz de tiempos.
+
+    Returns:
+        dict: Arreglos `puntaje`, `nivel`, `ganador`, `jugador`
+        (índice en `nombres`), `nombres`, `fecha` (datetime64[s]) y
+        `tiempos` (matriz partidas x niveles con NaN donde no hay dato).
+    """
+    n = len(registros)
+    puntaje = np.fromiter((r["puntaje"] for r in registros), np.int64, n)
+    nivel = np.fromiter((r["nivel_alcanzado"] for r in registros), np.int16, n)
+    ganador = np.fromiter((r["ganador"] for r in registros), np.bool_, n)
+
+    nombres, jugador = np.unique(
+        np.array([r["nombre"] for r in registros], dtype=str), return_inverse=True
+    )
+    if n:
+        fechas = np.array([r["fecha"] for r in registros], dtype=str)
+        fecha = np.char.replace(fechas, " ", "T").astype("datetime64[s]")
+    else:
+        fecha = np.array([], dtype="datetime64[s]")
+
+    largos = np.fromiter((len(r["tiempos_por_nivel"]) for r in registros), np.int64, n)
+    valores = np.fromiter(
+        itertools.chain.from_iterable(r["tiempos_por_nivel"] for r in registros),
+        np.float64,
+        int(largos.sum()),
+    )
+    filas = np.repeat(np.arange(n), largos)
+    columnas = np.arange(len(valores)) - np.repeat(np.cumsum(largos) - largos, largos)
+    visibles = columnas < niveles
+    tiempos = np.full((n, niveles), np.nan)
+    tiempos[filas[visibles], columnas[visibles]] = valores[visibles]
+
+    return {
+        "puntaje": puntaje,
+        "nivel": nivel,
+        "ganador": ganador,
+        "jugador": jugador.ravel(),
+        "nombres": nombres,
+        "fecha": fecha,
+        "tiempos": tiempos,
+    }
+
+
+def concatenar(columnas_por_archivo):
+    """Une las columnas de varios archivos en un único conjunto.
+
+    Args:
+        columnas_por_archivo: Lista de diccionarios devueltos por
+        `a_columnas`.
+
+    Returns:
+        dict: Columnas combinadas, con los índices de jugador
+        recalculados sobre la unión de nombres.
+    """
+    nombres = np.concatenate([c["nombres"][c["jugador"]] for c in columnas_por_archivo])
+    unicos, jugador = np.unique(nombres, return_inverse=True)
+    resultado = {
+        clave: np.concatenate([c[clave] for c in columnas_por_archivo])
+        for clave in ("puntaje", "nivel", "ganador", "fecha", "tiempos")
+    }
+    resultado["nombres"] = unicos
+    resultado["jugador"] = jugador.ravel()
+    return resultado
+
+
+def tasa_victorias(columnas):
+    """Calcula la fracción de partidas ganadas."""
+    return float(columnas["ganador"].mean()) if len(columnas["ganador"]) else 0.0
+
+
+def distribucion_tiempos(columnas, percentiles=(10, 50, 90)):
+    """Calcula cantidad, media y percentiles de tiempo por nivel.
+
+    Args:
+        columnas: Columnas devueltas por `a_columnas`.
+        percentiles: Percentiles a calcular.
+
+    Returns:
+        dict: `cantidad`, `media` y `percentiles` (matriz
+        percentiles x niveles), con NaN en niveles sin datos.
+    """
+    tiempos = columnas["tiempos"]
+    cantidad = np.count_nonzero(~np.isnan(tiempos), axis=0)
+    con_datos = cantidad > 0
+    media = np.full(tiempos.shape[1], np.nan)
+    cuantiles = np.full((len(percentiles), tiempos.shape[1]), np.nan)
+    if con_datos.any():
+        media[con_datos] = np.nanmean(tiempos[:, con_datos], axis=0)
+        cuantiles[:, con_datos] = np.nanpercentile(
+            tiempos[:, con_datos], percentiles, axis=0
+        )
+    return {"cantidad": cantidad, "media": media, "percentiles": cuantiles}
+
+
+def retencion_por_fecha(columnas):
+    """Calcula jugadores únicos y recurrentes por día.
+
+    Un jugador es recurrente en un día si ya había jugado en un día
+    anterior.
+
+    Returns:
+        tuple: Arreglo de días (datetime64[D]), jugadores únicos por
+        día y jugadores recurrentes por día.
+    """
+    dias_partida = columnas["fecha"].astype("datetime64[D]")
+    dias, dia = np.unique(dias_partida, return_inverse=True)
+    dia = dia.ravel().astype(np.int64)
+    jugador = columnas["jugador"].astype(np.int64)
+
+    pares = np.unique(jugador * len(dias) + dia)
+    pares_jugador = pares // len(dias)
+    pares_dia = pares % len(dias)
+    primer_dia = np.full(len(columnas["nombres"]), len(dias), dtype=np.int64)
+    np.minimum.at(primer_dia, pares_jugador, pares_dia)
+
+    unicos = np.bincount(pares_dia, minlength=len(dias))
+    es_recurrente = pares_dia > primer_dia[pares_jugador]
+    recurrentes = np.bincount(pares_dia[es_recurrente], minlength=len(dias))
+    return dias, unicos, recurrentes
+
+
+def embudo_niveles(columnas, niveles=CANT_NIVELES):
+    """Calcula en qué nivel pierden los jugadores.
+
+    Returns:
+        tuple: Partidas perdidas por nivel y partidas que alcanzaron
+        cada nivel, ambos arreglos de largo `niveles` (nivel 1 en la
+        posición 0).
+    """
+    nivel = np.clip(columnas["nivel"].astype(np.int64), 1, niveles)
+    perdidas = np.bincount(nivel[~columnas["ganador"]] - 1, minlength=niveles)
+    por_nivel = np.bincount(nivel - 1, minlength=niveles)
+    alcanzaron = np.cumsum(por_nivel[::-1])[::-1]
+    return perdidas[:niveles], alcanzaron[:niveles]
+
+
+def _imprimir_informe(columnas, salida=sys.stdout):
+    """Imprime el informe completo del historial."""
+    total = len(columnas["puntaje"])
+    print(f"Partidas: {total}", file=salida)
+    print(f"Jugadores distintos: {len(columnas['nombres'])}", file=salida)
+    print(f"Tasa de victorias: {tasa_victorias(columnas) * 100:.1f}%", file=salida)
+    if total:
+        print(f"Puntaje promedio: {columnas['puntaje'].mean():.1f}", file=salida)
+
+    print("\nTiempos por nivel (s):", file=salida)
+    print("  nivel  partidas   media     p10     p50     p90", file=salida)
+    distribucion = distribucion_tiempos(columnas)
+    for i in range(columnas["tiempos"].shape[1]):
+        p10, p50, p90 = distribucion["percentiles"][:, i]
+        print(
+            f"  {i + 1:>5}  {distribucion['cantidad'][i]:>8}"
+            f"  {distribucion['media'][i]:>6.2f}  {p10:>6.2f}  {p50:>6.2f}"
+            f"  {p90:>6.2f}",
+            file=salida,
+        )
+
+    print("\nEmbudo de niveles:", file=salida)
+    print("  nivel  alcanzaron  perdieron", file=salida)
+    perdidas, alcanzaron = embudo_niveles(columnas)
+    for i in range(len(perdidas)):
+        print(f"  {i + 1:>5}  {alcanzaron[i]:>10}  {perdidas[i]:>9}", file=salida)
+
+    print("\nRetención por día:", file=salida)
+    print("  fecha       jugadores  recurrentes", file=salida)
+    if total:
+        dias, unicos, recurrentes = retencion_por_fecha(columnas)
+        for dia, cantidad, recurrente in zip(dias, unicos, recurrentes):
+            print(f"  {dia}  {cantidad:>9}  {recurrente:>11}", file=salida)
+
+
+def main(argumentos=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "rutas",
+        nargs="*",
+        default=[DIR_RESULTADOS],
+        help="Carpetas de historial o archivos de resultados (JSON o una"
+        " línea JSON por resultado).",
+    )
+    parser.add_argument("--desde", help="Fecha inicial, por ejemplo 2026-02-01.")
+    parser.add_argument("--hasta", help="Fecha final (exclusiva).")
+    args = parser.parse_args(argumentos)
+
+    leidos = []
+    for ruta in args.rutas:
+        if not os.path.exists(ruta):
+            print(f"AVISO: No existe {ruta}.")
+            continue
+        registros = leer_registros(ruta, args.desde, args.hasta)
+        if registros:
+            leidos.append(a_columnas(registros))
+    if not leidos:
+        print("No hay resultados para analizar.")
+        return
+    _imprimir_informe(concatenar(leidos))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark del costo por cuadro de la captura continua de juego.
+
+Uso:
+    python -m herramientas.benchmark_captura [--cuadros 600] \
+        [--escalas 0.25 0.333 0.5]
+
+Dibuja sin ventana visible la pantalla de juego en cada cuadro y mide
+lo que agrega `CapturaCuadros.capturar` con la captura sin límite de
+cuadros por segundo (el peor caso: en el juego solo se captura hasta
+`CUADROS_CAPTURA_POR_SEGUNDO`). Muestra también la memoria del buffer
+y lo que tarda volcarlo a disco.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from modules.config import (
+    ANCHO,
+    ALTO,
+    ESCALA_CAPTURA,
+    SEGUNDOS_CAPTURA,
+    CUADROS_CAPTURA_POR_SEGUNDO,
+)
+
+# El costo de captura tiene que quedar muy por debajo de este límite.
+PRESUPUESTO_MS = 1.0
+
+
+def _percentil(valores, fraccion):
+    """Devuelve el percentil `fraccion` (0..1) de una lista no vacía."""
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * fraccion))]
+
+
+def medir_escala(juego, escala, cuadros, pantalla, fuente, directorio):
+    """Mide la captura con un factor de reducción.
+
+    Returns:
+        dict: Tamaño del cuadro, p50, p95 y máximo de captura en ms,
+        MB del buffer y segundos del volcado.
+    """
+    from modules.captura import CapturaCuadros
+
+    capacidad = SEGUNDOS_CAPTURA * CUADROS_CAPTURA_POR_SEGUNDO
+    captura = CapturaCuadros(pantalla, directorio, capacidad, None, escala)
+    tiempos = []
+    for _ in range(cuadros):
+        juego.invalidar_cuadro()
+        juego.actualizar()
+        juego.dibujar(pantalla, fuente, fuente)
+        inicio = time.perf_counter()
+        captura.capturar(pantalla)
+        tiempos.append(time.perf_counter() - inicio)
+
+    inicio = time.perf_counter()
+    captura.volcar(f"escala-{escala:g}")
+    volcado = time.perf_counter() - inicio
+    return {
+        "tamanio": captura.tamanio,
+        "p50": statistics.median(tiempos) * 1000,
+        "p95": _percentil(tiempos, 0.95) * 1000,
+        "maximo": max(tiempos) * 1000,
+        "memoria": captura.memoria() / 2**20,
+        "volcado": volcado,
+    }
+
+
+def main(argumentos=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cuadros", type=int, default=600)
+    parser.add_argument(
+        "--escalas", type=float, nargs="+", default=[0.25, ESCALA_CAPTURA, 0.5]
+    )
+    args = parser.parse_args(argumentos)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    from modules.logica_juego import Juego
+
+    pygame.init()
+    pantalla = pygame.display.set_mode((ANCHO, ALTO))
+    fuente = pygame.font.SysFont("Silkscreen", 15, bold=True)
+
+    juego = Juego("data/datos.csv", {})
+    juego.nombre = "benchmark"
+    juego.cambiar_pantalla("inicio", "jugando")
+    print(
+        f"{'escala':>6} {'cuadro':>9} {'p50':>8} {'p95':>8} {'máx':>8}"
+        f" {'buffer':>8} {'volcado':>8}"
+    )
+    try:
+        with tempfile.TemporaryDirectory() as directorio:
+            for escala in args.escalas:
+                r = medir_escala(
+                    juego, escala, args.cuadros, pantalla, fuente, directorio
+                )
+                aviso = "" if r["p95"] < PRESUPUESTO_MS else "  > 1 ms"
+                ancho, alto = r["tamanio"]
+                print(
+                    f"{escala:>6.3f} {ancho:>4}x{alto:<4} {r['p50']:>6.3f}ms"
+                    f" {r['p95']:>6.3f}ms {r['maximo']:>6.3f}ms"
+                    f" {r['memoria']:>6.1f}MB {r['volcado']:>7.2f}s{aviso}"
+                )
+    finally:
+        juego.cerrar()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Benchmark de carga de catálogos y generación de tableros.
+
+Uso:
+    python -m herramientas.benchmark_catalogo [--filas 1000 100000 ...]
+
+Para cada tamaño genera un catálogo sintético y, en un proceso nuevo
+para que la memoria medida no se mezcle, mide el tiempo de carga, el
+RSS agregado y la latencia de generar un tablero de 16 cartas. Con
+`--comparar` también mide la carga con `leer_csv` y la agrupación
+recorriendo todas las filas, como se hacía antes de `Catalogo`.
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from herramientas.generar_catalogo import generar_catalogo, imagenes_disponibles
+from modules.metricas import rss_actual
+
+
+def _tablero_legado(elementos, nivel):
+    """Arma un tablero recorriendo todas las filas, como antes de `Catalogo`."""
+    grupos = {}
+    for elemento in elementos:
+        if elemento.get("dificultad", 1) == nivel:
+            grupos.setdefault(elemento["categoria"], []).append(elemento)
+    validos = {c: items for c, items in grupos.items() if len(items) == 4}
+    cartas = []
+    for categoria in random.sample(list(validos), min(4, len(validos))):
+        cartas.extend(validos[categoria])
+    return cartas
+
+
+def _medir(ruta, legado, repeticiones, cola):
+    """Mide carga, memoria y latencia de tablero en el proceso actual."""
+    from modules.utilidades import leer_csv
+    from modules.catalogo import Catalogo
+
+    rss_inicial = rss_actual()
+    inicio = time.perf_counter()
+    if legado:
+        catalogo = leer_csv(ruta)
+    else:
+        catalogo = Catalogo.desde_csv(ruta)
+    carga = time.perf_counter() - inicio
+    rss = rss_actual() - rss_inicial
+
+    latencias = []
+    for i in range(repeticiones):
+        nivel = i % 5 + 1
+        inicio = time.perf_counter()
+        if legado:
+            _tablero_legado(catalogo, nivel)
+        else:
+            catalogo.cartas_grupos(catalogo.muestrear_grupos(nivel, 4))
+        latencias.append(time.perf_counter() - inicio)
+
+    cola.put((carga, rss, statistics.median(latencias), max(latencias)))
+
+
+def medir(ruta, legado=False, repeticiones=200):
+    """Ejecuta `_medir` en un proceso aparte y devuelve sus resultados.
+
+    Returns:
+        tuple: Segundos de carga, bytes de RSS agregados, y latencia
+        mediana y máxima de generación de tablero en segundos.
+    """
+    cola = multiprocessing.Queue()
+    proceso = multiprocessing.Process(
+        target=_medir, args=(ruta, legado, repeticiones, cola)
+    )
+    proceso.start()
+    resultado = cola.get()
+    proceso.join()
+    return resultado
+
+
+def main(argumentos=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--filas", type=int, nargs="+", default=[1000, 10000, 100000, 500000]
+    )
+    parser.add_argument("--repeticiones", type=int, default=200)
+    parser.add_argument("--comparar", action="store_true")
+    args = parser.parse_args(argumentos)
+
+    imagenes = imagenes_disponibles()
+    variantes = [("catalogo", False)]
+    if args.comparar:
+        variantes.append(("leer_csv", True))
+
+    print(f"{'filas':>8}  {'modo':<9} {'carga':>9} {'RSS':>9} {'tablero p50':>12} {'máx':>9}")
+    with tempfile.TemporaryDirectory() as directorio:
+        for filas in args.filas:
+            ruta = os.path.join(directorio, f"catalogo_{filas}.csv")
+            generar_catalogo(ruta, filas // 4, 5, 4, imagenes)
+            for nombre, legado in variantes:
+                carga, rss, p50, maximo = medir(ruta, legado, args.repeticiones)
+                print(
+                    f"{filas:>8}  {nombre:<9} {carga * 1000:>7.1f}ms"
+                    f" {rss / 2**20:>7.1f}MB {p50 * 1e6:>10.1f}us"
+                    f" {maximo * 1e6:>7.1f}us"
+                )
+
+
+if __name__ == "__main__":
+    main()
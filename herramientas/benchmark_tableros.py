@@ -0,0 +1,144 @@
+"""Benchmark de dibujo y selección para cada tamaño de tablero.
+
+Uso:
+    python -m herramientas.benchmark_tableros [--modos 4x4 6x6 8x8] \
+        [--cuadros 600] [--imagenes DIR]
+
+Para cada modo de `MODOS_TABLERO` arma un tablero completo con un
+catálogo sintético y mide, sin ventana visible, el primer cuadro (que
+compone los sprites), los cuadros siguientes con una selección en curso
+y el costo de ubicar la carta bajo el mouse, comparando
+`DisposicionTablero.indice_en` con recorrer los rectángulos de todas
+las cartas. Con `--imagenes` las cartas usan las imágenes de otra
+carpeta, por ejemplo las generadas por `herramientas.generar_catalogo`.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from modules.config import ANCHO, ALTO, FPS, MODOS_TABLERO
+from herramientas.generar_catalogo import generar_catalogo, imagenes_disponibles
+
+
+def _percentil(valores, fraccion):
+    """Devuelve el percentil `fraccion` (0..1) de una lista no vacía."""
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * fraccion))]
+
+
+def medir_modo(ruta_csv, modo, cuadros, pantalla, fuente):
+    """Mide el dibujo y la selección de un modo de tablero.
+
+    Args:
+        ruta_csv: Catálogo con grupos suficientes para llenar el tablero.
+        modo: Nombre del modo en `MODOS_TABLERO`.
+        cuadros: Cantidad de cuadros a medir.
+        pantalla: Superficie donde dibujar.
+        fuente: Fuente para los textos.
+
+    Returns:
+        dict: Cartas, milisegundos del primer cuadro, p50 y p95 por
+        cuadro, y microsegundos por búsqueda con índice y con recorrido.
+    """
+    from modules.logica_juego import Juego
+
+    juego = Juego(ruta_csv, {}, modo)
+    try:
+        juego.nombre = "benchmark"
+        juego.cambiar_pantalla("inicio", "jugando")
+
+        inicio = time.perf_counter()
+        juego.dibujar(pantalla, fuente, fuente)
+        primero = time.perf_counter() - inicio
+
+        tiempos = []
+        for i in range(cuadros):
+            # Alterna una selección parcial para que cambien los sprites.
+            juego.seleccionados = juego.tablero[: i % juego.disposicion.tamanio_grupo]
+            inicio = time.perf_counter()
+            juego.actualizar()
+            juego.dibujar(pantalla, fuente, fuente)
+            tiempos.append(time.perf_counter() - inicio)
+        juego.seleccionados = []
+
+        aleatorio = random.Random(0)
+        posiciones = [
+            (aleatorio.randrange(ANCHO), aleatorio.randrange(ALTO))
+            for _ in range(20000)
+        ]
+        disposicion = juego.disposicion
+        cantidad = len(juego.tablero)
+        inicio = time.perf_counter()
+        for pos in posiciones:
+            disposicion.indice_en(pos, cantidad)
+        indice = (time.perf_counter() - inicio) / len(posiciones)
+
+        rects = disposicion.ubicar(disposicion.y_grilla)[:cantidad]
+        inicio = time.perf_counter()
+        for pos in posiciones:
+            for rect in rects:
+                if rect.collidepoint(pos):
+                    break
+        recorrido = (time.perf_counter() - inicio) / len(posiciones)
+    finally:
+        juego.cerrar()
+
+    return {
+        "cartas": cantidad,
+        "primero": primero * 1000,
+        "p50": statistics.median(tiempos) * 1000,
+        "p95": _percentil(tiempos, 0.95) * 1000,
+        "indice": indice * 1e6,
+        "recorrido": recorrido * 1e6,
+    }
+
+
+def main(argumentos=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modos", nargs="+", default=list(MODOS_TABLERO))
+    parser.add_argument("--cuadros", type=int, default=600)
+    parser.add_argument("--imagenes", help="Carpeta de imágenes de las cartas.")
+    args = parser.parse_args(argumentos)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+
+    pygame.init()
+    pantalla = pygame.display.set_mode((ANCHO, ALTO))
+    fuente = pygame.font.SysFont("Silkscreen", 15, bold=True)
+    presupuesto = 1000 / FPS
+    imagenes = imagenes_disponibles()
+    if args.imagenes:
+        from modules.utilidades import usar_directorio_imagenes
+
+        usar_directorio_imagenes(args.imagenes)
+        imagenes = imagenes_disponibles(args.imagenes)
+
+    print(
+        f"{'modo':<5} {'cartas':>6} {'1er cuadro':>11} {'p50':>8} {'p95':>8}"
+        f" {'FPS máx':>8} {'índice':>9} {'recorrido':>10}"
+    )
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "catalogo.csv")
+        # Cada nivel necesita tantos grupos como el tablero más grande.
+        grupos = max(f * c for f, c, _, _ in MODOS_TABLERO.values()) // 4
+        generar_catalogo(ruta, grupos * 5 * 2, 5, 4, imagenes)
+        for modo in args.modos:
+            r = medir_modo(ruta, modo, args.cuadros, pantalla, fuente)
+            aviso = "" if r["p95"] <= presupuesto else f"  > {presupuesto:.1f} ms"
+            print(
+                f"{modo:<5} {r['cartas']:>6} {r['primero']:>9.1f}ms"
+                f" {r['p50']:>6.2f}ms {r['p95']:>6.2f}ms {1000 / r['p50']:>8.0f}"
+                f" {r['indice']:>7.2f}us {r['recorrido']:>8.2f}us{aviso}"
+            )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
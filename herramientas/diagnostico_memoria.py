@@ -0,0 +1,96 @@
+"""Informe de reservas de memoria del bucle de dibujo en estado estable.
+
+Uso:
+    python -m herramientas.diagnostico_memoria [--modo 4x4] \
+        [--cuadros 300] [--calentamiento 60] [--csv data/datos.csv]
+
+Arma un tablero sin ventana visible, dibuja unos cuadros de
+calentamiento para llenar las cachés y después fuerza el redibujo
+completo en cada cuadro, sin cambiar el estado, con `tracemalloc`
+activo. El informe muestra por línea de `modules/` lo que quedó
+reservado y lo que se reservó y liberó dentro de cada cuadro, junto con
+la memoria de píxeles que retienen las cachés de superficies. Si
+`--csv` no se indica se usa un catálogo sintético.
+"""
+import argparse
+import os
+import tempfile
+
+from modules.config import ANCHO, ALTO, MODO_TABLERO, MODOS_TABLERO
+from herramientas.generar_catalogo import generar_catalogo, imagenes_disponibles
+
+
+def diagnosticar(ruta_csv, modo, cuadros, calentamiento, pantalla, fuente) -> str:
+    """Dibuja el tablero en estado estable y devuelve el informe de memoria.
+
+    Args:
+        ruta_csv: Catálogo con grupos suficientes para llenar el tablero.
+        modo: Nombre del modo en `MODOS_TABLERO`.
+        cuadros: Cuadros medidos.
+        calentamiento: Cuadros dibujados antes de medir.
+        pantalla: Superficie donde dibujar.
+        fuente: Fuente para los textos.
+
+    Returns:
+        str: Texto del informe.
+    """
+    from modules.diagnostico import DiagnosticoMemoria
+    from modules.logica_juego import Juego
+
+    juego = Juego(ruta_csv, {}, modo)
+    try:
+        juego.nombre = "diagnostico"
+        juego.cambiar_pantalla("inicio", "jugando")
+        for _ in range(calentamiento):
+            juego.invalidar_cuadro()
+            juego.actualizar()
+            juego.dibujar(pantalla, fuente, fuente)
+
+        # Un cuadro de más para que el informe no salga solo desde `cuadro`.
+        diagnostico = DiagnosticoMemoria(cuadros + 1)
+        try:
+            for _ in range(cuadros):
+                juego.invalidar_cuadro()
+                juego.actualizar()
+                juego.dibujar(pantalla, fuente, fuente)
+                diagnostico.cuadro()
+            return diagnostico.informe(juego.memoria_superficies)
+        finally:
+            diagnostico.detener()
+    finally:
+        juego.cerrar()
+
+
+def main(argumentos=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modo", default=MODO_TABLERO, choices=list(MODOS_TABLERO))
+    parser.add_argument("--cuadros", type=int, default=300)
+    parser.add_argument("--calentamiento", type=int, default=60)
+    parser.add_argument("--csv", help="Catálogo a usar en lugar del sintético.")
+    args = parser.parse_args(argumentos)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+
+    pygame.init()
+    pantalla = pygame.display.set_mode((ANCHO, ALTO))
+    fuente = pygame.font.SysFont("Silkscreen", 15, bold=True)
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = args.csv
+        if ruta is None:
+            ruta = os.path.join(directorio, "catalogo.csv")
+            filas, columnas, _, _ = MODOS_TABLERO[args.modo]
+            grupos = filas * columnas // 4
+            generar_catalogo(ruta, grupos * 5 * 2, 5, 4, imagenes_disponibles())
+        print(
+            diagnosticar(
+                ruta, args.modo, args.cuadros, args.calentamiento, pantalla, fuente
+            )
+        )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
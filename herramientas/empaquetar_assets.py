@@ -0,0 +1,125 @@
+"""Genera el paquete de imágenes pre-escaladas que usa el juego.
+
+Uso:
+    python -m herramientas.empaquetar_assets [--csv data/datos.csv] \
+        [--salida data/assets.pack] [--procesos N] [--modos 4x4 8x8]
+
+Lee cada imagen referenciada por el catálogo, la escala a los tamaños
+de carta de cada modo de tablero indicado (por defecto `MODO_TABLERO`)
+en un pool de procesos y escribe los píxeles crudos en un único
+archivo que el juego mapea en memoria al iniciar. Hay que volver a
+generarlo al cambiar imágenes o tamaños de carta.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from modules.config import (
+    DIR_IMAGENES,
+    MODO_TABLERO,
+    MODOS_TABLERO,
+    RUTA_PAQUETE_ASSETS,
+    TAMANIOS_IMAGEN,
+)
+from modules.catalogo import Catalogo
+from modules.tablero import DisposicionTablero
+from modules.paquete_assets import FORMATO_PIXELES, serializar_paquete
+
+
+def escalar_imagen(argumentos):
+    """Decodifica una imagen y la escala a varios tamaños.
+
+    Se ejecuta en los procesos del pool, por lo que no usa la
+    pantalla: los píxeles se convierten a `FORMATO_PIXELES` con
+    `pygame.image.tobytes`.
+
+    Args:
+        argumentos: Tupla (directorio, nombre, tamaños).
+
+    Returns:
+        tuple: Nombre y lista de tuplas (tamaño, píxeles), o lista
+        vacía si la imagen no se pudo leer.
+    """
+    import pygame
+
+    directorio, nombre, tamanios = argumentos
+    escaladas = []
+    try:
+        imagen = pygame.image.load(os.path.join(directorio, nombre))
+    except (pygame.error, FileNotFoundError) as error:
+        print(f"AVISO: No se pudo leer {nombre}: {error}")
+    else:
+        for tamanio in tamanios:
+            escalada = pygame.transform.scale(imagen, tamanio)
+            escaladas.append((tamanio, pygame.image.tobytes(escalada, FORMATO_PIXELES)))
+    return nombre, escaladas
+
+
+def decodificar_imagenes(
+    nombres, directorio=DIR_IMAGENES, tamanios=TAMANIOS_IMAGEN, procesos=None
+):
+    """Escala todas las imágenes en paralelo.
+
+    Args:
+        nombres: Nombres de archivo a procesar.
+        directorio: Carpeta de las imágenes originales.
+        tamanios: Tamaños de salida.
+        procesos: Cantidad de procesos del pool (None: uno por núcleo).
+
+    Returns:
+        list: Tuplas (nombre, (ancho, alto), píxeles) ordenadas por nombre.
+    """
+    tareas = [(directorio, nombre, tuple(tamanios)) for nombre in sorted(nombres)]
+    entradas = []
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        for nombre, escaladas in pool.map(escalar_imagen, tareas, chunksize=8):
+            for tamanio, pixeles in escaladas:
+                entradas.append((nombre, tamanio, pixeles))
+    return entradas
+
+
+def tamanios_modos(modos) -> list:
+    """Devuelve los tamaños de imagen, sin repetir, de varios modos de tablero."""
+    tamanios = []
+    for modo in modos:
+        for tamanio in DisposicionTablero.desde_modo(modo).tamanios_imagen:
+            if tamanio not in tamanios:
+                tamanios.append(tamanio)
+    return tamanios
+
+
+def main(argumentos=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", default="data/datos.csv")
+    parser.add_argument("--imagenes", default=DIR_IMAGENES)
+    parser.add_argument("--salida", default=RUTA_PAQUETE_ASSETS)
+    parser.add_argument("--procesos", type=int, default=None)
+    parser.add_argument(
+        "--modos", nargs="+", choices=list(MODOS_TABLERO), default=[MODO_TABLERO]
+    )
+    args = parser.parse_args(argumentos)
+
+    tamanios = tamanios_modos(args.modos)
+
+    inicio = time.perf_counter()
+    nombres = Catalogo.desde_csv(args.csv).imagenes()
+    entradas = decodificar_imagenes(nombres, args.imagenes, tamanios, args.procesos)
+    contenido = serializar_paquete(entradas)
+
+    temporal = args.salida + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(contenido)
+    os.replace(temporal, args.salida)
+
+    duracion = time.perf_counter() - inicio
+    print(
+        f"{len(entradas)} imágenes ({len(nombres)} archivos) en {args.salida}: "
+        f"{len(contenido) / 2**20:.1f} MB en {duracion:.2f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""Generador de catálogos sintéticos compatibles con `datos.csv`.
+
+Uso:
+    python -m herramientas.generar_catalogo --categorias 25000 --niveles 5 \
+        --salida /tmp/catalogo.csv [--generar-imagenes] [--dir-imagenes DIR]
+
+Cada categoría recibe `--elementos` filas con la misma dificultad. Con
+`--escala` la cantidad de categorías es un múltiplo de las del catálogo
+actual (`data/datos.csv`).
+
+Por defecto las imágenes se toman en forma cíclica de las que ya
+existen en `assets/img`, de modo que el catálogo se puede jugar tal
+cual. Con `--generar-imagenes` se dibujan en cambio imágenes de relleno,
+una por elemento o `--cantidad-imagenes` en total, en `--dir-imagenes`
+o en una carpeta temporal. Sus formatos y resoluciones siguen la
+distribución de `assets/img`. Para jugar con el resultado:
+
+    AGRUPADOS_CATALOGO=<csv> AGRUPADOS_IMAGENES=<carpeta> python main.py
+"""
+
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Formato y resolución aproximados de `assets/img` cuando no se puede
+# leer: dos tercios PNG de ~80 y ~100 px, un tercio JPG de ~100 y ~190 px.
+PERFIL_PREDETERMINADO = (
+    [("png", 82, 81)] * 22
+    + [("png", 102, 102)] * 42
+    + [("jpg", 100, 100)] * 15
+    + [("jpg", 193, 190)] * 17
+    + [("jpg", 295, 292)]
+)
+
+
+def imagenes_disponibles(directorio=os.path.join("assets", "img")):
+    """Lista las imágenes de cartas existentes en `directorio`."""
+    extensiones = (".png", ".jpg", ".jpeg")
+    return sorted(
+        nombre
+        for nombre in os.listdir(directorio)
+        if nombre.lower().endswith(extensiones) and not nombre.startswith("icono")
+    )
+
+
+def perfil_imagenes(directorio=os.path.join("assets", "img")) -> list:
+    """Devuelve el formato y la resolución de las imágenes de `directorio`.
+
+    Returns:
+        list: Tuplas (extensión, ancho, alto), una por imagen legible, o
+        `PERFIL_PREDETERMINADO` si no hay ninguna.
+    """
+    import pygame
+
+    perfil = []
+    try:
+        nombres = imagenes_disponibles(directorio)
+    except OSError:
+        nombres = []
+    for nombre in nombres:
+        try:
+            ancho, alto = pygame.image.load(os.path.join(directorio, nombre)).get_size()
+        except (pygame.error, FileNotFoundError):
+            continue
+        extension = nombre.rsplit(".", 1)[1].lower().replace("jpeg", "jpg")
+        perfil.append((extension, ancho, alto))
+    return perfil or list(PERFIL_PREDETERMINADO)
+
+
+def nombres_imagenes(cantidad, perfil, semilla=0) -> list:
+    """Elige el nombre (y con él el formato) de cada imagen a generar.
+
+    Returns:
+        list: Tuplas (nombre, ancho, alto), una por imagen.
+    """
+    aleatorio = random.Random(semilla)
+    nombres = []
+    for i in range(cantidad):
+        extension, ancho, alto = perfil[aleatorio.randrange(len(perfil))]
+        # Variación de unos píxeles, como entre las imágenes reales.
+        ancho += aleatorio.randint(-4, 4)
+        alto += aleatorio.randint(-4, 4)
+        nombres.append((f"sintetica_{i:07d}.{extension}", ancho, alto))
+    return nombres
+
+
+def dibujar_imagenes(argumentos):
+    """Dibuja y guarda un bloque de imágenes de relleno.
+
+    Se ejecuta en los procesos del pool. Cada imagen es un fondo con
+    degradé y unas figuras de colores, para que el tamaño comprimido y
+    el costo de decodificar se parezcan a los de una ilustración y no
+    a los de un color liso.
+
+    Args:
+        argumentos: Tupla (directorio, lista de (nombre, ancho, alto),
+        semilla).
+
+    Returns:
+        int: Bytes escritos.
+    """
+    import pygame
+
+    directorio, imagenes, semilla = argumentos
+    escritos = 0
+    for nombre, ancho, alto in imagenes:
+        aleatorio = random.Random(f"{semilla}:{nombre}")
+        # Las PNG reales son íconos con transparencia; las JPG, fotos.
+        transparente = nombre.endswith(".png")
+        superficie = pygame.Surface(
+            (ancho, alto), pygame.SRCALPHA if transparente else 0
+        )
+        inicio = [aleatorio.randrange(256) for _ in range(3)]
+        fin = [aleatorio.randrange(256) for _ in range(3)]
+        for y in range(alto):
+            t = y / max(1, alto - 1)
+            color = [int(a + (b - a) * t) for a, b in zip(inicio, fin)]
+            if transparente:
+                # Silueta redondeada sobre fondo transparente.
+                dx = int(ancho / 2 * (1 - (2 * t - 1) ** 2) ** 0.5)
+                pygame.draw.line(
+                    superficie, color, (ancho // 2 - dx, y), (ancho // 2 + dx, y)
+                )
+            else:
+                pygame.draw.line(superficie, color, (0, y), (ancho, y))
+        # Muchas figuras chicas dan el detalle que pesa al comprimir; la
+        # PNG, sin pérdida, necesita más para llegar al tamaño real.
+        figuras = (
+            aleatorio.randint(150, 350) if transparente else aleatorio.randint(40, 120)
+        )
+        for _ in range(figuras):
+            color = [aleatorio.randrange(256) for _ in range(3)]
+            x, y = aleatorio.randrange(ancho), aleatorio.randrange(alto)
+            lado = aleatorio.randint(2, max(3, ancho // 4))
+            if aleatorio.random() < 0.5:
+                pygame.draw.circle(superficie, color, (x, y), lado // 2)
+            else:
+                pygame.draw.line(
+                    superficie,
+                    color,
+                    (x, y),
+                    (x + lado, y + aleatorio.randint(-lado, lado)),
+                )
+        ruta = os.path.join(directorio, nombre)
+        pygame.image.save(superficie, ruta)
+        escritos += os.path.getsize(ruta)
+    return escritos
+
+
+def generar_imagenes(
+    directorio, cantidad, perfil=None, semilla=0, procesos=None
+) -> list:
+    """Genera imágenes de relleno en `directorio` en un pool de procesos.
+
+    Args:
+        directorio: Carpeta de salida (se crea si no existe).
+        cantidad: Cantidad de imágenes.
+        perfil: Lista de (extensión, ancho, alto) de la que se sortean
+        el formato y la resolución, o None para usar la de `assets/img`.
+        semilla: Semilla del generador aleatorio.
+        procesos: Cantidad de procesos del pool (None: uno por núcleo).
+
+    Returns:
+        list: Nombres de archivo generados, en orden.
+    """
+    os.makedirs(directorio, exist_ok=True)
+    if perfil is None:
+        perfil = perfil_imagenes()
+    imagenes = nombres_imagenes(cantidad, perfil, semilla)
+    bloque = 256
+    tareas = [
+        (directorio, imagenes[i : i + bloque], semilla)
+        for i in range(0, len(imagenes), bloque)
+    ]
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        for _ in pool.map(dibujar_imagenes, tareas):
+            pass
+    return [nombre for nombre, _, _ in imagenes]
+
+
+def contar_categorias(ruta) -> int:
+    """Devuelve la cantidad de categorías distintas de un catálogo CSV."""
+    with open(ruta, encoding="utf-8", newline="") as archivo:
+        return len({fila["categoria"] for fila in csv.DictReader(archivo)})
+
+
+def generar_catalogo(
+    ruta, categorias, niveles, elementos=4, imagenes=None, semilla=0, en_orden=False
+):
+    """Escribe un catálogo sintético en formato CSV.
+
+    Las filas se escriben a medida que se generan, sin mantener el
+    catálogo completo en memoria.
+
+    Args:
+        ruta: Ruta del CSV a generar.
+        categorias: Cantidad de categorías.
+        niveles: Cantidad de niveles de dificultad (1..niveles).
+        elementos: Cantidad de elementos por categoría.
+        imagenes: Lista de nombres de imagen a asignar, o None para no
+        asignar imágenes.
+        semilla: Semilla del generador aleatorio.
+        en_orden: Si es True, la fila n recibe la imagen n (en forma
+        cíclica) en lugar de una al azar, para que cada elemento tenga
+        su propia imagen.
+
+    Returns:
+        int: Cantidad de filas escritas.
+    """
+    aleatorio = random.Random(semilla)
+    filas = 0
+    with open(ruta, "w", encoding="utf-8", newline="") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(["categoria", "elemento", "imagen", "dificultad"])
+        for c in range(categorias):
+            dificultad = c % niveles + 1
+            for e in range(elementos):
+                imagen = ""
+                if imagenes and en_orden:
+                    imagen = imagenes[filas % len(imagenes)]
+                elif imagenes:
+                    imagen = imagenes[aleatorio.randrange(len(imagenes))]
+                escritor.writerow(
+                    [f"Categoría {c:06d}", f"Elemento {c:06d}-{e}", imagen, dificultad]
+                )
+                filas += 1
+    return filas
+
+
+def main(argumentos=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--categorias", type=int, default=25000)
+    parser.add_argument(
+        "--escala",
+        type=float,
+        help="Múltiplo de las categorías de data/datos.csv (reemplaza --categorias).",
+    )
+    parser.add_argument("--niveles", type=int, default=5)
+    parser.add_argument("--elementos", type=int, default=4)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--sin-imagenes", action="store_true")
+    parser.add_argument("--generar-imagenes", action="store_true")
+    parser.add_argument("--dir-imagenes", help="Carpeta para las imágenes generadas.")
+    parser.add_argument("--cantidad-imagenes", type=int)
+    parser.add_argument("--procesos", type=int, default=None)
+    parser.add_argument("--salida", required=True)
+    args = parser.parse_args(argumentos)
+
+    categorias = args.categorias
+    if args.escala is not None:
+        categorias = max(1, round(contar_categorias("data/datos.csv") * args.escala))
+
+    imagenes = None
+    if args.generar_imagenes:
+        directorio = args.dir_imagenes or tempfile.mkdtemp(prefix="agrupados_img_")
+        cantidad = args.cantidad_imagenes or categorias * args.elementos
+        inicio = time.perf_counter()
+        imagenes = generar_imagenes(
+            directorio, cantidad, semilla=args.semilla, procesos=args.procesos
+        )
+        print(
+            f"{len(imagenes)} imágenes generadas en {directorio}"
+            f" en {time.perf_counter() - inicio:.1f} s"
+        )
+    elif not args.sin_imagenes:
+        imagenes = imagenes_disponibles()
+    filas = generar_catalogo(
+        args.salida,
+        categorias,
+        args.niveles,
+        args.elementos,
+        imagenes,
+        args.semilla,
+        en_orden=args.generar_imagenes,
+    )
+    print(f"{filas} filas escritas en {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Consultas y mantenimiento del historial de resultados en segmentos.
+
+Uso:
+    python -m herramientas.historial_resultados ranking [--dia hoy] \
+        [--desde F] [--hasta F] [--cantidad 10]
+    python -m herramientas.historial_resultados resumen [--semana] \
+        [--desde F] [--hasta F]
+    python -m herramientas.historial_resultados segmentos
+    python -m herramientas.historial_resultados archivar --dias 30
+    python -m herramientas.historial_resultados migrar [--json RUTA]
+
+Las fechas son del tipo 2026-02-03 (o 2026-02 para un mes); `--hasta`
+es exclusiva. `ranking --dia hoy` da los mejores puntajes del día y
+`resumen --semana` la tasa de victorias de los últimos 7 días, leyendo
+solo los segmentos necesarios.
+"""
+import argparse
+from datetime import date, timedelta
+
+from modules.config import DIR_RESULTADOS, PERIODO_RESULTADOS, RUTA_RESULTADOS
+from modules.historial import HistorialResultados
+
+
+def _ventana(args):
+    """Devuelve (desde, hasta) a partir de los argumentos de consulta."""
+    desde, hasta = args.desde, args.hasta
+    if getattr(args, "dia", None):
+        dia = date.today() if args.dia == "hoy" else date.fromisoformat(args.dia)
+        desde, hasta = dia, dia + timedelta(days=1)
+    if getattr(args, "semana", False):
+        desde, hasta = date.today() - timedelta(days=6), date.today() + timedelta(1)
+    return desde, hasta
+
+
+def main(argumentos=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dir", default=DIR_RESULTADOS)
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    ranking = comandos.add_parser("ranking")
+    ranking.add_argument("--dia", help="'hoy' o una fecha.")
+    ranking.add_argument("--cantidad", type=int, default=10)
+    resumen = comandos.add_parser("resumen")
+    resumen.add_argument("--semana", action="store_true")
+    for consulta in (ranking, resumen):
+        consulta.add_argument("--desde")
+        consulta.add_argument("--hasta")
+
+    comandos.add_parser("segmentos")
+    archivar = comandos.add_parser("archivar")
+    archivar.add_argument("--dias", type=int, required=True)
+    migrar = comandos.add_parser("migrar")
+    migrar.add_argument("--json", default=RUTA_RESULTADOS)
+    args = parser.parse_args(argumentos)
+
+    historial = HistorialResultados(args.dir, PERIODO_RESULTADOS)
+    if args.comando == "ranking":
+        desde, hasta = _ventana(args)
+        mejores = historial.mejores(desde, hasta, args.cantidad)
+        if not mejores:
+            print("No hay partidas en ese período.")
+        for posicion, resultado in enumerate(mejores, 1):
+            print(
+                f"{posicion:>3}. {resultado['nombre']:<12} {resultado['puntaje']:>6}"
+                f"  {resultado['tiempo_total']:>7.2f} s  {resultado['fecha']}"
+            )
+    elif args.comando == "resumen":
+        desde, hasta = _ventana(args)
+        datos = historial.resumen(desde, hasta)
+        print(
+            f"Partidas: {datos['partidas']}, victorias: {datos['victorias']}"
+            f" ({datos['tasa_victorias'] * 100:.1f}%),"
+            f" segmentos leídos: {datos['segmentos_leidos']}"
+        )
+    elif args.comando == "segmentos":
+        for clave in historial.segmentos_en():
+            entrada = historial.segmentos[clave]
+            print(
+                f"{clave:<10} {entrada['archivo']:<20} {entrada['partidas']:>6}"
+                f" partidas {entrada['victorias']:>6} victorias"
+                f"  mejor {entrada['mejor_puntaje']}"
+            )
+    elif args.comando == "archivar":
+        archivados = historial.archivar(date.today() - timedelta(days=args.dias))
+        print(f"{len(archivados)} segmentos archivados.")
+    elif args.comando == "migrar":
+        cantidad = historial.migrar(args.json)
+        if cantidad:
+            print(f"{cantidad} resultados importados de {args.json}.")
+        else:
+            print("No hay nada para importar (ya se migró o no existe el archivo).")
+
+
+if __name__ == "__main__":
+    main()
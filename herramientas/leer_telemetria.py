@@ -0,0 +1,156 @@
+"""Lector de los segmentos binarios de telemetría de sesión.
+
+Uso:
+    python -m herramientas.leer_telemetria [ruta ...] [--registros] \
+        [--csv data/datos.csv]
+
+Acepta archivos `.seg` o carpetas (por defecto `data/telemetria`).
+Imprime un resumen por sesión: tiempo entre clics, errores por carta,
+uso de comodines y pausas. Con `--registros` lista además cada registro
+decodificado, y con `--csv` muestra los nombres de las cartas en lugar
+de sus ids (los ids son filas del catálogo de esa sesión).
+"""
+import argparse
+import os
+import statistics
+from collections import Counter, defaultdict
+from datetime import datetime
+
+from modules import telemetria
+from modules.config import DIR_TELEMETRIA
+
+_NOMBRES_COMODINES = {codigo: nombre for nombre, codigo in telemetria.COMODINES.items()}
+
+
+def buscar_segmentos(rutas):
+    """Devuelve los archivos .seg de una lista de archivos y carpetas, ordenados."""
+    segmentos = []
+    for ruta in rutas:
+        if os.path.isdir(ruta):
+            segmentos.extend(
+                os.path.join(ruta, nombre)
+                for nombre in os.listdir(ruta)
+                if nombre.endswith(".seg")
+            )
+        else:
+            segmentos.append(ruta)
+    return sorted(segmentos)
+
+
+def leer_sesiones(segmentos) -> dict:
+    """Agrupa los registros de los segmentos por sesión.
+
+    Returns:
+        dict: Inicio de la sesión (ms desde epoch) -> lista de registros
+        (ms, tipo, nivel, c, a, b) en orden.
+    """
+    sesiones = defaultdict(list)
+    for ruta in segmentos:
+        try:
+            inicio, registros = telemetria.leer_segmento(ruta)
+        except (OSError, ValueError) as error:
+            print(f"AVISO: se omite {ruta}: {error}")
+            continue
+        sesiones[inicio].extend(registros)
+    return sesiones
+
+
+def _nombre_carta(id_carta, catalogo):
+    if catalogo is None or not 0 <= id_carta < len(catalogo):
+        return str(id_carta)
+    carta = catalogo.carta(id_carta)
+    return f"{carta['elemento']} ({carta['categoria']})"
+
+
+def describir(registro, catalogo=None) -> str:
+    """Devuelve una línea legible con un registro decodificado."""
+    ms, tipo, nivel, c, a, b = registro
+    nombre = telemetria.TIPOS.get(tipo, f"tipo {tipo}")
+    if tipo == telemetria.CLIC:
+        carta = _nombre_carta(b, catalogo) if b >= 0 else "-"
+        detalle = f"+{a} ms carta={carta}" + (" (ignorado)" if c else "")
+    elif tipo == telemetria.ERROR:
+        detalle = f"carta={_nombre_carta(a, catalogo)} posición={c}"
+    elif tipo == telemetria.ACIERTO:
+        detalle = f"{a} ms en el nivel, carta={_nombre_carta(b, catalogo)}"
+    elif tipo == telemetria.COMODIN:
+        detalle = _NOMBRES_COMODINES.get(b, str(b))
+        if a >= 0:
+            detalle += f" carta={_nombre_carta(a, catalogo)}"
+    elif tipo == telemetria.PAUSA:
+        detalle = f"{a} ms"
+    elif tipo == telemetria.NIVEL:
+        detalle = f"vidas={a}" + (" reintento" if b else "")
+    else:
+        detalle = f"a={a} b={b} c={c}"
+    return f"{ms / 1000:10.3f}s  nivel {nivel}  {nombre:<8} {detalle}"
+
+
+def resumir(registros, catalogo=None):
+    """Imprime el resumen de los registros de una sesión."""
+    por_tipo = Counter(registro[1] for registro in registros)
+    intervalos = [
+        a
+        for _, tipo, _, c, a, _ in registros
+        if tipo == telemetria.CLIC and a and not c
+    ]
+    errores = Counter(
+        a for _, tipo, _, _, a, _ in registros if tipo == telemetria.ERROR
+    )
+    comodines = Counter(
+        _NOMBRES_COMODINES.get(b, str(b))
+        for _, tipo, _, _, _, b in registros
+        if tipo == telemetria.COMODIN
+    )
+    pausas = [a for _, tipo, _, _, a, _ in registros if tipo == telemetria.PAUSA]
+
+    print(
+        "  registros: "
+        + ", ".join(
+            f"{telemetria.TIPOS.get(t, t)}={n}" for t, n in sorted(por_tipo.items())
+        )
+    )
+    if intervalos:
+        print(
+            f"  entre clics: mediana {statistics.median(intervalos):.0f} ms,"
+            f" máx {max(intervalos)} ms"
+        )
+    if errores:
+        print("  cartas más veces en grupos equivocados:")
+        for id_carta, veces in errores.most_common(5):
+            print(f"    {veces:>3}  {_nombre_carta(id_carta, catalogo)}")
+    if comodines:
+        print("  comodines: " + ", ".join(f"{n}={v}" for n, v in comodines.items()))
+    if pausas:
+        print(f"  pausas: {len(pausas)}, total {sum(pausas) / 1000:.1f} s")
+
+
+def main(argumentos=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("rutas", nargs="*", default=[DIR_TELEMETRIA])
+    parser.add_argument("--registros", action="store_true")
+    parser.add_argument("--csv", help="Catálogo para mostrar nombres de cartas.")
+    args = parser.parse_args(argumentos)
+
+    catalogo = None
+    if args.csv:
+        from modules.catalogo import Catalogo
+
+        catalogo = Catalogo.desde_csv(args.csv)
+
+    sesiones = leer_sesiones(buscar_segmentos(args.rutas))
+    if not sesiones:
+        print("No hay segmentos de telemetría.")
+    for inicio in sorted(sesiones):
+        registros = sesiones[inicio]
+        fecha = datetime.fromtimestamp(inicio / 1000).isoformat(" ", "seconds")
+        print(f"Sesión {fecha}")
+        if args.registros:
+            for registro in registros:
+                print("  " + describir(registro, catalogo))
+        resumir(registros, catalogo)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Receptor StatsD mínimo para probar la exportación de métricas.
+
+Uso:
+    python -m herramientas.receptor_statsd [--puerto 8125] [--segundos 0]
+
+Escucha datagramas UDP en formato StatsD (`nombre:valor|tipo`, una
+métrica por línea), acumula los contadores, guarda el último valor de
+los indicadores e imprime cada línea recibida. Al terminar (Ctrl+C o
+después de `--segundos`) muestra los totales. Reemplaza a un agente
+StatsD real durante las pruebas locales.
+"""
+import argparse
+import socket
+import time
+
+from modules.config import HOST_STATSD, PUERTO_STATSD
+
+
+def interpretar(linea: str):
+    """Interpreta una línea StatsD.
+
+    Returns:
+        tuple: (nombre, valor, tipo), o None si la línea no es válida.
+    """
+    nombre, separador, resto = linea.partition(":")
+    valor, _, tipo = resto.partition("|")
+    if not separador or not tipo:
+        return None
+    try:
+        return nombre, float(valor), tipo.split("|")[0]
+    except ValueError:
+        return None
+
+
+class Receptor:
+    """Acumula las métricas recibidas.
+
+    Attributes:
+        contadores: Nombre -> suma de los incrementos (`|c`).
+        indicadores: Nombre -> último valor (`|g`).
+        invalidas: Cantidad de líneas que no se pudieron interpretar.
+    """
+
+    def __init__(self):
+        self.contadores = {}
+        self.indicadores = {}
+        self.invalidas = 0
+
+    def recibir(self, datos: bytes) -> list:
+        """Procesa un datagrama y devuelve sus líneas válidas interpretadas."""
+        metricas = []
+        for linea in datos.decode("utf-8", "replace").splitlines():
+            metrica = interpretar(linea)
+            if metrica is None:
+                self.invalidas += 1
+                continue
+            nombre, valor, tipo = metrica
+            if tipo == "g":
+                self.indicadores[nombre] = valor
+            else:
+                self.contadores[nombre] = self.contadores.get(nombre, 0) + valor
+            metricas.append(metrica)
+        return metricas
+
+    def imprimir_totales(self):
+        for nombre in sorted(self.contadores):
+            print(f"{nombre:<60} {self.contadores[nombre]:>12g}")
+        for nombre in sorted(self.indicadores):
+            print(f"{nombre:<60} {self.indicadores[nombre]:>12g} (g)")
+        if self.invalidas:
+            print(f"{self.invalidas} líneas inválidas")
+
+
+def main(argumentos=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=HOST_STATSD)
+    parser.add_argument("--puerto", type=int, default=PUERTO_STATSD)
+    parser.add_argument(
+        "--segundos", type=float, default=0, help="Duración (0: hasta Ctrl+C)."
+    )
+    parser.add_argument("--silencioso", action="store_true")
+    args = parser.parse_args(argumentos)
+
+    receptor = Receptor()
+    conexion = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    conexion.bind((args.host, args.puerto))
+    conexion.settimeout(0.5)
+    fin = time.monotonic() + args.segundos if args.segundos else None
+    print(f"Escuchando en {args.host}:{args.puerto}")
+    try:
+        while fin is None or time.monotonic() < fin:
+            try:
+                datos, _ = conexion.recvfrom(65535)
+            except socket.timeout:
+                continue
+            for nombre, valor, tipo in receptor.recibir(datos):
+                if not args.silencioso:
+                    print(f"{nombre}:{valor:g}|{tipo}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        conexion.close()
+    receptor.imprimir_totales()
+
+
+if __name__ == "__main__":
+    main()
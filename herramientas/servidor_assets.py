@@ -0,0 +1,101 @@
+"""Servidor de assets decodificados en memoria compartida para kioscos.
+
+Uso:
+    python -m herramientas.servidor_assets [--csv data/datos.csv] \
+        [--imagenes assets/img] [--modos 4x4 8x8] [--procesos N]
+
+Decodifica una sola vez las imágenes del catálogo (escaladas a los
+tamaños de carta de los modos indicados) y los efectos de sonido, y los
+publica en un bloque de `multiprocessing.shared_memory` con el formato
+del paquete de assets. Cada `main.py` que se inicie en la misma máquina
+mientras el servidor está activo se conecta al bloque: las superficies
+apuntan a esas páginas compartidas y los sonidos se crean a partir de
+las muestras ya decodificadas, sin leer los archivos originales.
+
+El servidor queda esperando hasta Ctrl+C (o SIGTERM) y entonces borra
+el bloque. Las instancias ya iniciadas siguen funcionando: el sistema
+libera la memoria cuando termina la última.
+"""
+import argparse
+import os
+import signal
+import threading
+import time
+
+from modules.config import (
+    DIR_IMAGENES,
+    MEMORIA_COMPARTIDA_ASSETS,
+    MODO_TABLERO,
+    MODOS_TABLERO,
+    SONIDOS,
+)
+from modules.catalogo import Catalogo
+from modules.paquete_assets import publicar_paquete, serializar_paquete
+from herramientas.empaquetar_assets import decodificar_imagenes, tamanios_modos
+
+
+def decodificar_sonidos(rutas) -> list:
+    """Decodifica los sonidos al formato del mezclador.
+
+    Returns:
+        list: Tuplas (ruta, muestras PCM) de los sonidos que se pudieron
+        leer.
+    """
+    import pygame
+
+    sonidos = []
+    for ruta in rutas:
+        try:
+            sonidos.append((ruta, pygame.mixer.Sound(ruta).get_raw()))
+        except (pygame.error, OSError) as error:
+            print(f"AVISO: No se pudo leer {ruta}: {error}")
+    return sonidos
+
+
+def main(argumentos=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", default="data/datos.csv")
+    parser.add_argument("--imagenes", default=DIR_IMAGENES)
+    parser.add_argument("--nombre", default=MEMORIA_COMPARTIDA_ASSETS)
+    parser.add_argument("--procesos", type=int, default=None)
+    parser.add_argument(
+        "--modos", nargs="+", choices=list(MODOS_TABLERO), default=[MODO_TABLERO]
+    )
+    args = parser.parse_args(argumentos)
+
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+
+    # Mismo formato que el `pygame.mixer.init()` del juego; si una
+    # instancia abre el mezclador con otro, decodifica sus sonidos.
+    pygame.mixer.init()
+
+    inicio = time.perf_counter()
+    nombres = Catalogo.desde_csv(args.csv).imagenes()
+    tamanios = tamanios_modos(args.modos)
+    entradas = decodificar_imagenes(nombres, args.imagenes, tamanios, args.procesos)
+    sonidos = decodificar_sonidos(ruta for ruta, _ in SONIDOS.values())
+    contenido = serializar_paquete(entradas, sonidos, pygame.mixer.get_init())
+    memoria = publicar_paquete(contenido, args.nombre)
+    print(
+        f"{len(entradas)} imágenes y {len(sonidos)} sonidos publicados en"
+        f" '{args.nombre}': {len(contenido) / 2**20:.1f} MB en"
+        f" {time.perf_counter() - inicio:.2f} s"
+    )
+
+    detener = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: detener.set())
+    try:
+        while not detener.wait(1.0):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        memoria.close()
+        memoria.unlink()
+        print(f"Bloque '{args.nombre}' borrado.")
+
+
+if __name__ == "__main__":
+    main()
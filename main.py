@@ -1,47 +1,118 @@
+import os
 import pygame
 import sys
+import time
 from modules.logica_juego import Juego
-from modules.config import ANCHO, ALTO, FPS
-from modules.utilidades import cargar_sonido
+from modules.config import (
+    ANCHO,
+    ALTO,
+    PASO_LOGICA,
+    RUTA_CATALOGO,
+    RUTA_PAQUETE_ASSETS,
+    MEMORIA_COMPARTIDA_ASSETS,
+    SONIDOS,
+    PRECARGA_ANTICIPADA,
+    VIGILAR_CONTENIDO,
+    EXPORTAR_METRICAS,
+    DIAGNOSTICO_MEMORIA,
+    CUADROS_DIAGNOSTICO,
+    CAPTURA_ACTIVA,
+    DIR_CAPTURAS,
+    SEGUNDOS_CAPTURA,
+    CUADROS_CAPTURA_POR_SEGUNDO,
+    ESCALA_CAPTURA,
+    TECLA_CAPTURA,
+)
+from modules.planificador import PasoFijo
+from modules.utilidades import cargar_sonido, usar_paquete_assets
+from modules.paquete_assets import PaqueteAssets
+from modules.diagnostico import DiagnosticoMemoria
+from modules.captura import CapturaCuadros
 
 pygame.init()
 pygame.mixer.init()
 pantalla = pygame.display.set_mode((ANCHO, ALTO))
 pygame.display.set_caption("Agrupados UTN - Examen Final")
-reloj = pygame.time.Clock()
+
+try:
+    usar_paquete_assets(
+        PaqueteAssets.desde_memoria_compartida(MEMORIA_COMPARTIDA_ASSETS)
+    )
+except (OSError, ValueError):
+    if os.path.exists(RUTA_PAQUETE_ASSETS):
+        usar_paquete_assets(PaqueteAssets.abrir(RUTA_PAQUETE_ASSETS))
 
 fuente_n = pygame.font.SysFont("Silkscreen", 15, bold=True)
 fuente_g = pygame.font.SysFont("Silkscreen", 15, bold=True)
 
 sonidos = {
-    "menu_select": cargar_sonido("assets/sounds/Menu_Select.wav", 0.5),
-    "next_level": cargar_sonido("assets/sounds/next_level.mp3", 0.5),
-    "acierto": cargar_sonido("assets/sounds/pickupCoin.wav", 0.5),
-    "error": cargar_sonido("assets/sounds/wrong.mp3", 0.5),
-    "game_over": cargar_sonido("assets/sounds/you_lose.mp3", 0.5),
+    nombre: cargar_sonido(ruta, volumen) for nombre, (ruta, volumen) in SONIDOS.items()
 }
 
 pygame.mixer.music.load("assets/sounds/Soundtrack.mp3")
 pygame.mixer.music.set_volume(0.3)
 pygame.mixer.music.play(-1)
 
-juego = Juego("data/datos.csv", sonidos)
+juego = Juego(RUTA_CATALOGO, sonidos)
+juego.restaurar_instantanea()
+if PRECARGA_ANTICIPADA:
+    juego.iniciar_precarga()
+if VIGILAR_CONTENIDO:
+    juego.iniciar_vigilancia()
+if EXPORTAR_METRICAS:
+    juego.iniciar_metricas()
+
+captura = None
+if CAPTURA_ACTIVA:
+    captura = CapturaCuadros(
+        pantalla,
+        DIR_CAPTURAS,
+        SEGUNDOS_CAPTURA * CUADROS_CAPTURA_POR_SEGUNDO,
+        CUADROS_CAPTURA_POR_SEGUNDO,
+        ESCALA_CAPTURA,
+    )
+    captura.volcar_al_fallar()
+    juego.entrada.atajos[TECLA_CAPTURA] = lambda: captura.volcar(en_segundo_plano=True)
+juego.entrada.limitar_cola()
+diagnostico = DiagnosticoMemoria(CUADROS_DIAGNOSTICO) if DIAGNOSTICO_MEMORIA else None
 
+paso_fijo = PasoFijo(juego.reloj, PASO_LOGICA)
 ejecutando = True
+# Eventos que ya salieron de la cola al esperar, para el cuadro siguiente.
+pendientes = None
 while ejecutando:
-    for evento in pygame.event.get():
-        if evento.type == pygame.QUIT:
-            ejecutando = False
+    inicio_cuadro = time.perf_counter()
+    if not juego.entrada.procesar(pendientes):
+        juego.guardar_instantanea_periodica(forzar=True)
+        ejecutando = False
 
-        elif evento.type == pygame.MOUSEBUTTONDOWN:
-            juego.ejecutar_eventos(evento.pos)
+    for _ in range(paso_fijo.pasos()):
+        juego.actualizar()
 
-        elif evento.type == pygame.KEYDOWN:
-            juego.procesar_teclado(evento)
+    dibujado = juego.dibujar(pantalla, fuente_n, fuente_g)
+    if dibujado:
+        pygame.display.flip()
+    if captura is not None:
+        captura.capturar(pantalla, dibujado)
+    trabajo = (time.perf_counter() - inicio_cuadro) * 1000
+    juego.registrar_cuadro(trabajo, dibujado)
+    if diagnostico is not None:
+        diagnostico.cuadro(juego.memoria_superficies)
 
-    juego.dibujar(pantalla, fuente_n, fuente_g)
-    pygame.display.flip()
-    reloj.tick(FPS)
+    espera = juego.ritmo(trabajo, dibujado)
+    pendientes = None
+    if espera > 0:
+        # Duerme hasta el próximo cuadro de la tasa de la pantalla o
+        # hasta que llegue un evento, que se atiende enseguida. El evento
+        # ya salió de la cola: va primero, antes que los que llegaron
+        # después, para no alterar el orden de tipeo.
+        evento = pygame.event.wait(espera)
+        if evento.type != pygame.NOEVENT:
+            pendientes = [evento] + pygame.event.get()
+    juego.guardar_instantanea_periodica()
 
+juego.cerrar()
+if diagnostico is not None:
+    diagnostico.detener()
 pygame.quit()
 sys.exit()
@@ -0,0 +1,156 @@
+import os
+import sys
+import threading
+import time
+import pygame
+
+
+class CapturaCuadros:
+    """Últimos segundos de juego en un buffer circular de cuadros reducidos.
+
+    Las superficies del buffer se reservan al crearlo; `capturar` escala
+    la pantalla directamente sobre la superficie más vieja con
+    `pygame.transform.scale(..., dest_surface)`, sin reservar memoria ni
+    copiar el cuadro completo. Solo se captura hasta `por_segundo`
+    cuadros por segundo, y solo los cuadros que se dibujaron: uno
+    reutilizado es igual al anterior. Con `capacidad` cuadros el buffer
+    cubre `capacidad / por_segundo` segundos de juego.
+
+    `volcar` escribe los cuadros en orden como una secuencia de PNG,
+    para adjuntar a un reporte de error. Puede hacerlo desde un hilo
+    aparte; mientras tanto no se captura, para no pisar los cuadros que
+    se están escribiendo.
+
+    Attributes:
+        directorio: Carpeta base donde se escriben las secuencias.
+        tamanio: Tamaño de cada cuadro capturado.
+        capacidad: Cantidad de cuadros del buffer.
+        capturados: Cantidad de cuadros capturados en total.
+        volcados: Cantidad de secuencias escritas.
+    """
+
+    def __init__(
+        self,
+        pantalla,
+        directorio: str,
+        capacidad: int = 80,
+        por_segundo: int = 10,
+        escala: float = 1 / 3,
+    ):
+        """Reserva el buffer con superficies del formato de `pantalla`.
+
+        Args:
+            pantalla: Superficie principal (define formato y tamaño).
+            directorio: Carpeta base donde se escriben las secuencias.
+            capacidad: Cantidad de cuadros del buffer.
+            por_segundo: Cuadros capturados por segundo, como máximo, o
+            None para capturar todos los cuadros dibujados.
+            escala: Factor de reducción de cada cuadro.
+        """
+        ancho, alto = pantalla.get_size()
+        self.directorio = directorio
+        self.tamanio = (max(1, int(ancho * escala)), max(1, int(alto * escala)))
+        self.capacidad = max(1, capacidad)
+        self.capturados = 0
+        self.volcados = 0
+        self._periodo = 1000 / por_segundo if por_segundo else 0
+        # Mismo formato de píxeles que la pantalla, como pide `scale`.
+        self._cuadros = [
+            pygame.Surface(self.tamanio, 0, pantalla) for _ in range(self.capacidad)
+        ]
+        self._instantes = [0] * self.capacidad
+        self._ultimo = None
+        self._excepthook_anterior = None
+        self._hilo_volcado = None
+
+    def memoria(self) -> int:
+        """Bytes de píxeles reservados por el buffer."""
+        return sum(c.get_pitch() * c.get_height() for c in self._cuadros)
+
+    def capturar(self, pantalla, dibujado: bool = True):
+        """Copia `pantalla` reducida al buffer, si corresponde.
+
+        Args:
+            pantalla: Superficie principal, ya dibujada.
+            dibujado: Si el cuadro es nuevo; uno reutilizado no se copia.
+        """
+        ahora = pygame.time.get_ticks()
+        if not dibujado or (
+            self._ultimo is not None and ahora - self._ultimo < self._periodo
+        ):
+            return
+        if self._hilo_volcado is not None and self._hilo_volcado.is_alive():
+            return
+        self._ultimo = ahora
+        posicion = self.capturados % self.capacidad
+        pygame.transform.scale(pantalla, self.tamanio, self._cuadros[posicion])
+        self._instantes[posicion] = ahora
+        self.capturados += 1
+
+    def volcar(self, motivo: str = "manual", en_segundo_plano: bool = False) -> str:
+        """Escribe los cuadros del buffer, del más viejo al más nuevo.
+
+        Args:
+            motivo: Texto que se agrega al nombre de la carpeta.
+            en_segundo_plano: Si es True escribe desde un hilo aparte y
+            vuelve enseguida.
+
+        Returns:
+            str: Carpeta de la secuencia, o None si no hay cuadros o ya
+            hay un volcado en curso.
+        """
+        cantidad = min(self.capturados, self.capacidad)
+        if cantidad == 0:
+            return None
+        if self._hilo_volcado is not None:
+            if self._hilo_volcado.is_alive() and en_segundo_plano:
+                return None
+            self._hilo_volcado.join()
+        carpeta = os.path.join(
+            self.directorio, time.strftime("%Y%m%d-%H%M%S") + f"-{motivo}"
+        )
+        if en_segundo_plano:
+            self._hilo_volcado = threading.Thread(
+                target=self._escribir,
+                args=(carpeta, cantidad),
+                name="volcado-captura",
+                daemon=True,
+            )
+            self._hilo_volcado.start()
+        else:
+            self._escribir(carpeta, cantidad)
+        return carpeta
+
+    def _escribir(self, carpeta: str, cantidad: int):
+        """Escribe los últimos `cantidad` cuadros como PNG en `carpeta`."""
+        primero = self.capturados - cantidad
+        try:
+            os.makedirs(carpeta, exist_ok=True)
+            inicio = self._instantes[primero % self.capacidad]
+            for n in range(cantidad):
+                posicion = (primero + n) % self.capacidad
+                relativo = self._instantes[posicion] - inicio
+                nombre = f"cuadro_{n:04d}_{relativo:06d}ms.png"
+                pygame.image.save(
+                    self._cuadros[posicion], os.path.join(carpeta, nombre)
+                )
+        except (OSError, pygame.error) as error:
+            print(f"ERROR: No se pudo volcar la captura: {error}")
+        else:
+            self.volcados += 1
+            print(f"Captura de {cantidad} cuadros en {carpeta}")
+
+    def volcar_al_fallar(self):
+        """Vuelca el buffer si el programa termina por una excepción.
+
+        Encadena el `sys.excepthook` anterior, así que el error se sigue
+        mostrando como siempre.
+        """
+        self._excepthook_anterior = sys.excepthook
+
+        def excepthook(tipo, valor, traza):
+            if not issubclass(tipo, KeyboardInterrupt):
+                self.volcar("error")
+            self._excepthook_anterior(tipo, valor, traza)
+
+        sys.excepthook = excepthook
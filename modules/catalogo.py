@@ -0,0 +1,378 @@
+import csv
+import random
+import zlib
+from array import array
+from collections import defaultdict
+
+
+def firma_archivo(ruta: str) -> int:
+    """Calcula el CRC32 de un archivo leyéndolo en bloques.
+
+    Args:
+        ruta: Ruta al archivo.
+
+    Returns:
+        int: Firma de 32 bits del contenido.
+    """
+    firma = 0
+    with open(ruta, "rb") as archivo:
+        for bloque in iter(lambda: archivo.read(1 << 16), b""):
+            firma = zlib.crc32(bloque, firma)
+    return firma
+
+
+def firma_cartas(cartas) -> int:
+    """Calcula el CRC32 de la categoría y el elemento de varias cartas.
+
+    Args:
+        cartas: Diccionarios de carta, en un orden fijo.
+
+    Returns:
+        int: Firma de 32 bits; cambia si alguna carta cambia de fila.
+    """
+    firma = 0
+    for carta in cartas:
+        texto = f"{carta['categoria']}\0{carta['elemento']}\0"
+        firma = zlib.crc32(texto.encode("utf-8"), firma)
+    return firma
+
+
+class CambiosCatalogo:
+    """Resumen de una actualización incremental del catálogo.
+
+    Attributes:
+        agregadas: Ids de las filas nuevas.
+        retiradas: Ids de las filas que ya no están en el archivo.
+        niveles: Dificultades cuyos grupos cambiaron.
+        imagenes: Nombres de imagen de las filas agregadas o retiradas.
+        En la primera lectura, `niveles` e `imagenes` quedan vacíos.
+    """
+
+    def __init__(self):
+        self.agregadas = array("I")
+        self.retiradas = array("I")
+        self.niveles = set()
+        self.imagenes = set()
+
+    def __bool__(self):
+        return bool(self.agregadas or self.retiradas)
+
+
+class Catalogo:
+    """Catálogo de elementos del juego guardado en columnas compactas.
+
+    Cada fila del CSV ocupa unos pocos bytes: el nombre del elemento y
+    el de la imagen se guardan codificados en un único bloque de bytes,
+    y la categoría y la dificultad en arreglos numéricos. Los
+    diccionarios de carta se crean solo para las filas que se usan en
+    el tablero.
+
+    De cada fila leída del CSV se guarda además el hash de sus campos
+    (válido solo dentro del proceso), para que `actualizar_desde_csv`
+    vuelva a interpretar solo las filas que cambiaron. Las filas que
+    desaparecen del archivo se retiran de sus grupos pero conservan su
+    id.
+
+    Attributes:
+        categorias: Lista de nombres de categoría (el índice es su id).
+        grupos: Lista de tuplas (id de categoría, dificultad) que
+        agrupan las filas de una categoría dentro de un nivel.
+        firma: CRC32 de la correspondencia id -> fila (categoría,
+        elemento, imagen, dificultad y si está activa). Dos catálogos
+        con la misma firma asignan los mismos ids a las mismas filas,
+        aunque uno se haya armado con recargas en caliente y el otro
+        leyendo el archivo de una vez.
+    """
+
+    def __init__(self):
+        """Crea un catálogo vacío."""
+        self.categorias = []
+        self.grupos = []
+        self.firma = 0
+        self._firma_archivo = None
+
+        self._id_categoria = {}
+        self._id_grupo = {}
+        self._filas_grupo = []
+
+        self._grupo = array("I")
+        self._dificultad = array("H")
+        self._textos = bytearray()
+        self._offsets = array("I", [0])
+        self._huella = array("q")
+        self._activa = bytearray()
+        self._encabezado = None
+        self._indice_nivel = {}
+
+    def __len__(self):
+        return len(self._grupo)
+
+    @classmethod
+    def desde_csv(cls, ruta: str) -> "Catalogo":
+        """Lee un catálogo desde un CSV fila por fila.
+
+        El CSV debe tener las columnas `categoria` y `elemento`, y
+        opcionalmente `imagen` y `dificultad` (por defecto 1).
+
+        Args:
+            ruta: Ruta al archivo CSV.
+
+        Returns:
+            Catalogo: Catálogo con todas las filas del archivo.
+        """
+        catalogo = cls()
+        catalogo.actualizar_desde_csv(ruta)
+        return catalogo
+
+    def actualizar_desde_csv(self, ruta: str) -> CambiosCatalogo:
+        """Actualiza el catálogo con los cambios de su CSV.
+
+        Solo se interpretan las filas que no estaban en la lectura
+        anterior; las que ya no están se retiran. Si cambió el
+        encabezado se vuelven a interpretar todas. Al actualizar un
+        catálogo con filas, los cambios se aplican recién después de
+        leer todo el archivo, así que si una fila no se puede
+        interpretar el catálogo no cambia.
+
+        Args:
+            ruta: Ruta al archivo CSV.
+
+        Returns:
+            CambiosCatalogo: Filas agregadas y retiradas, y los niveles
+            e imágenes afectados. Es falso si no hubo cambios.
+
+        Raises:
+            KeyError: Si faltan las columnas obligatorias.
+            ValueError, IndexError: Si una fila nueva está mal formada.
+        """
+        cambios = CambiosCatalogo()
+        firma = firma_archivo(ruta)
+        if firma == self._firma_archivo and self._encabezado is not None:
+            return cambios
+
+        previas = len(self)
+        with open(ruta, mode="r", encoding="utf-8", newline="") as archivo:
+            lector = csv.reader(archivo)
+            encabezado = next(lector, [])
+            releer = encabezado != self._encabezado
+            conservables = defaultdict(list)
+            if not releer:
+                for fila in range(previas):
+                    if self._activa[fila]:
+                        conservables[self._huella[fila]].append(fila)
+
+            columnas = {nombre: i for i, nombre in enumerate(encabezado)}
+            i_categoria = columnas["categoria"]
+            i_elemento = columnas["elemento"]
+            i_imagen = columnas.get("imagen")
+            i_dificultad = columnas.get("dificultad")
+
+            # Sin filas previas no hay nada que proteger: se agrega directo.
+            nuevas = [] if previas else None
+            for fila in lector:
+                if not fila:
+                    continue
+                huella = hash(tuple(fila))
+                filas = conservables.get(huella)
+                if filas:
+                    filas.pop()
+                    continue
+                imagen = fila[i_imagen] if i_imagen is not None else ""
+                dificultad = int(fila[i_dificultad]) if i_dificultad is not None else 1
+                datos = (fila[i_categoria], fila[i_elemento], imagen, dificultad)
+                if nuevas is None:
+                    self._agregar_leida(huella, datos, cambios)
+                else:
+                    nuevas.append((huella, datos))
+
+        for huella, datos in nuevas or ():
+            self._agregar_leida(huella, datos, cambios)
+
+        if releer:
+            viejas = [fila for fila in range(previas) if self._activa[fila]]
+        else:
+            viejas = [fila for filas in conservables.values() for fila in filas]
+        for fila in viejas:
+            self.retirar(fila)
+        cambios.retiradas.extend(viejas)
+
+        for fila in (cambios.agregadas + cambios.retiradas) if previas else ():
+            cambios.niveles.add(self._dificultad[fila])
+            imagen = self._texto(fila * 2 + 1)
+            if imagen:
+                cambios.imagenes.add(imagen)
+        self._firma_archivo = firma
+        self._encabezado = encabezado
+        self.firma = self._calcular_firma()
+        return cambios
+
+    def _calcular_firma(self) -> int:
+        """Calcula la firma de la correspondencia id -> fila."""
+        firma = zlib.crc32(self._textos)
+        firma = zlib.crc32(self._offsets.tobytes(), firma)
+        firma = zlib.crc32(self._dificultad.tobytes(), firma)
+        firma = zlib.crc32(self._activa, firma)
+        # Por nombre: los ids de categoría dependen del orden de lectura.
+        categorias = "\0".join(
+            self.categorias[self.grupos[grupo][0]] for grupo in self._grupo
+        )
+        return zlib.crc32(categorias.encode("utf-8"), firma)
+
+    def _agregar_leida(self, huella: int, datos: tuple, cambios: CambiosCatalogo):
+        """Agrega una fila leída del CSV con su hash."""
+        fila = self.agregar(*datos)
+        self._huella[fila] = huella
+        cambios.agregadas.append(fila)
+
+    def agregar(self, categoria: str, elemento: str, imagen: str, dificultad: int):
+        """Agrega una fila al catálogo.
+
+        Args:
+            categoria: Nombre de la categoría.
+            elemento: Nombre del elemento.
+            imagen: Nombre del archivo de imagen, o "" si no tiene.
+            dificultad: Nivel en el que aparece el elemento.
+
+        Returns:
+            int: Id de la fila agregada.
+        """
+        id_categoria = self._id_categoria.get(categoria)
+        if id_categoria is None:
+            id_categoria = len(self.categorias)
+            self._id_categoria[categoria] = id_categoria
+            self.categorias.append(categoria)
+
+        clave = (id_categoria, dificultad)
+        id_grupo = self._id_grupo.get(clave)
+        if id_grupo is None:
+            id_grupo = len(self.grupos)
+            self._id_grupo[clave] = id_grupo
+            self.grupos.append(clave)
+            self._filas_grupo.append(array("I"))
+
+        fila = len(self._grupo)
+        self._grupo.append(id_grupo)
+        self._dificultad.append(dificultad)
+        self._agregar_texto(elemento)
+        self._agregar_texto(imagen)
+        self._filas_grupo[id_grupo].append(fila)
+        self._huella.append(0)
+        self._activa.append(1)
+        self._invalidar_nivel(dificultad)
+        return fila
+
+    def retirar(self, fila: int):
+        """Quita una fila de su grupo. Su id no se reutiliza.
+
+        Args:
+            fila: Id de la fila a retirar.
+        """
+        if self._activa[fila]:
+            self._activa[fila] = 0
+            filas = self._filas_grupo[self._grupo[fila]]
+            del filas[filas.index(fila)]
+            self._invalidar_nivel(self._dificultad[fila])
+
+    def _invalidar_nivel(self, nivel: int):
+        """Descarta de la caché solo los grupos calculados para `nivel`."""
+        if not self._indice_nivel:
+            return
+        for clave in [c for c in self._indice_nivel if c[0] == nivel]:
+            del self._indice_nivel[clave]
+
+    def _agregar_texto(self, texto: str):
+        """Agrega un texto al bloque de bytes y registra su fin."""
+        self._textos += texto.encode("utf-8")
+        self._offsets.append(len(self._textos))
+
+    def _texto(self, indice: int) -> str:
+        """Decodifica el texto número `indice` del bloque de bytes."""
+        inicio = self._offsets[indice]
+        fin = self._offsets[indice + 1]
+        return self._textos[inicio:fin].decode("utf-8")
+
+    def grupos_nivel(self, nivel: int, tamanio: int = 4) -> list:
+        """Devuelve los grupos de un nivel que tienen `tamanio` elementos.
+
+        El resultado se calcula una vez por nivel y queda en caché
+        hasta que se agregan o retiran filas de ese nivel.
+
+        Args:
+            nivel: Dificultad buscada.
+            tamanio: Cantidad exacta de elementos que debe tener el grupo.
+
+        Returns:
+            list: Lista de ids de grupo.
+        """
+        clave = (nivel, tamanio)
+        if clave not in self._indice_nivel:
+            self._indice_nivel[clave] = [
+                id_grupo
+                for id_grupo, (_, dificultad) in enumerate(self.grupos)
+                if dificultad == nivel and len(self._filas_grupo[id_grupo]) == tamanio
+            ]
+        return self._indice_nivel[clave]
+
+    def muestrear_grupos(self, nivel: int, cantidad: int, tamanio: int = 4) -> list:
+        """Elige al azar hasta `cantidad` grupos válidos de un nivel.
+
+        Args:
+            nivel: Dificultad buscada.
+            cantidad: Cantidad de grupos a elegir.
+            tamanio: Cantidad de elementos por grupo.
+
+        Returns:
+            list: Lista de ids de grupo, sin repetidos.
+        """
+        grupos = self.grupos_nivel(nivel, tamanio)
+        return random.sample(grupos, min(cantidad, len(grupos)))
+
+    def filas_grupo(self, id_grupo: int):
+        """Devuelve los ids de fila de un grupo."""
+        return self._filas_grupo[id_grupo]
+
+    def carta(self, fila: int) -> dict:
+        """Construye el diccionario de carta de una fila.
+
+        Args:
+            fila: Id de la fila en el catálogo.
+
+        Returns:
+            dict: Diccionario con `id`, `categoria`, `elemento`,
+            `dificultad` e `imagen` (esta última solo si la fila
+            tiene imagen).
+        """
+        id_categoria, dificultad = self.grupos[self._grupo[fila]]
+        carta = {
+            "id": fila,
+            "categoria": self.categorias[id_categoria],
+            "elemento": self._texto(fila * 2),
+            "dificultad": dificultad,
+        }
+        imagen = self._texto(fila * 2 + 1)
+        if imagen:
+            carta["imagen"] = imagen
+        return carta
+
+    def imagenes(self) -> set:
+        """Devuelve los nombres de imagen distintos usados en el catálogo."""
+        nombres = {
+            self._texto(fila * 2 + 1) for fila in range(len(self)) if self._activa[fila]
+        }
+        nombres.discard("")
+        return nombres
+
+    def cartas_grupos(self, grupos: list) -> list:
+        """Construye las cartas de todas las filas de varios grupos.
+
+        Args:
+            grupos: Lista de ids de grupo.
+
+        Returns:
+            list: Lista de diccionarios de carta.
+        """
+        return [
+            self.carta(fila)
+            for id_grupo in grupos
+            for fila in self._filas_grupo[id_grupo]
+        ]
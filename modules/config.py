@@ -1,9 +1,25 @@
+import os
 import pygame
 
-
 ANCHO = 970
 ALTO = 650
 FPS = 60
+# Paso fijo de la lógica (ms).
+PASO_LOGICA = 10
+# Cuadros por segundo de cada pantalla: (con entrada en los últimos
+# VENTANA_ACTIVIDAD ms o algo en curso, en reposo). Si la máquina no
+# llega, el tope baja solo hasta FPS_MINIMO.
+FPS_PANTALLAS = {
+    "inicio": (30, 2),
+    "jugando": (FPS, 10),
+    "transicion": (FPS, FPS),
+    "final": (30, 1),
+}
+FPS_MINIMO = 15
+VENTANA_ACTIVIDAD = 500
+# Imprime por consola cada cambio de pantalla y de cuadros por segundo.
+TRAZAR_PANTALLAS = False
+TRAZAR_FPS = False
 
 
 COLOR_FONDO = (30, 30, 30)
@@ -20,6 +36,20 @@ FILAS = 4
 COLUMNAS = 4
 TAMANIO_CARD = 110
 MARGEN = 10
+TAMANIO_GRUPO = 4
+TAMANIO_IMAGEN_CARTA = (TAMANIO_CARD - 10, TAMANIO_CARD - 10)
+TAMANIO_IMAGEN_COMPLETADA = (TAMANIO_CARD - 40, TAMANIO_CARD - 40)
+TAMANIOS_IMAGEN = (TAMANIO_IMAGEN_CARTA, TAMANIO_IMAGEN_COMPLETADA)
+
+# Modos de tablero: filas, columnas, lado de la carta y margen (px). El
+# lado se elige para que la grilla y el panel de completadas entren en
+# pantalla: (alto disponible) / (filas + 1) - margen.
+MODOS_TABLERO = {
+    "4x4": (FILAS, COLUMNAS, TAMANIO_CARD, MARGEN),
+    "6x6": (6, 6, 68, 6),
+    "8x8": (8, 8, 52, 5),
+}
+MODO_TABLERO = "4x4"
 
 
 TIEMPO_TRANSICION = 3000
@@ -32,3 +62,73 @@ COLOR_COMODIN_USADO = (100, 100, 100)
 VIDAS_INICIALES = 3
 REINICIOS_MAXIMOS = 2
 CANT_NIVELES = 5
+
+
+RUTA_INSTANTANEA = "data/partida.bin"
+INTERVALO_INSTANTANEA = 3000
+
+
+# Historial de resultados en segmentos por "dia" o "mes" con un
+# manifiesto; RUTA_RESULTADOS es el JSON acumulativo anterior, que se
+# importa una única vez. Los segmentos de más de DIAS_SIN_ARCHIVAR días
+# se comprimen al iniciar.
+DIR_RESULTADOS = "data/resultados"
+PERIODO_RESULTADOS = "dia"
+DIAS_SIN_ARCHIVAR = 30
+RUTA_RESULTADOS = "data/resultados.json"
+CAPACIDAD_COLA_RESULTADOS = 32
+RUTA_ESTADISTICAS = "data/estadisticas.json"
+# Telemetría por clic: registros del buffer circular y segundos entre volcados.
+TELEMETRIA_ACTIVA = True
+DIR_TELEMETRIA = "data/telemetria"
+CAPACIDAD_TELEMETRIA = 4096
+INTERVALO_TELEMETRIA = 5.0
+# Exportación de métricas operativas: "archivo" (texto de Prometheus) o
+# "statsd" (UDP), cada INTERVALO_METRICAS segundos.
+EXPORTAR_METRICAS = True
+DESTINO_METRICAS = "archivo"
+RUTA_METRICAS = "data/metricas.prom"
+HOST_STATSD = "127.0.0.1"
+PUERTO_STATSD = 8125
+INTERVALO_METRICAS = 10.0
+# Informe de reservas de memoria por cuadro con tracemalloc (lento: solo
+# para diagnóstico), cada CUADROS_DIAGNOSTICO cuadros.
+DIAGNOSTICO_MEMORIA = False
+CUADROS_DIAGNOSTICO = 300
+# Captura continua de los últimos segundos de juego, reducidos, para
+# reportes de error. Se vuelca a DIR_CAPTURAS con TECLA_CAPTURA o al
+# terminar por una excepción.
+CAPTURA_ACTIVA = True
+DIR_CAPTURAS = "data/capturas"
+SEGUNDOS_CAPTURA = 8
+CUADROS_CAPTURA_POR_SEGUNDO = 10
+ESCALA_CAPTURA = 1 / 3
+TECLA_CAPTURA = pygame.K_F12
+
+
+# Catálogo y carpeta de imágenes. Las variables de entorno permiten
+# jugar con un catálogo sintético de `herramientas.generar_catalogo`.
+RUTA_CATALOGO = os.environ.get("AGRUPADOS_CATALOGO", "data/datos.csv")
+# Efectos de sonido: nombre -> (ruta, volumen).
+SONIDOS = {
+    "menu_select": ("assets/sounds/Menu_Select.wav", 0.5),
+    "next_level": ("assets/sounds/next_level.mp3", 0.5),
+    "acierto": ("assets/sounds/pickupCoin.wav", 0.5),
+    "error": ("assets/sounds/wrong.mp3", 0.5),
+    "game_over": ("assets/sounds/you_lose.mp3", 0.5),
+}
+DIR_IMAGENES = os.environ.get("AGRUPADOS_IMAGENES", os.path.join("assets", "img"))
+RUTA_PAQUETE_ASSETS = "data/assets.pack"
+# Varias instancias en la misma máquina: si `herramientas.servidor_assets`
+# publicó las imágenes y sonidos decodificados en este bloque de memoria
+# compartida, el juego los usa en lugar del paquete en disco.
+MEMORIA_COMPARTIDA_ASSETS = "agrupados_assets"
+# Bytes de píxeles máximos de la caché de imágenes escaladas (LRU).
+LIMITE_CACHE_IMAGENES = 64 * 2**20
+# Precarga al iniciar de las imágenes del catálogo, hasta llenar la
+# caché. Conviene con catálogos chicos; con uno grande solo agrega
+# trabajo al inicio, porque las imágenes se descartan antes de usarse.
+PRECARGA_ANTICIPADA = False
+# Recarga en caliente del CSV y de las imágenes (segundos entre revisiones).
+VIGILAR_CONTENIDO = True
+INTERVALO_VIGILANCIA = 2.0
@@ -0,0 +1,160 @@
+import linecache
+import os
+import tracemalloc
+
+# Módulos del juego a los que se atribuyen las reservas de memoria.
+_DIRECTORIO_MODULOS = os.path.dirname(os.path.abspath(__file__))
+
+
+def _sitio(traza):
+    """Devuelve el primer cuadro de la traza que pertenece a `modules/`.
+
+    Las reservas hechas dentro de pygame o de la biblioteca estándar se
+    atribuyen así a la línea del juego que las provocó.
+    """
+    for cuadro in traza:
+        if cuadro.filename.startswith(_DIRECTORIO_MODULOS):
+            return cuadro
+    return traza[0]
+
+
+class DiagnosticoMemoria:
+    """Informe de reservas de memoria por cuadro con `tracemalloc`.
+
+    Cada `cuadros` cuadros toma una instantánea de `tracemalloc`, la
+    compara con la anterior y muestra, por línea del juego, los bytes y
+    las reservas que quedaron vivas en ese período divididos por la
+    cantidad de cuadros. En un bucle estable (mismo estado, nada nuevo
+    en pantalla) el informe debería quedar vacío.
+
+    Las instantáneas solo muestran lo que sigue vivo; lo que se reserva
+    y se libera dentro del mismo cuadro se mide aparte, como el pico de
+    memoria trazada por encima del inicio de cada cuadro. La memoria de
+    píxeles de las superficies la reserva SDL y no la ve `tracemalloc`:
+    para eso el informe acepta una estimación aparte.
+
+    Las reservas se atribuyen al primer cuadro de la pila que está en
+    `modules/`, así que lo que reserva pygame al dibujar aparece en la
+    línea de `visuales` o `logica_juego` que lo llamó.
+
+    Attributes:
+        cuadros: Cuadros entre informes.
+        informes: Cantidad de informes generados.
+    """
+
+    def __init__(self, cuadros: int = 300, profundidad: int = 8, lineas: int = 10):
+        """Inicia `tracemalloc` y toma la instantánea de referencia.
+
+        Args:
+            cuadros: Cuadros entre informes.
+            profundidad: Cuadros de pila guardados por reserva.
+            lineas: Cantidad de sitios a mostrar en cada informe.
+        """
+        self.cuadros = cuadros
+        self.lineas = lineas
+        self.informes = 0
+        self._contador = 0
+        self._transitorio = 0
+        self._transitorio_maximo = 0
+        self._iniciado_aqui = not tracemalloc.is_tracing()
+        if self._iniciado_aqui:
+            tracemalloc.start(profundidad)
+        self._anterior = self._instantanea()
+        self._base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    @staticmethod
+    def _instantanea():
+        return tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, linecache.__file__),
+                tracemalloc.Filter(False, __file__),
+            )
+        )
+
+    def cuadro(self, superficies=None):
+        """Cuenta un cuadro y, cada `cuadros` cuadros, imprime el informe.
+
+        Args:
+            superficies: Función opcional sin argumentos que devuelve un
+            diccionario nombre -> bytes de superficies retenidas. Solo
+            se llama al generar el informe.
+        """
+        actual, pico = tracemalloc.get_traced_memory()
+        transitorio = max(0, pico - self._base)
+        self._transitorio += transitorio
+        self._transitorio_maximo = max(self._transitorio_maximo, transitorio)
+        self._contador += 1
+        if self._contador >= self.cuadros:
+            print(self.informe(superficies))
+            actual = tracemalloc.get_traced_memory()[0]
+        self._base = actual
+        tracemalloc.reset_peak()
+
+    def informe(self, superficies=None) -> str:
+        """Compara con la instantánea anterior y devuelve el informe.
+
+        Args:
+            superficies: Función opcional sin argumentos que devuelve un
+            diccionario nombre -> bytes de superficies retenidas. Se
+            llama después de tomar la instantánea, para que lo que
+            reserva no figure en el informe.
+
+        Returns:
+            str: Texto del informe.
+        """
+        actual = self._instantanea()
+        cuadros = max(1, self._contador)
+        sitios = {}
+        for diferencia in actual.compare_to(self._anterior, "traceback"):
+            if diferencia.size_diff == 0 and diferencia.count_diff == 0:
+                continue
+            cuadro = _sitio(diferencia.traceback)
+            clave = (cuadro.filename, cuadro.lineno)
+            bytes_, reservas = sitios.get(clave, (0, 0))
+            sitios[clave] = (
+                bytes_ + diferencia.size_diff,
+                reservas + diferencia.count_diff,
+            )
+        transitorio = self._transitorio / cuadros
+        transitorio_maximo = self._transitorio_maximo
+        self._anterior = actual
+        self._contador = 0
+        self._transitorio = 0
+        self._transitorio_maximo = 0
+        self.informes += 1
+
+        total = sum(bytes_ for bytes_, _ in sitios.values())
+        trazado = tracemalloc.get_traced_memory()[0]
+        lineas = [
+            f"[memoria] {cuadros} cuadros: retenido {total / cuadros:+.1f} B/cuadro,"
+            f" transitorio {transitorio:.0f} B/cuadro (máx {transitorio_maximo} B),"
+            f" trazado {trazado / 1024:.0f} KiB"
+        ]
+        ordenados = sorted(sitios.items(), key=lambda s: abs(s[1][0]), reverse=True)
+        for (archivo, linea), (bytes_, reservas) in ordenados[: self.lineas]:
+            if bytes_ == 0 and reservas == 0:
+                continue
+            ruta = os.path.relpath(archivo)
+            codigo = linecache.getline(archivo, linea).strip()
+            lineas.append(
+                f"  {bytes_ / cuadros:+9.1f} B/cuadro {reservas / cuadros:+7.2f}"
+                f" reservas/cuadro  {ruta}:{linea}  {codigo}"
+            )
+        superficies = superficies() if superficies else None
+        if superficies:
+            detalle = ", ".join(
+                f"{nombre} {bytes_ / 1024:.0f} KiB"
+                for nombre, bytes_ in superficies.items()
+            )
+            total_sup = sum(superficies.values())
+            lineas.append(
+                f"  superficies retenidas: {total_sup / 1024:.0f} KiB ({detalle})"
+            )
+        return "\n".join(lineas)
+
+    def detener(self):
+        """Detiene `tracemalloc` si lo inició este diagnóstico."""
+        if self._iniciado_aqui and tracemalloc.is_tracing():
+            tracemalloc.stop()
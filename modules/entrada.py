@@ -0,0 +1,221 @@
+import time
+import pygame
+
+# Eventos que el juego usa; el resto (movimiento del mouse, rueda,
+# foco, etc.) se descarta en la cola de SDL y nunca llega a Python.
+EVENTOS_USADOS = (
+    pygame.QUIT,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.KEYDOWN,
+    pygame.TEXTINPUT,
+    pygame.WINDOWEXPOSED,
+)
+# Botones 4 y 5: la rueda del mouse, que también llega como MOUSEWHEEL.
+BOTONES_RUEDA = (4, 5)
+
+
+class Region:
+    """Zona clicable de una pantalla, asociada a un widget.
+
+    Attributes:
+        widget: Widget cuyo rectángulo (y visibilidad) define la zona.
+        accion: Función sin argumentos que atiende el clic.
+        activa: Función que indica si la zona responde, o None si
+        responde siempre. Una zona inactiva igual consume el clic.
+    """
+
+    __slots__ = ("widget", "accion", "activa")
+
+    def __init__(self, widget, accion, activa=None):
+        self.widget = widget
+        self.accion = accion
+        self.activa = activa
+
+
+class MapaRegiones:
+    """Zonas clicables de una pantalla, indexadas en una rejilla gruesa.
+
+    Cada celda de la rejilla guarda las zonas que la tocan, en orden de
+    prioridad, así que resolver un clic es una división y, como mucho,
+    un par de `collidepoint`, sin recorrer todos los botones. Las zonas
+    se registran una sola vez, con los widgets de `Interfaz`, que no
+    cambian de lugar.
+
+    Attributes:
+        celda: Lado de cada celda de la rejilla, en píxeles.
+        regiones: Zonas registradas, en orden de prioridad.
+    """
+
+    def __init__(self, ancho: int, alto: int, celda: int = 50):
+        """Crea el mapa vacío para una pantalla de `ancho` x `alto`."""
+        self.celda = celda
+        self.regiones = []
+        self._ancho = ancho
+        self._alto = alto
+        self._columnas = -(-ancho // celda)
+        self._celdas = [[] for _ in range(self._columnas * -(-alto // celda))]
+
+    def agregar(self, widget, accion, activa=None) -> Region:
+        """Registra una zona; las primeras tienen prioridad si se superponen.
+
+        Args:
+            widget: Widget cuyo rectángulo define la zona.
+            accion: Función sin argumentos que atiende el clic.
+            activa: Función que indica si la zona responde, o None.
+
+        Returns:
+            Region: La zona registrada.
+        """
+        region = Region(widget, accion, activa)
+        self.regiones.append(region)
+        rect = widget.rect.clip((0, 0, self._ancho, self._alto))
+        if rect.width and rect.height:
+            for fila in range(
+                rect.top // self.celda, (rect.bottom - 1) // self.celda + 1
+            ):
+                inicio = fila * self._columnas
+                for columna in range(
+                    rect.left // self.celda, (rect.right - 1) // self.celda + 1
+                ):
+                    self._celdas[inicio + columna].append(region)
+        return region
+
+    def en(self, pos: tuple):
+        """Devuelve la zona visible bajo `pos`, o None si no hay ninguna."""
+        x, y = pos
+        if not (0 <= x < self._ancho and 0 <= y < self._alto):
+            return None
+        for region in self._celdas[y // self.celda * self._columnas + x // self.celda]:
+            if region.widget.contiene(pos):
+                return region
+        return None
+
+
+class Entrada:
+    """Capa de entrada entre la cola de eventos de Pygame y el juego.
+
+    En cada cuadro vacía la cola de una vez y la resume antes de
+    despachar: las exposiciones de ventana repetidas se reducen a una
+    sola invalidación, el texto de varios TEXTINPUT seguidos llega a la
+    pantalla como una única cadena y los clics de la rueda se
+    descartan. Cada evento va a un único manejador (`Juego.
+    ejecutar_eventos`, `procesar_teclado` o `procesar_texto`, o un
+    atajo de teclado), y se mide cuánto tarda por tipo de evento.
+
+    Attributes:
+        juego: Instancia de la clase Juego que recibe los eventos.
+        atajos: Diccionario tecla -> función sin argumentos, atendido
+        antes que la pantalla activa.
+        coalescidos: Eventos descartados o fusionados con otro.
+        ultimo_evento: Tiempo real (ms) del último evento atendido, o
+        None.
+    """
+
+    def __init__(self, juego, atajos=None):
+        """Crea la capa de entrada.
+
+        Args:
+            juego: Instancia de la clase Juego.
+            atajos: Diccionario tecla -> función, opcional.
+        """
+        self.juego = juego
+        self.atajos = dict(atajos or {})
+        self.coalescidos = 0
+        self.ultimo_evento = None
+        self._costos = {}
+
+    @staticmethod
+    def limitar_cola():
+        """Hace que SDL descarte los eventos que el juego no usa.
+
+        Requiere la pantalla ya creada. Los eventos bloqueados no se
+        encolan, así que mover el mouse no despierta al bucle principal.
+        """
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(EVENTOS_USADOS)
+
+    def procesar(self, eventos=None) -> bool:
+        """Despacha los eventos pendientes del cuadro.
+
+        Args:
+            eventos: Eventos a procesar; por omisión vacía la cola de
+            Pygame.
+
+        Returns:
+            bool: False si llegó un QUIT (los eventos posteriores no se
+            procesan), True en otro caso.
+        """
+        if eventos is None:
+            eventos = pygame.event.get()
+        texto = []
+        expuesta = False
+        for evento in eventos:
+            tipo = evento.type
+            if tipo == pygame.TEXTINPUT:
+                if texto:
+                    self.coalescidos += 1
+                texto.append(evento.text)
+                continue
+            if texto:
+                # El texto pendiente va antes que la tecla que sigue,
+                # para que un borrado o Enter respete el orden de tipeo.
+                self._medir("texto", self.juego.procesar_texto, "".join(texto))
+                texto = []
+            if tipo == pygame.MOUSEBUTTONDOWN:
+                if evento.button in BOTONES_RUEDA:
+                    self.coalescidos += 1
+                else:
+                    self._medir("clic", self.juego.ejecutar_eventos, evento.pos)
+            elif tipo == pygame.KEYDOWN:
+                atajo = self.atajos.get(evento.key)
+                if atajo is not None:
+                    self._medir("atajo", atajo)
+                else:
+                    self._medir("tecla", self.juego.procesar_teclado, evento)
+            elif tipo == pygame.WINDOWEXPOSED:
+                if expuesta:
+                    self.coalescidos += 1
+                else:
+                    expuesta = True
+                    self._medir("exposicion", self.juego.invalidar_cuadro)
+            elif tipo == pygame.QUIT:
+                return False
+            else:
+                self.coalescidos += 1
+        if texto:
+            self._medir("texto", self.juego.procesar_texto, "".join(texto))
+        return True
+
+    def _medir(self, tipo: str, manejador, *argumentos):
+        """Llama a `manejador` y acumula su costo bajo `tipo`."""
+        self.ultimo_evento = self.juego.reloj.real()
+        inicio = time.perf_counter_ns()
+        manejador(*argumentos)
+        duracion = time.perf_counter_ns() - inicio
+        costo = self._costos.get(tipo)
+        if costo is None:
+            costo = self._costos[tipo] = [0, 0, 0]
+        costo[0] += 1
+        costo[1] += duracion
+        if duracion > costo[2]:
+            costo[2] = duracion
+
+    def estadisticas(self) -> dict:
+        """Devuelve el costo de manejo acumulado por tipo de evento.
+
+        Puede llamarse desde el hilo exportador de métricas mientras el
+        bucle principal agrega tipos nuevos, así que recorre una copia.
+
+        Returns:
+            dict: Tipo -> {"eventos", "total_ms", "promedio_us",
+            "maximo_us"}.
+        """
+        return {
+            tipo: {
+                "eventos": eventos,
+                "total_ms": total / 1e6,
+                "promedio_us": total / eventos / 1e3,
+                "maximo_us": maximo / 1e3,
+            }
+            for tipo, (eventos, total, maximo) in list(self._costos.items())
+        }
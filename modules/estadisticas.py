@@ -0,0 +1,229 @@
+import json
+import math
+import os
+import threading
+
+
+class BocetoCuantiles:
+    """Histograma logarítmico para estimar cuantiles de tiempos.
+
+    Cada cubeta cubre un rango de valores con error relativo acotado
+    por `precision`, así que la memoria es constante sin importar
+    cuántos tiempos se registren. Dos bocetos con los mismos
+    parámetros se combinan sumando sus cuentas.
+
+    Attributes:
+        cuentas: Lista con la cantidad de valores por cubeta.
+        total: Cantidad total de valores registrados.
+    """
+
+    def __init__(self, minimo=0.5, maximo=3600.0, precision=0.02):
+        """Crea un boceto vacío.
+
+        Args:
+            minimo: Menor valor distinguible; los menores caen en la
+            primera cubeta.
+            maximo: Mayor valor distinguible; los mayores caen en la
+            última cubeta.
+            precision: Error relativo máximo de cada cubeta.
+        """
+        self.minimo = minimo
+        self.maximo = maximo
+        self.precision = precision
+        self._log_gamma = math.log((1 + precision) / (1 - precision))
+        cantidad = int(math.ceil(math.log(maximo / minimo) / self._log_gamma)) + 1
+        self.cuentas = [0] * cantidad
+        self.total = 0
+        self._mayores = None
+
+    def _cubeta(self, valor: float) -> int:
+        """Calcula la cubeta de un valor."""
+        indice = 0
+        if valor > self.minimo:
+            indice = int(math.ceil(math.log(valor / self.minimo) / self._log_gamma))
+        return min(indice, len(self.cuentas) - 1)
+
+    def agregar(self, valor: float, cantidad: int = 1):
+        """Registra un valor.
+
+        Args:
+            valor: Valor a registrar.
+            cantidad: Cantidad de veces que se registra el valor.
+        """
+        self.cuentas[self._cubeta(valor)] += cantidad
+        self.total += cantidad
+        self._mayores = None
+
+    def combinar(self, otro: "BocetoCuantiles"):
+        """Suma las cuentas de otro boceto con los mismos parámetros.
+
+        Args:
+            otro: Boceto a combinar con este.
+
+        Raises:
+            ValueError: Si los bocetos tienen parámetros distintos.
+        """
+        if len(otro.cuentas) != len(self.cuentas) or otro.minimo != self.minimo:
+            raise ValueError("Los bocetos tienen parámetros distintos")
+        for i, cuenta in enumerate(otro.cuentas):
+            self.cuentas[i] += cuenta
+        self.total += otro.total
+        self._mayores = None
+
+    def fraccion_mayores(self, valor: float) -> float:
+        """Estima la fracción de valores registrados mayores a `valor`.
+
+        Los valores de la misma cubeta cuentan como la mitad. Tras la
+        primera consulta posterior a un cambio, la consulta es O(1).
+
+        Args:
+            valor: Valor a comparar.
+
+        Returns:
+            float: Fracción entre 0.0 y 1.0, o None si el boceto
+            está vacío.
+        """
+        resultado = None
+        if self.total:
+            if self._mayores is None:
+                self._mayores = [0] * len(self.cuentas)
+                acumulado = 0
+                for i in range(len(self.cuentas) - 1, -1, -1):
+                    self._mayores[i] = acumulado
+                    acumulado += self.cuentas[i]
+            indice = self._cubeta(valor)
+            mayores = self._mayores[indice] + self.cuentas[indice] / 2
+            resultado = mayores / self.total
+        return resultado
+
+    def a_dict(self) -> dict:
+        """Serializa el boceto guardando solo las cubetas no vacías."""
+        return {
+            "minimo": self.minimo,
+            "maximo": self.maximo,
+            "precision": self.precision,
+            "cubetas": {str(i): c for i, c in enumerate(self.cuentas) if c},
+        }
+
+    @classmethod
+    def desde_dict(cls, datos: dict) -> "BocetoCuantiles":
+        """Reconstruye un boceto serializado con `a_dict`."""
+        boceto = cls(datos["minimo"], datos["maximo"], datos["precision"])
+        for indice, cuenta in datos["cubetas"].items():
+            boceto.cuentas[int(indice)] = cuenta
+            boceto.total += cuenta
+        return boceto
+
+
+class EstadisticasNiveles:
+    """Agregado incremental de los tiempos por nivel de todas las partidas.
+
+    Mantiene un `BocetoCuantiles` y la cantidad de jugadores que
+    completaron cada nivel. Se actualiza con cada resultado guardado
+    desde el hilo escritor y se consulta desde el hilo principal.
+
+    Attributes:
+        bocetos: Diccionario nivel -> BocetoCuantiles.
+        partidas: Cantidad de partidas registradas.
+    """
+
+    def __init__(self):
+        """Crea un agregado vacío."""
+        self.bocetos = {}
+        self.partidas = 0
+        self._lock = threading.Lock()
+
+    def registrar(self, resultado: dict):
+        """Agrega los tiempos por nivel de un resultado.
+
+        Args:
+            resultado: Diccionario de estadísticas de una partida.
+        """
+        with self._lock:
+            self.partidas += 1
+            for i, tiempo in enumerate(resultado.get("tiempos_por_nivel", [])):
+                nivel = i + 1
+                if nivel not in self.bocetos:
+                    self.bocetos[nivel] = BocetoCuantiles()
+                self.bocetos[nivel].agregar(tiempo)
+
+    def combinar(self, otras: "EstadisticasNiveles"):
+        """Suma otro agregado a este, por ejemplo el de otro kiosco.
+
+        Args:
+            otras: Agregado a combinar con este.
+        """
+        with self._lock:
+            self.partidas += otras.partidas
+            for nivel, boceto in otras.bocetos.items():
+                if nivel not in self.bocetos:
+                    self.bocetos[nivel] = BocetoCuantiles(
+                        boceto.minimo, boceto.maximo, boceto.precision
+                    )
+                self.bocetos[nivel].combinar(boceto)
+
+    def porcentaje_mas_rapido(self, nivel: int, tiempo: float):
+        """Calcula el porcentaje de jugadores más lentos en un nivel.
+
+        Args:
+            nivel: Número de nivel.
+            tiempo: Tiempo del jugador en segundos.
+
+        Returns:
+            int: Porcentaje entre 0 y 100, o None si no hay datos
+            del nivel.
+        """
+        resultado = None
+        with self._lock:
+            boceto = self.bocetos.get(nivel)
+            if boceto is not None:
+                fraccion = boceto.fraccion_mayores(tiempo)
+                if fraccion is not None:
+                    resultado = int(round(fraccion * 100))
+        return resultado
+
+    def guardar(self, ruta: str):
+        """Guarda el agregado en JSON compacto de forma atómica.
+
+        Args:
+            ruta: Ruta del archivo de estadísticas.
+        """
+        with self._lock:
+            datos = {
+                "partidas": self.partidas,
+                "niveles": {str(n): b.a_dict() for n, b in self.bocetos.items()},
+            }
+        temporal = ruta + ".tmp"
+        with open(temporal, "w") as archivo:
+            json.dump(datos, archivo, separators=(",", ":"))
+        os.replace(temporal, ruta)
+
+    @classmethod
+    def cargar(cls, ruta: str, historial=None) -> "EstadisticasNiveles":
+        """Carga el agregado guardado o lo reconstruye desde el historial.
+
+        Si el archivo de estadísticas no existe o es inválido y se
+        indica `historial`, se recorre el historial completo una única
+        vez y se guarda el agregado resultante.
+
+        Args:
+            ruta: Ruta del archivo de estadísticas.
+            historial: `HistorialResultados` con todos los resultados.
+
+        Returns:
+            EstadisticasNiveles: Agregado cargado.
+        """
+        estadisticas = cls()
+        try:
+            with open(ruta, "r") as archivo:
+                datos = json.load(archivo)
+            estadisticas.partidas = datos["partidas"]
+            for nivel, boceto in datos["niveles"].items():
+                estadisticas.bocetos[int(nivel)] = BocetoCuantiles.desde_dict(boceto)
+        except (OSError, ValueError, KeyError):
+            estadisticas = cls()
+            if historial is not None and historial.segmentos:
+                for resultado in historial.leer():
+                    estadisticas.registrar(resultado)
+                estadisticas.guardar(ruta)
+        return estadisticas
@@ -0,0 +1,345 @@
+import time
+from collections import deque
+import pygame
+from modules.config import ALTO, ANCHO, COLOR_FONDO, VIDAS_INICIALES
+from modules.entrada import MapaRegiones
+from modules.interfaz import COLOR_FONDO_FINAL
+from modules.visuales import dibujar_tablero, dibujar_transicion, limpiar_sprites_cartas
+
+# Pantallas a las que se puede pasar desde cada pantalla.
+TRANSICIONES = {
+    "inicio": ("jugando",),
+    "jugando": ("transicion", "final"),
+    "transicion": ("jugando",),
+    "final": ("inicio",),
+}
+
+
+class Estado:
+    """Pantalla del juego dentro de la máquina de estados.
+
+    Cada pantalla implementa su actualización, su dibujo y su manejo de
+    entrada. `entrar` y `salir` se llaman en cada cambio de pantalla,
+    para armar y liberar lo que la pantalla necesita solo mientras está
+    activa. Los clics se resuelven con el mapa de regiones que arma
+    `crear_regiones`: cada clic va a una sola acción, o a `clic_fondo`
+    si no cae en ninguna zona.
+
+    Attributes:
+        nombre: Nombre de la pantalla.
+        juego: Instancia de la clase Juego.
+        regiones: MapaRegiones con las zonas clicables de la pantalla.
+    """
+
+    nombre = ""
+
+    def __init__(self, juego):
+        self.juego = juego
+        self.regiones = MapaRegiones(ANCHO, ALTO)
+        self.crear_regiones()
+
+    def crear_regiones(self):
+        """Registra en `regiones` las zonas clicables de la pantalla."""
+
+    def entrar(self, anterior: str):
+        """Se llama al activar la pantalla, con el nombre de la anterior."""
+
+    def salir(self, siguiente: str):
+        """Se llama al dejar la pantalla, con el nombre de la siguiente."""
+
+    def actualizar(self):
+        """Avanza la lógica propia de la pantalla un paso fijo."""
+
+    def dibujar(self, pantalla, fuente, fuente_g):
+        """Dibuja la pantalla completa."""
+
+    def clic(self, pos: tuple):
+        """Procesa un clic del mouse con la zona que está bajo `pos`."""
+        region = self.regiones.en(pos)
+        if region is None:
+            self.clic_fondo(pos)
+        elif region.activa is None or region.activa():
+            region.accion()
+
+    def clic_fondo(self, pos: tuple):
+        """Procesa un clic que no cayó en ninguna zona registrada."""
+
+    def tecla(self, evento):
+        """Procesa un evento KEYDOWN."""
+
+    def texto(self, texto: str):
+        """Procesa el texto ingresado en el cuadro (eventos TEXTINPUT)."""
+
+    def animando(self) -> bool:
+        """Indica si hay algo en curso que pide la tasa de cuadros activa."""
+        return False
+
+    def clave_cuadro(self):
+        """Devuelve los datos de los que depende el cuadro dibujado.
+
+        Returns:
+            tuple: Clave que, mientras no cambie, permite reutilizar el
+            último cuadro, o None si hay que dibujar en cada cuadro.
+        """
+        return None
+
+
+class EstadoInicio(Estado):
+    """Pantalla de inicio, donde se ingresa el nombre del jugador."""
+
+    nombre = "inicio"
+
+    def dibujar(self, pantalla, fuente, fuente_g):
+        juego = self.juego
+        juego.interfaz.actualizar_inicio(
+            juego.nombre, juego.input_activo, juego._progreso_precarga()
+        )
+        pantalla.fill(COLOR_FONDO)
+        juego.interfaz.inicio.dibujar(pantalla)
+
+    def crear_regiones(self):
+        interfaz = self.juego.interfaz
+        self.regiones.agregar(interfaz.campo_nombre, self._activar_campo)
+        self.regiones.agregar(interfaz.btn_jugar, self._jugar)
+
+    def _activar_campo(self):
+        self.juego.input_activo = True
+
+    def _jugar(self):
+        """Empieza la partida si ya hay un nombre."""
+        juego = self.juego
+        juego.input_activo = False
+        if juego.nombre:
+            juego._reproducir_sonido("menu_select")
+            juego.cambiar_pantalla("inicio", "jugando")
+
+    def clic_fondo(self, pos: tuple):
+        """Un clic fuera del campo de texto lo desactiva."""
+        self.juego.input_activo = False
+
+    def tecla(self, evento):
+        """Borra el último carácter del nombre o lo confirma con Enter."""
+        juego = self.juego
+        if juego.input_activo:
+            if evento.key == pygame.K_BACKSPACE:
+                juego.nombre = juego.nombre[:-1]
+            elif evento.key == pygame.K_RETURN and juego.nombre:
+                juego.cambiar_pantalla("inicio", "jugando")
+
+    def texto(self, texto: str):
+        """Agrega al nombre del jugador el texto ingresado, limitado a 12
+        caracteres.
+        """
+        juego = self.juego
+        if juego.input_activo:
+            juego.nombre = (juego.nombre + texto)[:12]
+
+    def animando(self) -> bool:
+        """La barra de precarga avanza mientras se dibuja."""
+        return self.juego._progreso_precarga() is not None
+
+    def clave_cuadro(self):
+        juego = self.juego
+        return (
+            self.nombre,
+            juego.nombre,
+            juego.input_activo,
+            juego._progreso_precarga(),
+        )
+
+
+class EstadoJugando(Estado):
+    """Pantalla de juego con tablero, comodines, HUD y controles."""
+
+    nombre = "jugando"
+
+    def salir(self, siguiente: str):
+        """Libera los sprites de las cartas del nivel que terminó."""
+        limpiar_sprites_cartas()
+
+    def actualizar(self):
+        """Reinicia el nivel o termina la partida si se acabaron las vidas,
+        una vez que terminó de mostrarse el error.
+        """
+        juego = self.juego
+        if juego.vidas <= 0 and juego.tarea_error is None:
+            juego.invalidar_cuadro()
+            if juego.reinicios_nivel > 0:
+                juego.reinicios_nivel -= 1
+                juego.vidas = VIDAS_INICIALES
+                juego.mezclar_tablero(es_reintento=True)
+            else:
+                juego._reproducir_sonido("game_over")
+                juego.guardar_estadisticas(ganador=False)
+                juego.cambiar_pantalla("jugando", "final")
+
+    def dibujar(self, pantalla, fuente, fuente_g):
+        juego = self.juego
+        dibujar_tablero(pantalla, juego, fuente)
+        juego.interfaz.actualizar_juego(juego, juego._segundos_nivel())
+        juego.interfaz.comodines.dibujar(pantalla)
+        juego.interfaz.hud.dibujar(pantalla)
+        juego.interfaz.controles.dibujar(pantalla)
+
+    def crear_regiones(self):
+        """Registra los botones de control, que responden siempre, y los
+        comodines, que no responden durante la pausa.
+        """
+        juego = self.juego
+        interfaz = juego.interfaz
+        for boton, accion in (
+            (interfaz.btn_pausa, juego._toggle_pausa),
+            (interfaz.btn_reiniciar, juego._reiniciar_nivel),
+            (interfaz.btn_salir, juego._salir),
+            (interfaz.btn_sonido, juego._toggle_sonido),
+            (interfaz.btn_vol_menos, lambda: juego._ajustar_volumen(-0.1)),
+            (interfaz.btn_vol_mas, lambda: juego._ajustar_volumen(0.1)),
+        ):
+            self.regiones.agregar(boton, accion)
+        for boton, clave in (
+            (interfaz.btn_pista, "pista"),
+            (interfaz.btn_par, "par"),
+            (interfaz.btn_vida, "vida"),
+        ):
+            self.regiones.agregar(
+                boton,
+                lambda clave=clave: juego._pulsar_comodin(clave),
+                lambda: not juego.pausado,
+            )
+
+    def clic_fondo(self, pos: tuple):
+        """Fuera de los botones, el clic va al tablero si no hay pausa."""
+        if not self.juego.pausado:
+            self.juego._procesar_clicks_tablero(pos)
+
+    def animando(self) -> bool:
+        """Un error o una pista en pantalla tienen que terminar a tiempo."""
+        juego = self.juego
+        return juego.tarea_error is not None or juego.tarea_pista is not None
+
+    def clave_cuadro(self):
+        return ("pausa",) if self.juego.pausado else None
+
+
+class EstadoTransicion(Estado):
+    """Cuenta regresiva entre niveles."""
+
+    nombre = "transicion"
+
+    def salir(self, siguiente: str):
+        """Cancela el redibujo periódico de la cuenta regresiva."""
+        juego = self.juego
+        juego.planificador.cancelar(juego.tarea_cuenta)
+        juego.tarea_cuenta = None
+
+    def dibujar(self, pantalla, fuente, fuente_g):
+        juego = self.juego
+        dibujar_transicion(
+            pantalla, juego._segundos_transicion(), juego.nivel_actual, fuente_g
+        )
+
+    def animando(self) -> bool:
+        return True
+
+    def clave_cuadro(self):
+        juego = self.juego
+        return (self.nombre, juego.nivel_actual, juego._segundos_transicion())
+
+
+class EstadoFinal(Estado):
+    """Pantalla final con el resumen de la partida."""
+
+    nombre = "final"
+
+    def entrar(self, anterior: str):
+        """Arma el resumen una sola vez, al llegar a la pantalla."""
+        self.juego.interfaz.actualizar_final(self.juego)
+
+    def dibujar(self, pantalla, fuente, fuente_g):
+        pantalla.fill(COLOR_FONDO_FINAL)
+        self.juego.interfaz.final.dibujar(pantalla)
+
+    def crear_regiones(self):
+        juego = self.juego
+        self.regiones.agregar(juego.interfaz.btn_retry, juego._reiniciar_partida)
+        self.regiones.agregar(juego.interfaz.btn_exit, juego._salir)
+
+    def clave_cuadro(self):
+        return (self.nombre,)
+
+
+class MaquinaEstados:
+    """Máquina de estados de pantallas definida por una tabla de transiciones.
+
+    Siempre hay exactamente una pantalla activa. Los cambios que no
+    figuran en la tabla se rechazan con ValueError, y cada cambio queda
+    registrado en `historial` para poder seguir el recorrido.
+
+    Attributes:
+        actual: Estado de la pantalla activa.
+        historial: Últimos cambios como tuplas (instante en ms, de, a,
+        ms en la pantalla anterior).
+    """
+
+    def __init__(self, estados, inicial: str, transiciones=TRANSICIONES, trazar=False):
+        """Crea la máquina y activa la pantalla inicial.
+
+        Args:
+            estados: Iterable de objetos Estado.
+            inicial: Nombre de la pantalla inicial.
+            transiciones: Diccionario pantalla -> pantallas permitidas.
+            trazar: Imprime cada cambio de pantalla por consola.
+        """
+        self.estados = {estado.nombre: estado for estado in estados}
+        self.transiciones = transiciones
+        self.trazar = trazar
+        self.historial = deque(maxlen=32)
+        self.actual = self.estados[inicial]
+        self._desde = self._ahora()
+        self.actual.entrar(None)
+
+    @staticmethod
+    def _ahora() -> int:
+        return int(time.monotonic() * 1000)
+
+    @property
+    def nombre(self) -> str:
+        """Nombre de la pantalla activa."""
+        return self.actual.nombre
+
+    def cambiar(self, a: str, desde: str = None):
+        """Pasa a otra pantalla según la tabla de transiciones.
+
+        Args:
+            a: Nombre de la pantalla a activar.
+            desde: Pantalla que se espera activa, para detectar cambios
+            pedidos desde una pantalla equivocada.
+
+        Raises:
+            ValueError: Si la pantalla activa no es `desde` o la
+            transición no está permitida.
+        """
+        de = self.actual.nombre
+        if (desde is not None and desde != de) or a not in self.transiciones[de]:
+            raise ValueError(f"Transición de pantalla inválida: {desde or de} -> {a}")
+        self._activar(a)
+
+    def reiniciar(self, a: str):
+        """Activa una pantalla sin consultar la tabla de transiciones.
+
+        Se usa al restaurar una partida guardada, que puede retomarse
+        en cualquier pantalla. Igual se llaman `salir` y `entrar`.
+        """
+        self._activar(a)
+
+    def _activar(self, a: str):
+        de = self.actual.nombre
+        ahora = self._ahora()
+        duracion = ahora - self._desde
+        self.actual.salir(a)
+        self.actual = self.estados[a]
+        self.actual.entrar(de)
+        self._desde = ahora
+        self.historial.append((ahora, de, a, duracion))
+        if self.trazar:
+            print(f"[pantalla] {de} -> {a} ({duracion} ms en {de})")
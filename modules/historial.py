@@ -0,0 +1,409 @@
+import datetime
+import gzip
+import heapq
+import json
+import os
+import threading
+
+VERSION = 1
+MANIFIESTO = "indice.json"
+SIN_FECHA = "sin-fecha"
+# Largo del prefijo de `fecha` ("YYYY-MM-DD HH:MM:SS") que define cada
+# segmento según el período.
+_LARGO_CLAVE = {"dia": 10, "mes": 7}
+
+
+def _limite(valor) -> str:
+    """Normaliza un límite de ventana al formato de `fecha`.
+
+    Acepta `datetime.date`, `datetime.datetime` o un texto con el mismo
+    formato que `fecha`, completo o recortado (por ejemplo "2026-02" o
+    "2026-02-03"); como las fechas se comparan como texto, un prefijo
+    equivale al primer instante de ese período.
+    """
+    if isinstance(valor, datetime.datetime):
+        return valor.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(valor, datetime.date):
+        return valor.isoformat()
+    return str(valor)
+
+
+class HistorialResultados:
+    """Historial de resultados particionado en segmentos por día o por mes.
+
+    Cada segmento es un archivo con un resultado JSON por línea
+    (`2026-02-03.jsonl`), así que agregar un resultado no reescribe el
+    historial. El manifiesto (`indice.json`) guarda por segmento el
+    archivo, el rango de fechas y un resumen (partidas, victorias y
+    mejor puntaje): las consultas por ventana de tiempo leen solo los
+    segmentos que la tocan, y las que cubren segmentos completos se
+    responden con el resumen sin abrirlos.
+
+    Los segmentos viejos se pueden archivar comprimidos con gzip
+    (`.jsonl.gz`); se siguen leyendo igual.
+
+    Attributes:
+        directorio: Carpeta de los segmentos y del manifiesto.
+        periodo: "dia" o "mes".
+        segmentos: Diccionario clave -> entrada del manifiesto.
+        lineas_invalidas: Líneas que no se pudieron decodificar al leer
+        (por ejemplo, restos de una escritura interrumpida).
+    """
+
+    def __init__(self, directorio: str, periodo: str = "dia"):
+        """Abre el historial, leyendo el manifiesto si existe.
+
+        Args:
+            directorio: Carpeta de los segmentos y del manifiesto.
+            periodo: "dia" o "mes". Solo se usa al crear el historial;
+            uno existente conserva el período con el que se creó.
+
+        Raises:
+            ValueError: Si el período no es válido.
+        """
+        if periodo not in _LARGO_CLAVE:
+            raise ValueError(f"Período de historial desconocido: {periodo}")
+        self.directorio = directorio
+        self.periodo = periodo
+        self.segmentos = {}
+        self.migrado_desde = None
+        self.lineas_invalidas = 0
+        self._candado = threading.Lock()
+        try:
+            with open(self._ruta(MANIFIESTO), "r", encoding="utf-8") as archivo:
+                datos = json.load(archivo)
+            if datos.get("version") == VERSION:
+                self.periodo = datos["periodo"]
+                self.segmentos = datos["segmentos"]
+                self.migrado_desde = datos.get("migrado_desde")
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def _ruta(self, nombre: str) -> str:
+        return os.path.join(self.directorio, nombre)
+
+    def _clave(self, resultado: dict) -> str:
+        """Devuelve la clave del segmento de un resultado."""
+        fecha = resultado.get("fecha")
+        if not fecha:
+            return SIN_FECHA
+        return fecha[: _LARGO_CLAVE[self.periodo]]
+
+    def _guardar_manifiesto(self):
+        """Reemplaza el manifiesto de forma atómica."""
+        datos = {
+            "version": VERSION,
+            "periodo": self.periodo,
+            "migrado_desde": self.migrado_desde,
+            "segmentos": self.segmentos,
+        }
+        temporal = self._ruta(MANIFIESTO + ".tmp")
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            json.dump(datos, archivo, indent=1, sort_keys=True)
+        os.replace(temporal, self._ruta(MANIFIESTO))
+
+    def agregar(self, lote: list):
+        """Agrega resultados a sus segmentos y actualiza el manifiesto.
+
+        Args:
+            lote: Lista de diccionarios de resultados.
+        """
+        por_segmento = {}
+        for resultado in lote:
+            por_segmento.setdefault(self._clave(resultado), []).append(resultado)
+
+        os.makedirs(self.directorio, exist_ok=True)
+        with self._candado:
+            for clave, resultados in por_segmento.items():
+                entrada = self.segmentos.get(clave)
+                if entrada is None:
+                    entrada = {
+                        "archivo": f"{clave}.jsonl",
+                        "desde": None,
+                        "hasta": None,
+                        "partidas": 0,
+                        "victorias": 0,
+                        "mejor_puntaje": None,
+                    }
+                    self.segmentos[clave] = entrada
+                lineas = "".join(
+                    json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n"
+                    for r in resultados
+                ).encode("utf-8")
+                self._anexar(entrada["archivo"], lineas)
+                self._resumir(entrada, resultados)
+            self._guardar_manifiesto()
+
+    def _anexar(self, nombre: str, datos: bytes):
+        """Agrega bytes al final de un segmento, comprimido o no."""
+        ruta = self._ruta(nombre)
+        # Un segmento archivado recibe un miembro gzip nuevo al final.
+        abrir = gzip.open if nombre.endswith(".gz") else open
+        if self._falta_salto(ruta, abrir):
+            # Una escritura interrumpida dejó una línea a medias: se
+            # cierra para que los resultados nuevos queden en otra línea.
+            datos = b"\n" + datos
+        with abrir(ruta, "ab") as archivo:
+            archivo.write(datos)
+            archivo.flush()
+            if abrir is open:
+                os.fsync(archivo.fileno())
+
+    @staticmethod
+    def _falta_salto(ruta: str, abrir) -> bool:
+        """Indica si un segmento no vacío no termina en salto de línea."""
+        ultimo = b""
+        try:
+            if abrir is open:
+                with open(ruta, "rb") as archivo:
+                    if archivo.seek(0, os.SEEK_END):
+                        archivo.seek(-1, os.SEEK_END)
+                        ultimo = archivo.read(1)
+            else:
+                with gzip.open(ruta, "rb") as archivo:
+                    for bloque in iter(lambda: archivo.read(1 << 16), b""):
+                        ultimo = bloque[-1:]
+        except (OSError, EOFError):
+            return False
+        return ultimo not in (b"", b"\n")
+
+    @staticmethod
+    def _resumir(entrada: dict, resultados: list):
+        """Suma resultados al resumen de una entrada del manifiesto."""
+        for resultado in resultados:
+            fecha = resultado.get("fecha")
+            if fecha:
+                if entrada["desde"] is None or fecha < entrada["desde"]:
+                    entrada["desde"] = fecha
+                if entrada["hasta"] is None or fecha > entrada["hasta"]:
+                    entrada["hasta"] = fecha
+            entrada["partidas"] += 1
+            entrada["victorias"] += bool(resultado.get("ganador"))
+            puntaje = resultado.get("puntaje")
+            if puntaje is not None and (
+                entrada["mejor_puntaje"] is None or puntaje > entrada["mejor_puntaje"]
+            ):
+                entrada["mejor_puntaje"] = puntaje
+
+    def segmentos_en(self, desde=None, hasta=None) -> list:
+        """Devuelve las claves de los segmentos que tocan una ventana.
+
+        Args:
+            desde: Inicio de la ventana (inclusive), o None.
+            hasta: Fin de la ventana (exclusivo), o None.
+
+        Returns:
+            list: Claves en orden cronológico. Los resultados sin fecha
+            solo se incluyen si la ventana no tiene límites.
+        """
+        desde = None if desde is None else _limite(desde)
+        hasta = None if hasta is None else _limite(hasta)
+        claves = []
+        with self._candado:
+            for clave, entrada in sorted(self.segmentos.items()):
+                if entrada["desde"] is None:
+                    incluido = desde is None and hasta is None
+                else:
+                    incluido = (desde is None or entrada["hasta"] >= desde) and (
+                        hasta is None or entrada["desde"] < hasta
+                    )
+                if incluido:
+                    claves.append(clave)
+        return claves
+
+    def _cubre(self, clave: str, desde, hasta) -> bool:
+        """Indica si la ventana contiene completo un segmento."""
+        entrada = self.segmentos[clave]
+        if entrada["desde"] is None:
+            return desde is None and hasta is None
+        return (desde is None or entrada["desde"] >= desde) and (
+            hasta is None or entrada["hasta"] < hasta
+        )
+
+    def _leer_segmento(self, clave: str):
+        """Devuelve los resultados de un segmento, en orden de escritura."""
+        nombre = self.segmentos[clave]["archivo"]
+        abrir = gzip.open if nombre.endswith(".gz") else open
+        try:
+            with abrir(
+                self._ruta(nombre), "rt", encoding="utf-8", errors="replace"
+            ) as archivo:
+                contenido = archivo.read()
+        except (OSError, EOFError):
+            return []
+        # Las líneas que no se pueden decodificar (una escritura
+        # interrumpida) se saltean sin perder el resto del segmento.
+        resultados = []
+        for linea in contenido.split("\n"):
+            if not linea.strip():
+                continue
+            try:
+                resultados.append(json.loads(linea))
+            except ValueError:
+                self.lineas_invalidas += 1
+        return resultados
+
+    def _leer_clave(self, clave: str, desde=None, hasta=None):
+        """Recorre los resultados de un segmento dentro de una ventana.
+
+        Args:
+            clave: Clave del segmento.
+            desde: Inicio normalizado de la ventana, o None.
+            hasta: Fin normalizado de la ventana, o None.
+        """
+        completo = self._cubre(clave, desde, hasta)
+        for resultado in self._leer_segmento(clave):
+            fecha = resultado.get("fecha") or ""
+            if completo or (
+                (desde is None or fecha >= desde) and (hasta is None or fecha < hasta)
+            ):
+                yield resultado
+
+    def leer(self, desde=None, hasta=None):
+        """Recorre los resultados de una ventana de tiempo.
+
+        Args:
+            desde: Inicio de la ventana (inclusive), o None.
+            hasta: Fin de la ventana (exclusivo), o None.
+
+        Yields:
+            dict: Cada resultado, segmento por segmento.
+        """
+        desde = None if desde is None else _limite(desde)
+        hasta = None if hasta is None else _limite(hasta)
+        for clave in self.segmentos_en(desde, hasta):
+            yield from self._leer_clave(clave, desde, hasta)
+
+    def mejores(self, desde=None, hasta=None, cantidad: int = 10) -> list:
+        """Devuelve los mejores puntajes de una ventana.
+
+        Los segmentos cuyo mejor puntaje no supera al peor del ranking
+        ya armado no se leen.
+
+        Args:
+            desde: Inicio de la ventana (inclusive), o None.
+            hasta: Fin de la ventana (exclusivo), o None.
+            cantidad: Largo del ranking.
+
+        Returns:
+            list: Resultados ordenados por puntaje (y, a igual puntaje,
+            por menor tiempo total).
+        """
+        desde = None if desde is None else _limite(desde)
+        hasta = None if hasta is None else _limite(hasta)
+        claves = self.segmentos_en(desde, hasta)
+        # Los segmentos con mejores puntajes primero: el corte llega antes.
+        claves.sort(key=lambda c: self.segmentos[c]["mejor_puntaje"] or 0, reverse=True)
+        ranking = []
+        for clave in claves:
+            mejor = self.segmentos[clave]["mejor_puntaje"]
+            if len(ranking) >= cantidad and (mejor or 0) < ranking[0][0]:
+                break
+            for resultado in self._leer_clave(clave, desde, hasta):
+                orden = (resultado.get("puntaje", 0), -resultado.get("tiempo_total", 0))
+                elemento = (orden[0], orden[1], id(resultado), resultado)
+                if len(ranking) < cantidad:
+                    heapq.heappush(ranking, elemento)
+                elif elemento[:2] > ranking[0][:2]:
+                    heapq.heapreplace(ranking, elemento)
+        return [e[3] for e in sorted(ranking, key=lambda e: e[:2], reverse=True)]
+
+    def resumen(self, desde=None, hasta=None) -> dict:
+        """Cuenta partidas y victorias de una ventana.
+
+        Los segmentos que la ventana contiene completos se resumen con
+        el manifiesto; solo se leen los de los bordes.
+
+        Returns:
+            dict: `partidas`, `victorias`, `tasa_victorias` (0 a 1) y
+            `segmentos_leidos`.
+        """
+        desde = None if desde is None else _limite(desde)
+        hasta = None if hasta is None else _limite(hasta)
+        partidas = victorias = leidos = 0
+        for clave in self.segmentos_en(desde, hasta):
+            if self._cubre(clave, desde, hasta):
+                entrada = self.segmentos[clave]
+                partidas += entrada["partidas"]
+                victorias += entrada["victorias"]
+            else:
+                leidos += 1
+                for resultado in self._leer_clave(clave, desde, hasta):
+                    partidas += 1
+                    victorias += bool(resultado.get("ganador"))
+        return {
+            "partidas": partidas,
+            "victorias": victorias,
+            "tasa_victorias": victorias / partidas if partidas else 0.0,
+            "segmentos_leidos": leidos,
+        }
+
+    def archivar(self, antes_de) -> list:
+        """Comprime con gzip los segmentos que terminan antes de una fecha.
+
+        Args:
+            antes_de: Fecha límite (exclusiva), como en las ventanas.
+
+        Returns:
+            list: Claves de los segmentos archivados.
+        """
+        antes_de = _limite(antes_de)
+        archivados = []
+        with self._candado:
+            for clave, entrada in sorted(self.segmentos.items()):
+                nombre = entrada["archivo"]
+                if nombre.endswith(".gz") or entrada["hasta"] is None:
+                    continue
+                if entrada["hasta"] >= antes_de:
+                    continue
+                comprimido = nombre + ".gz"
+                temporal = self._ruta(comprimido + ".tmp")
+                try:
+                    with open(self._ruta(nombre), "rb") as origen:
+                        with gzip.open(temporal, "wb") as destino:
+                            destino.write(origen.read())
+                    os.replace(temporal, self._ruta(comprimido))
+                except OSError as error:
+                    print(f"ERROR: No se pudo archivar {nombre}: {error}")
+                    continue
+                entrada["archivo"] = comprimido
+                # El manifiesto se guarda antes de borrar el original: si
+                # el proceso se corta en el medio, queda un archivo de más
+                # pero ningún segmento perdido.
+                self._guardar_manifiesto()
+                os.remove(self._ruta(nombre))
+                archivados.append(clave)
+        return archivados
+
+    def migrar(self, ruta_json: str) -> int:
+        """Importa el JSON acumulativo anterior, una única vez.
+
+        El archivo original no se modifica; el manifiesto recuerda que
+        ya se migró para no volver a importarlo.
+
+        Args:
+            ruta_json: Ruta al JSON con la lista de resultados.
+
+        Returns:
+            int: Cantidad de resultados importados (0 si ya se había
+            migrado o el archivo no existe).
+        """
+        if self.migrado_desde is not None or not os.path.exists(ruta_json):
+            return 0
+        try:
+            with open(ruta_json, "r", encoding="utf-8") as archivo:
+                contenido = json.load(archivo)
+        except (OSError, ValueError):
+            contenido = []
+        if not isinstance(contenido, list):
+            contenido = [contenido]
+        self.migrado_desde = ruta_json
+        # Ordenados por fecha, para que cada segmento quede cronológico.
+        contenido.sort(key=lambda r: r.get("fecha") or "")
+        if contenido:
+            self.agregar(contenido)
+        else:
+            os.makedirs(self.directorio, exist_ok=True)
+            with self._candado:
+                self._guardar_manifiesto()
+        return len(contenido)
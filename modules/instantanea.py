@@ -0,0 +1,238 @@
+import os
+import struct
+import zlib
+
+MAGIA = b"AGRU"
+VERSION = 3
+SIN_CARTA = 0xFFFFFFFF
+
+PANTALLAS = ("inicio", "jugando", "transicion", "final")
+COMODINES = ("pista", "par", "vida")
+
+# magia, versión, pantalla, nivel, vidas, reinicios, comodines, banderas,
+# volumen, puntaje, tiempo del nivel (ms), timers restantes (ms) de error,
+# pista y transición, id de la carta con pista, firma del catálogo y
+# firma de las cartas del tablero y de los grupos completados.
+_CABECERA = struct.Struct("<4sBBBbBBBBIIHHHIII")
+_CRC = struct.Struct("<I")
+
+_BANDERA_PAUSADO = 1
+_BANDERA_SONIDO = 2
+
+
+def _empaquetar_ids(ids):
+    """Codifica una lista de ids de carta como cantidad + uint32."""
+    return struct.pack(f"<H{len(ids)}I", len(ids), *ids)
+
+
+def _desempaquetar_ids(datos, offset):
+    """Lee una lista de ids codificada con `_empaquetar_ids`.
+
+    Returns:
+        tuple: Lista de ids y nuevo offset.
+    """
+    (cantidad,) = struct.unpack_from("<H", datos, offset)
+    offset += 2
+    ids = list(struct.unpack_from(f"<{cantidad}I", datos, offset))
+    return ids, offset + cantidad * 4
+
+
+def serializar(estado):
+    """Convierte el estado de una partida en bytes compactos.
+
+    Args:
+        estado: Diccionario con el estado de la partida, según lo
+        genera `Juego.capturar_estado`.
+
+    Returns:
+        bytes: Instantánea binaria con CRC32 de verificación al final.
+    """
+    comodines = 0
+    for i, clave in enumerate(COMODINES):
+        if estado["comodines"][clave]:
+            comodines |= 1 << i
+
+    banderas = 0
+    if estado["pausado"]:
+        banderas |= _BANDERA_PAUSADO
+    if estado["sonido_activo"]:
+        banderas |= _BANDERA_SONIDO
+
+    pista = estado["pista"]
+    partes = [
+        _CABECERA.pack(
+            MAGIA,
+            VERSION,
+            PANTALLAS.index(estado["pantalla"]),
+            estado["nivel"],
+            estado["vidas"],
+            estado["reinicios"],
+            comodines,
+            banderas,
+            int(round(estado["volumen"] * 100)),
+            estado["puntaje"],
+            int(estado["tiempo_nivel"] * 1000),
+            min(estado["timer_error"], 0xFFFF),
+            min(estado["timer_pista"], 0xFFFF),
+            min(estado["timer_transicion"], 0xFFFF),
+            SIN_CARTA if pista is None else pista,
+            estado["firma"],
+            estado["firma_cartas"],
+        )
+    ]
+
+    nombre = estado["nombre"].encode("utf-8")[:255]
+    partes.append(struct.pack("<B", len(nombre)) + nombre)
+
+    tiempos = estado["tiempos_niveles"]
+    partes.append(struct.pack(f"<B{len(tiempos)}f", len(tiempos), *tiempos))
+
+    partes.append(_empaquetar_ids(estado["tablero"]))
+    partes.append(_empaquetar_ids(estado["seleccionados"]))
+
+    grupos = estado["completadas"]
+    partes.append(struct.pack("<B", len(grupos)))
+    for grupo in grupos:
+        partes.append(_empaquetar_ids(grupo))
+
+    cuerpo = b"".join(partes)
+    return cuerpo + _CRC.pack(zlib.crc32(cuerpo))
+
+
+def deserializar(datos):
+    """Reconstruye el estado de una partida a partir de una instantánea.
+
+    Args:
+        datos: Bytes generados por `serializar`.
+
+    Returns:
+        dict: Estado de la partida, o None si los datos están
+        truncados, corruptos o tienen otra versión.
+    """
+    if len(datos) < _CABECERA.size + _CRC.size:
+        return None
+
+    cuerpo = datos[: -_CRC.size]
+    (crc,) = _CRC.unpack_from(datos, len(cuerpo))
+    if zlib.crc32(cuerpo) != crc:
+        return None
+
+    (
+        magia,
+        version,
+        pantalla,
+        nivel,
+        vidas,
+        reinicios,
+        comodines,
+        banderas,
+        volumen,
+        puntaje,
+        tiempo_nivel,
+        timer_error,
+        timer_pista,
+        timer_transicion,
+        pista,
+        firma,
+        firma_cartas,
+    ) = _CABECERA.unpack_from(cuerpo, 0)
+
+    if magia != MAGIA or version != VERSION or pantalla >= len(PANTALLAS):
+        return None
+
+    try:
+        offset = _CABECERA.size
+        largo_nombre = cuerpo[offset]
+        offset += 1
+        nombre = cuerpo[offset : offset + largo_nombre].decode("utf-8")
+        offset += largo_nombre
+
+        cantidad = cuerpo[offset]
+        offset += 1
+        tiempos = list(struct.unpack_from(f"<{cantidad}f", cuerpo, offset))
+        offset += cantidad * 4
+
+        tablero, offset = _desempaquetar_ids(cuerpo, offset)
+        seleccionados, offset = _desempaquetar_ids(cuerpo, offset)
+
+        completadas = []
+        cantidad_grupos = cuerpo[offset]
+        offset += 1
+        for _ in range(cantidad_grupos):
+            grupo, offset = _desempaquetar_ids(cuerpo, offset)
+            completadas.append(grupo)
+    except (IndexError, struct.error, UnicodeDecodeError):
+        return None
+
+    return {
+        "pantalla": PANTALLAS[pantalla],
+        "nivel": nivel,
+        "vidas": vidas,
+        "reinicios": reinicios,
+        "comodines": {
+            clave: bool(comodines & (1 << i)) for i, clave in enumerate(COMODINES)
+        },
+        "pausado": bool(banderas & _BANDERA_PAUSADO),
+        "sonido_activo": bool(banderas & _BANDERA_SONIDO),
+        "volumen": volumen / 100,
+        "puntaje": puntaje,
+        "tiempo_nivel": tiempo_nivel / 1000,
+        "timer_error": timer_error,
+        "timer_pista": timer_pista,
+        "timer_transicion": timer_transicion,
+        "pista": None if pista == SIN_CARTA else pista,
+        "firma": firma,
+        "firma_cartas": firma_cartas,
+        "nombre": nombre,
+        "tiempos_niveles": tiempos,
+        "tablero": tablero,
+        "seleccionados": seleccionados,
+        "completadas": completadas,
+    }
+
+
+def guardar_instantanea(ruta, estado):
+    """Escribe la instantánea de forma atómica.
+
+    Se escribe a un archivo temporal y luego se reemplaza el destino,
+    de modo que un corte a mitad de la escritura nunca deja una
+    instantánea a medias.
+
+    Args:
+        ruta: Ruta del archivo de instantánea.
+        estado: Diccionario con el estado de la partida.
+    """
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(serializar(estado))
+    os.replace(temporal, ruta)
+
+
+def cargar_instantanea(ruta):
+    """Lee una instantánea desde disco.
+
+    Args:
+        ruta: Ruta del archivo de instantánea.
+
+    Returns:
+        dict: Estado de la partida, o None si no existe o es inválida.
+    """
+    resultado = None
+    try:
+        with open(ruta, "rb") as archivo:
+            resultado = deserializar(archivo.read())
+    except OSError:
+        resultado = None
+    return resultado
+
+
+def borrar_instantanea(ruta):
+    """Elimina la instantánea guardada, si existe.
+
+    Args:
+        ruta: Ruta del archivo de instantánea.
+    """
+    try:
+        os.remove(ruta)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,241 @@
+from modules.config import *
+from modules.widgets import (
+    BarraProgreso,
+    Boton,
+    CampoTexto,
+    Contenedor,
+    Etiqueta,
+    Overlay,
+)
+
+COLOR_FONDO_FINAL = (20, 20, 30)
+COLOR_CONTROL_VOLUMEN = (100, 100, 150)
+LINEAS_FINAL = 5 + CANT_NIVELES
+
+
+class Interfaz:
+    """Árbol de widgets de todas las pantallas del juego.
+
+    Los widgets se crean una sola vez con su geometría, de modo que la
+    lógica del juego usa estos mismos rectángulos para detectar clics.
+    En cada cuadro solo se actualizan los valores que cambian (textos,
+    colores, progreso) y cada widget se vuelve a renderizar únicamente
+    si lo que muestra cambió.
+
+    Attributes:
+        inicio: Contenedor de la pantalla de inicio.
+        hud: Contenedor del HUD superior de la pantalla de juego.
+        comodines: Contenedor de los botones de comodines.
+        controles: Contenedor de los botones de control inferiores.
+        final: Contenedor de la pantalla final.
+    """
+
+    def __init__(self):
+        """Crea todos los widgets, todavía sin fuentes asignadas."""
+        self._fuentes = None
+
+        self.titulo_inicio = Etiqueta((ANCHO // 2, 100), COLOR_CORRECTO, "center")
+        self.titulo_inicio.texto = "AGRUPADOS UTN"
+        self.campo_nombre = CampoTexto(
+            (ANCHO // 2 - 150, ALTO // 2 - 30, 300, 45),
+            COLOR_SELECCION,
+            (150, 150, 150),
+        )
+        self.btn_jugar = Boton(
+            (ANCHO // 2 - 100, ALTO // 2 + 80, 200, 50),
+            "JUGAR",
+            (50, 150, 50),
+            radio=10,
+        )
+        self.barra_carga = BarraProgreso(
+            (ANCHO // 2 - 150, ALTO - 80, 300, 16), COLOR_SELECCION
+        )
+        self.txt_carga = Etiqueta((ANCHO // 2, ALTO - 95), COLOR_TEXTO, "center")
+        self.inicio = Contenedor(
+            [
+                self.titulo_inicio,
+                Etiqueta(
+                    (ANCHO // 2, ALTO // 2 - 60),
+                    COLOR_TEXTO,
+                    "center",
+                    "INGRESE SU NOMBRE:",
+                ),
+                self.campo_nombre,
+                self.btn_jugar,
+                self.barra_carga,
+                self.txt_carga,
+            ]
+        )
+
+        self.txt_puntos = Etiqueta((20, 10), (255, 215, 0))
+        self.txt_vidas = Etiqueta((200, 10), (255, 100, 100))
+        self.txt_reinicios = Etiqueta((350, 10), (200, 200, 200))
+        self.txt_timer = Etiqueta((560, 10), (100, 200, 255))
+        self.txt_nivel = Etiqueta((720, 10), (150, 255, 150))
+        self.hud = Contenedor(
+            [
+                self.txt_puntos,
+                self.txt_vidas,
+                self.txt_reinicios,
+                self.txt_timer,
+                self.txt_nivel,
+            ]
+        )
+
+        self.btn_pista = Boton((ANCHO - 150, 100, 130, 40), "PISTA", COLOR_COMODIN)
+        self.btn_par = Boton((ANCHO - 150, 160, 130, 40), "PAR", COLOR_COMODIN)
+        self.btn_vida = Boton((ANCHO - 150, 220, 130, 40), "VIDA", COLOR_COMODIN)
+        self.comodines = Contenedor([self.btn_pista, self.btn_par, self.btn_vida])
+
+        self.btn_pausa = Boton((20, ALTO - 50, 100, 40), "PAUSA", COLOR_COMODIN)
+        self.btn_reiniciar = Boton(
+            (130, ALTO - 50, 120, 40), "REINICIAR", (150, 100, 50)
+        )
+        self.btn_salir = Boton((260, ALTO - 50, 100, 40), "SALIR", (180, 50, 50))
+        self.btn_sonido = Boton((370, ALTO - 50, 120, 40), "SONIDO ON", (100, 200, 100))
+        self.btn_vol_menos = Boton((500, ALTO - 50, 40, 40), "-", COLOR_CONTROL_VOLUMEN)
+        self.btn_vol_mas = Boton((545, ALTO - 50, 40, 40), "+", COLOR_CONTROL_VOLUMEN)
+        self.barra_volumen = BarraProgreso(
+            (595, ALTO - 45, 80, 30), (100, 200, 100), mostrar_porcentaje=True
+        )
+        self.overlay_pausa = Overlay((ANCHO, ALTO), (0, 0, 0, 150), "JUEGO EN PAUSA")
+        self.controles = Contenedor(
+            [
+                self.btn_pausa,
+                self.btn_reiniciar,
+                self.btn_salir,
+                self.btn_sonido,
+                self.btn_vol_menos,
+                self.btn_vol_mas,
+                self.barra_volumen,
+                self.overlay_pausa,
+            ]
+        )
+
+        self.titulo_final = Etiqueta((ANCHO // 2, 80), COLOR_ERROR, "center")
+        self.lineas_final = [
+            Etiqueta((ANCHO // 2, 140 + 30 * i), COLOR_TEXTO, "center")
+            for i in range(LINEAS_FINAL)
+        ]
+        self.btn_retry = Boton(
+            (ANCHO // 2 - 185, ALTO - 100, 170, 50),
+            "REINTENTAR",
+            (50, 150, 50),
+            COLOR_FONDO_FINAL,
+        )
+        self.btn_exit = Boton(
+            (ANCHO // 2 + 15, ALTO - 100, 170, 50),
+            "SALIR",
+            (150, 50, 50),
+            COLOR_FONDO_FINAL,
+        )
+        self.final = Contenedor(
+            [self.titulo_final, *self.lineas_final, self.btn_retry, self.btn_exit]
+        )
+
+    def asignar_fuentes(self, fuente, fuente_g):
+        """Asigna las fuentes a los widgets si cambiaron desde la última vez.
+
+        Args:
+            fuente: Fuente normal para textos, botones y estadísticas.
+            fuente_g: Fuente grande para los títulos.
+        """
+        if self._fuentes != (fuente, fuente_g):
+            self._fuentes = (fuente, fuente_g)
+            for contenedor in (self.inicio, self.hud, self.comodines, self.controles):
+                contenedor.asignar_fuente(fuente)
+            self.final.asignar_fuente(fuente)
+            self.titulo_inicio.fuente = fuente_g
+            self.titulo_final.fuente = fuente_g
+
+    def actualizar_inicio(self, nombre: str, activo: bool, progreso):
+        """Actualiza la pantalla de inicio.
+
+        Args:
+            nombre: Texto actual del nombre ingresado.
+            activo: Indica si el campo de texto está activo.
+            progreso: Fracción de imágenes precargadas, o None si no
+            hay una precarga en curso.
+        """
+        self.campo_nombre.configurar(nombre, activo)
+        cargando = progreso is not None
+        self.barra_carga.visible = cargando
+        self.txt_carga.visible = cargando
+        if cargando:
+            self.barra_carga.configurar(progreso)
+            self.txt_carga.configurar(f"CARGANDO IMAGENES {int(progreso * 100)}%")
+
+    def actualizar_juego(self, juego, segundos: int):
+        """Actualiza HUD, comodines y controles según el estado del juego.
+
+        Args:
+            juego: Instancia de la clase Juego con el estado actual.
+            segundos: Segundos transcurridos en el nivel.
+        """
+        self.txt_puntos.configurar(f"PUNTOS: {juego.puntaje_acumulado}")
+        self.txt_vidas.configurar(f"VIDAS: {juego.vidas}")
+        self.txt_reinicios.configurar(
+            f"REINTENTOS: {juego.reinicios_nivel}/{REINICIOS_MAXIMOS}"
+        )
+        self.txt_timer.configurar(f"TIEMPO: {segundos // 60:02d}:{segundos % 60:02d}")
+        self.txt_nivel.configurar(f"NIVEL: {juego.nivel_actual}/{CANT_NIVELES}")
+
+        for boton, clave in (
+            (self.btn_pista, "pista"),
+            (self.btn_par, "par"),
+            (self.btn_vida, "vida"),
+        ):
+            boton.configurar(
+                color=COLOR_COMODIN if juego.comodines[clave] else COLOR_COMODIN_USADO
+            )
+
+        self.btn_pausa.configurar(
+            "REANUDAR" if juego.pausado else "PAUSA",
+            (100, 200, 100) if juego.pausado else COLOR_COMODIN,
+        )
+        self.btn_sonido.configurar(
+            "SONIDO ON" if juego.sonido_activo else "SONIDO OFF",
+            (100, 200, 100) if juego.sonido_activo else (200, 100, 100),
+        )
+        self.barra_volumen.configurar(juego.volumen)
+        self.overlay_pausa.visible = juego.pausado
+
+    def actualizar_final(self, juego):
+        """Arma el resumen de la pantalla final.
+
+        Args:
+            juego: Instancia de la clase Juego con el estado final.
+        """
+        gano = juego.vidas > 0 and juego.nivel_actual >= CANT_NIVELES
+        self.titulo_final.configurar(
+            "¡FELICITACIONES!" if gano else "GAME OVER",
+            (100, 255, 100) if gano else COLOR_ERROR,
+        )
+
+        stats = [
+            f"Jugador: {juego.nombre}",
+            f"Puntaje Final: {juego.puntaje_acumulado}",
+            f"Niveles Completados: {len(juego.tiempos_niveles)} / {CANT_NIVELES}",
+            f"Vidas Restantes: {max(0, juego.vidas)}",
+        ]
+
+        if juego.tiempos_niveles:
+            tiempo_total = sum(juego.tiempos_niveles)
+            minutos = int(tiempo_total) // 60
+            segundos = int(tiempo_total) % 60
+            stats.append(f"Tiempo Total: {minutos:02d}:{segundos:02d}")
+
+            for i, tiempo in enumerate(juego.tiempos_niveles):
+                m = int(tiempo) // 60
+                s = int(tiempo) % 60
+                linea = f"  Nivel {i+1}: {m:02d}:{s:02d}"
+                if i < len(juego.comparacion_niveles):
+                    porcentaje = juego.comparacion_niveles[i]
+                    if porcentaje is not None:
+                        linea += f" - más rápido que el {porcentaje}%"
+                stats.append(linea)
+
+        for i, etiqueta in enumerate(self.lineas_final):
+            etiqueta.visible = i < len(stats)
+            if etiqueta.visible:
+                etiqueta.configurar(stats[i])
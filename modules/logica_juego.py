@@ -1,9 +1,46 @@
-import time
+import sys
 import random
+import time
+from datetime import date, timedelta
 import pygame
 from modules.config import *
 from modules.visuales import *
-from modules.utilidades import leer_csv, guardar_resultado_json
+from modules.interfaz import Interfaz
+from modules.catalogo import Catalogo, firma_cartas
+from modules.precarga import PrecargaImagenes
+from modules.utilidades import (
+    descartar_imagen,
+    directorio_imagenes,
+    estadisticas_cache_imagenes,
+)
+from modules.visuales import estadisticas_cache_sprites
+from modules.metricas import (
+    ExportadorMetricas,
+    RegistroMetricas,
+    crear_destino,
+    rss_actual,
+)
+from modules.vigilante import VigilanteContenido
+from modules.entrada import Entrada
+from modules import telemetria
+from modules.telemetria import Telemetria
+from modules.persistencia import EscritorResultados
+from modules.historial import HistorialResultados
+from modules.planificador import GobernadorCuadros, Planificador, Reloj
+from modules.estados import (
+    EstadoFinal,
+    EstadoInicio,
+    EstadoJugando,
+    EstadoTransicion,
+    MaquinaEstados,
+)
+from modules.estadisticas import EstadisticasNiveles
+from modules.tablero import DisposicionTablero, IndiceTablero
+from modules.instantanea import (
+    guardar_instantanea,
+    cargar_instantanea,
+    borrar_instantanea,
+)
 
 
 class Juego:
@@ -14,184 +51,390 @@ class Juego:
     el sistema de vidas/reintentos y la persistencia de estadísticas.
 
     Attributes:
-        estados: Diccionario con los estados de pantalla activos.
+        maquina: Máquina de estados con la pantalla activa.
+        entrada: Capa que despacha los eventos de Pygame al juego.
+        gobernador: Elige los cuadros por segundo de cada pantalla.
         nombre: Nombre del jugador ingresado en la pantalla de inicio.
         nivel_actual: Número del nivel en curso.
         vidas: Cantidad de vidas restantes del jugador.
         puntaje_acumulado: Puntos totales acumulados.
         tablero: Lista de elementos activos en el tablero.
+        disposicion: Geometría del tablero del modo elegido.
         comodines: Diccionario con la disponibilidad de cada comodín.
     """
 
-    def __init__(self, ruta_csv: str, sonidos: dict):
+    def __init__(self, ruta_csv: str, sonidos: dict, modo: str = MODO_TABLERO):
         """Inicializa una nueva instancia del juego.
 
         Args:
             ruta_csv: Ruta al archivo CSV con los elementos del juego.
             sonidos: Diccionario con los objetos de sonido precargados.
+            modo: Modo de tablero de `MODOS_TABLERO`.
         """
-        self.estados = {
-            "inicio": True,
-            "jugando": False,
-            "transicion": False,
-            "final": False,
-        }
         self.nombre = ""
-        self.input_rect = pygame.Rect(ANCHO // 2 - 150, ALTO // 2 - 30, 300, 45)
         self.input_activo = False
+        self.interfaz = Interfaz()
 
-        self.elementos_totales = leer_csv(ruta_csv)
+        self.ruta_csv = ruta_csv
+        self.catalogo = Catalogo.desde_csv(ruta_csv)
+        self.vigilante = None
         self.nivel_actual = 1
         self.vidas = VIDAS_INICIALES
         self.reinicios_nivel = REINICIOS_MAXIMOS
         self.puntaje_acumulado = 0
 
+        self.disposicion = DisposicionTablero.desde_modo(modo)
         self.tablero = []
-        self.seleccionados = []
+        self.indice = IndiceTablero()
         self.categorias_completadas = []
+        self.panel_completadas = PanelCompletadas(self.disposicion)
 
+        self.reloj = Reloj()
+        self.planificador = Planificador(self.reloj)
         self.tiempos_niveles = []
-        self.tiempo_inicio_nivel = 0
-        self.timer_error = 0
-        self.timer_transicion = 0
+        self.inicio_nivel = 0
+        self.tarea_error = None
+        self.tarea_transicion = None
+        self.tarea_cuenta = None
         self.comodines = {"pista": True, "par": True, "vida": True}
         self.pista_activa = None
-        self.timer_pista = 0
+        self.tarea_pista = None
 
-        self.pausado = False
         self.sonido_activo = True
-        self.tiempo_pausado = 0
-        self.tiempo_pausa_inicio = 0
 
         self.sonidos = sonidos
         self.volumen = 1.0
+        self.historial = HistorialResultados(DIR_RESULTADOS, PERIODO_RESULTADOS)
+        self.historial.migrar(RUTA_RESULTADOS)
+        self.historial.archivar(date.today() - timedelta(days=DIAS_SIN_ARCHIVAR))
+        self.estadisticas = EstadisticasNiveles.cargar(
+            RUTA_ESTADISTICAS, self.historial
+        )
+        self.comparacion_niveles = []
+        self.escritor = EscritorResultados(
+            self.historial,
+            CAPACIDAD_COLA_RESULTADOS,
+            al_escribir=self._actualizar_estadisticas,
+        )
+        self.telemetria = None
+        if TELEMETRIA_ACTIVA:
+            self.telemetria = Telemetria(
+                DIR_TELEMETRIA, CAPACIDAD_TELEMETRIA, INTERVALO_TELEMETRIA
+            )
+        self.entrada = Entrada(self)
+        self.gobernador = GobernadorCuadros(
+            FPS_PANTALLAS, FPS, FPS_MINIMO, trazar=TRAZAR_FPS
+        )
+        self.metricas = RegistroMetricas()
+        self.exportador = None
+        self._crear_metricas()
+        self.ultimo_clic = None
+        self.inicio_pausa = 0
+        self.ultima_instantanea = 0
+        self.precarga = None
+        self.clave_cuadro = None
+        self.maquina = MaquinaEstados(
+            [
+                EstadoInicio(self),
+                EstadoJugando(self),
+                EstadoTransicion(self),
+                EstadoFinal(self),
+            ],
+            "inicio",
+            trazar=TRAZAR_PANTALLAS,
+        )
 
         self.mezclar_tablero()
 
-    def _reproducir_sonido(self, nombre: str):
-        """Reproduce un sonido si el sonido está activo.
+    def iniciar_precarga(self):
+        """Empieza a decodificar en segundo plano las imágenes del catálogo
+        que entran en la caché de imágenes.
 
-        Args:
-            nombre: Clave del sonido en el diccionario de sonidos.
+        Debe llamarse después de crear la ventana, ya que las imágenes
+        se convierten al formato de pantalla a medida que llegan.
         """
-        if self.sonido_activo and nombre in self.sonidos:
-            self.sonidos[nombre].play()
+        self.precarga = PrecargaImagenes(
+            self.catalogo.imagenes(),
+            self.disposicion.tamanios_imagen,
+            limite_bytes=LIMITE_CACHE_IMAGENES,
+        )
 
-    def procesar_teclado(self, evento):
-        """Gestiona el ingreso de texto cuando el input está activo.
+    def iniciar_vigilancia(self, intervalo: float = INTERVALO_VIGILANCIA):
+        """Empieza a vigilar el CSV y las imágenes para recargarlos en caliente.
 
-        Permite escribir el nombre del jugador en la pantalla de inicio,
-        limitado a 12 caracteres, con soporte para borrar y confirmar.
+        Los cambios detectados se aplican en el próximo `mezclar_tablero`.
 
         Args:
-            evento: Evento de tipo KEYDOWN de Pygame.
+            intervalo: Segundos entre revisiones de los archivos.
+        """
+        self.vigilante = VigilanteContenido(
+            self.ruta_csv, directorio_imagenes(), intervalo
+        )
+
+    def _aplicar_cambios_contenido(self):
+        """Aplica los cambios de contenido detectados por el vigilante.
+
+        Actualiza solo las filas del catálogo que cambiaron y descarta
+        de la caché solo las imágenes afectadas.
         """
-        if self.estados["inicio"] and self.input_activo:
-            if evento.key == pygame.K_BACKSPACE:
-                self.nombre = self.nombre[:-1]
-            elif evento.key == pygame.K_RETURN and self.nombre:
-                self.cambiar_pantalla("inicio", "jugando")
+        csv_cambiado, imagenes = self.vigilante.pendientes()
+        if csv_cambiado:
+            try:
+                cambios = self.catalogo.actualizar_desde_csv(self.ruta_csv)
+            except (OSError, KeyError, ValueError, IndexError) as error:
+                print(f"ERROR: No se pudo recargar {self.ruta_csv}: {error}")
             else:
-                if len(self.nombre) < 12:
-                    self.nombre += evento.unicode
+                imagenes |= cambios.imagenes
+                if cambios:
+                    print(
+                        f"Catálogo actualizado: {len(cambios.agregadas)} filas"
+                        f" nuevas, {len(cambios.retiradas)} retiradas"
+                    )
+        for nombre in imagenes:
+            descartar_imagen(nombre)
+
+    def _crear_metricas(self):
+        """Define las métricas operativas del juego y su colector.
+
+        Las que se actualizan desde el juego quedan como atributos; el
+        resto las completa `_recolectar_metricas` antes de exportar.
+        """
+        m = self.metricas
+        self.metrica_cuadros = m.contador(
+            "agrupados_cuadros_total", "Cuadros del bucle principal.", ("resultado",)
+        )
+        self.metrica_tiempo_cuadro = m.histograma(
+            "agrupados_tiempo_cuadro_ms",
+            "Tiempo de trabajo por cuadro (eventos, lógica y dibujo), en ms.",
+            (1, 2, 4, 8, 16.7, 33.3, 50, 100, 250),
+        )
+        self.metrica_cambios_pantalla = m.contador(
+            "agrupados_cambios_pantalla_total", "Cambios de pantalla.", ("de", "a")
+        )
+        self.metrica_instantaneas = m.histograma(
+            "agrupados_instantanea_ms",
+            "Duración de cada guardado de instantánea, en ms.",
+            (0.5, 1, 2, 5, 10, 25, 50, 100),
+        )
+        m.indicador(
+            "agrupados_pantalla", "Pantalla activa (1 en la activa).", ("pantalla",)
+        )
+        m.indicador("agrupados_nivel", "Nivel en curso.")
+        m.contador(
+            "agrupados_cache_total",
+            "Consultas a las cachés de imágenes y de sprites.",
+            ("cache", "resultado"),
+        )
+        m.indicador("agrupados_cache_entradas", "Entradas en cada caché.", ("cache",))
+        m.indicador(
+            "agrupados_superficies_bytes",
+            "Bytes de píxeles estimados de las superficies retenidas.",
+            ("cache",),
+        )
+        m.contador("agrupados_resultados_total", "Resultados de partidas escritos.")
+        m.contador(
+            "agrupados_resultados_errores_total", "Lotes de resultados fallidos."
+        )
+        m.contador(
+            "agrupados_resultados_errores_al_escribir_total",
+            "Lotes escritos cuyo procesamiento posterior falló.",
+        )
+        m.contador(
+            "agrupados_resultados_descartados_total",
+            "Resultados descartados por cola de escritura llena.",
+        )
+        m.indicador(
+            "agrupados_resultados_latencia_ms",
+            "Latencia de escritura de resultados, en ms.",
+            ("estadistico",),
+        )
+        m.contador(
+            "agrupados_telemetria_descartados_total",
+            "Registros de telemetría descartados por buffer lleno.",
+        )
+        m.contador(
+            "agrupados_eventos_total", "Eventos de entrada atendidos.", ("tipo",)
+        )
+        m.contador(
+            "agrupados_eventos_ms_total",
+            "Tiempo acumulado atendiendo eventos de entrada, en ms.",
+            ("tipo",),
+        )
+        m.indicador(
+            "agrupados_eventos_maximo_us",
+            "Mayor tiempo de atención de un evento de entrada, en µs.",
+            ("tipo",),
+        )
+        m.contador(
+            "agrupados_eventos_coalescidos_total",
+            "Eventos de entrada descartados o fusionados con otro.",
+        )
+        m.indicador(
+            "agrupados_fps_objetivo",
+            "Cuadros por segundo elegidos para cada pantalla.",
+            ("pantalla",),
+        )
+        m.indicador(
+            "agrupados_fps_tope", "Tope de cuadros por segundo según el costo medido."
+        )
+        m.contador(
+            "agrupados_cuadros_perdidos_total",
+            "Cuadros que tardaron más que el período de su tasa.",
+            ("pantalla",),
+        )
+        m.indicador("agrupados_memoria_rss_bytes", "Memoria residente del proceso.")
+        m.agregar_colector(self._recolectar_metricas)
+
+    def _recolectar_metricas(self):
+        """Copia a las métricas los contadores que llevan otros módulos."""
+        m = self.metricas.metricas
+        for nombre in self.maquina.estados:
+            m["agrupados_pantalla"].fijar(int(nombre == self.pantalla), (nombre,))
+        m["agrupados_nivel"].fijar(self.nivel_actual)
+        for cache, datos in (
+            ("imagenes", estadisticas_cache_imagenes()),
+            ("sprites", estadisticas_cache_sprites()),
+        ):
+            m["agrupados_cache_total"].fijar(datos["aciertos"], (cache, "acierto"))
+            m["agrupados_cache_total"].fijar(datos["fallos"], (cache, "fallo"))
+            if "descartes" in datos:
+                m["agrupados_cache_total"].fijar(
+                    datos["descartes"], (cache, "descarte")
+                )
+            m["agrupados_cache_entradas"].fijar(datos["tamanio"], (cache,))
+        for cache, bytes_ in self.memoria_superficies().items():
+            m["agrupados_superficies_bytes"].fijar(bytes_, (cache,))
+        escritor = self.escritor.metricas()
+        m["agrupados_resultados_total"].fijar(escritor["registros"])
+        m["agrupados_resultados_errores_total"].fijar(escritor["errores"])
+        m["agrupados_resultados_errores_al_escribir_total"].fijar(
+            escritor["errores_al_escribir"]
+        )
+        m["agrupados_resultados_descartados_total"].fijar(escritor["descartados"])
+        for estadistico in ("ultima", "maxima", "promedio"):
+            valor = escritor[f"latencia_{estadistico}_ms"]
+            m["agrupados_resultados_latencia_ms"].fijar(valor, (estadistico,))
+        if self.telemetria is not None:
+            descartados = self.telemetria.descartados
+            m["agrupados_telemetria_descartados_total"].fijar(descartados)
+        for tipo, costo in self.entrada.estadisticas().items():
+            m["agrupados_eventos_total"].fijar(costo["eventos"], (tipo,))
+            m["agrupados_eventos_ms_total"].fijar(costo["total_ms"], (tipo,))
+            m["agrupados_eventos_maximo_us"].fijar(costo["maximo_us"], (tipo,))
+        m["agrupados_eventos_coalescidos_total"].fijar(self.entrada.coalescidos)
+        gobernador = self.gobernador.estadisticas()
+        m["agrupados_fps_tope"].fijar(gobernador["tope"])
+        for pantalla, datos in gobernador["pantallas"].items():
+            m["agrupados_fps_objetivo"].fijar(datos["fps"], (pantalla,))
+            m["agrupados_cuadros_perdidos_total"].fijar(datos["perdidos"], (pantalla,))
+        m["agrupados_memoria_rss_bytes"].fijar(rss_actual())
+
+    def memoria_superficies(self) -> dict:
+        """Devuelve los bytes de píxeles estimados que retiene cada caché
+        de superficies.
+        """
+        return {
+            "imagenes": estadisticas_cache_imagenes()["bytes"],
+            "sprites": estadisticas_cache_sprites()["bytes"],
+            "panel": self.panel_completadas.memoria(),
+        }
 
-    def ejecutar_eventos(self, pos: tuple):
-        """Maneja los clics del mouse según el estado actual del juego.
+    def iniciar_metricas(self):
+        """Empieza a exportar las métricas al destino configurado."""
+        destino = crear_destino(
+            DESTINO_METRICAS, RUTA_METRICAS, (HOST_STATSD, PUERTO_STATSD)
+        )
+        self.exportador = ExportadorMetricas(self.metricas, destino, INTERVALO_METRICAS)
 
-        Delega el procesamiento al método correspondiente según la
-        pantalla activa (inicio, jugando o final).
+    def registrar_cuadro(self, milisegundos: float, dibujado: bool):
+        """Registra un cuadro del bucle principal en las métricas.
 
         Args:
-            pos: Tupla (x, y) con la posición del clic.
+            milisegundos: Tiempo de trabajo del cuadro, sin la espera.
+            dibujado: Si el cuadro se dibujó o se reutilizó el anterior.
         """
-        if self.timer_error > 0:
-            pass
-        elif self.estados["inicio"]:
-            self._eventos_inicio(pos)
-        elif self.estados["jugando"]:
-            self._eventos_jugando(pos)
-        elif self.estados["final"]:
-            self._eventos_final(pos)
+        self.metrica_cuadros.inc(1, ("dibujado" if dibujado else "reutilizado",))
+        self.metrica_tiempo_cuadro.observar(milisegundos)
 
-    def _eventos_inicio(self, pos: tuple):
-        """Maneja los clics en la pantalla de inicio.
+    def _registrar(self, tipo: int, a: int = 0, b: int = 0, c: int = 0):
+        """Agrega un registro de telemetría del nivel actual, si está activa."""
+        if self.telemetria is not None:
+            self.telemetria.registrar(tipo, self.nivel_actual, a, b, c)
 
-        Activa/desactiva el campo de texto y detecta el clic
-        en el botón de jugar.
+    @property
+    def pantalla(self) -> str:
+        """Nombre de la pantalla activa."""
+        return self.maquina.nombre
 
-        Args:
-            pos: Tupla (x, y) con la posición del clic.
-        """
-        if self.input_rect.collidepoint(pos):
-            self.input_activo = True
-        else:
-            self.input_activo = False
+    @property
+    def pausado(self) -> bool:
+        """Indica si el juego está en pausa (el reloj de juego detenido)."""
+        return self.reloj.pausado
 
-        btn_jugar = pygame.Rect(ANCHO // 2 - 100, ALTO // 2 + 80, 200, 50)
-        if btn_jugar.collidepoint(pos) and self.nombre:
-            self._reproducir_sonido("menu_select")
-            self.cambiar_pantalla("inicio", "jugando")
+    @property
+    def seleccionados(self) -> list:
+        """Cartas seleccionadas, en orden de selección."""
+        return self.indice.seleccionados
 
-    def _eventos_jugando(self, pos: tuple):
-        """Maneja los clics durante el juego.
+    @seleccionados.setter
+    def seleccionados(self, cartas):
+        self.indice.fijar_seleccion(cartas)
 
-        Procesa primero los botones de control y, si no se presionó
-        ninguno y el juego no está pausado, procesa los clics en
-        el tablero y los comodines.
+    def _reproducir_sonido(self, nombre: str):
+        """Reproduce un sonido si el sonido está activo.
 
         Args:
-            pos: Tupla (x, y) con la posición del clic.
+            nombre: Clave del sonido en el diccionario de sonidos.
         """
-        boton_control_presionado = self._procesar_botones_control(pos)
-
-        if not boton_control_presionado and not self.pausado:
-            self._procesar_clicks_tablero(pos)
-            self._procesar_clicks_comodines(pos)
-
-    def _procesar_botones_control(self, pos: tuple) -> bool:
-        """Procesa clics en los botones de control del HUD inferior.
+        if self.sonido_activo and nombre in self.sonidos:
+            self.sonidos[nombre].play()
 
-        Incluye los botones de pausa, reiniciar, salir, sonido
-        y controles de volumen.
+    def procesar_teclado(self, evento):
+        """Delega un evento de teclado a la pantalla activa.
 
         Args:
-            pos: Tupla (x, y) con la posición del clic.
-
-        Returns:
-            bool: True si se presionó algún botón de control.
+            evento: Evento de tipo KEYDOWN de Pygame.
         """
-        btn_pausa = pygame.Rect(20, ALTO - 50, 100, 40)
-        btn_reiniciar = pygame.Rect(130, ALTO - 50, 120, 40)
-        btn_salir = pygame.Rect(260, ALTO - 50, 100, 40)
-        btn_sonido = pygame.Rect(370, ALTO - 50, 120, 40)
+        self.invalidar_cuadro()
+        self.maquina.actual.tecla(evento)
 
-        if btn_pausa.collidepoint(pos):
-            self._toggle_pausa()
-            return True
-        elif btn_reiniciar.collidepoint(pos):
-            self.mezclar_tablero()
-            self.reinicios_nivel = REINICIOS_MAXIMOS
-            return True
-        elif btn_salir.collidepoint(pos):
-            pygame.quit()
-            import sys
+    def procesar_texto(self, texto: str):
+        """Delega el texto ingresado (eventos TEXTINPUT) a la pantalla activa.
 
-            sys.exit()
-        elif btn_sonido.collidepoint(pos):
-            self._toggle_sonido()
-            return True
+        Args:
+            texto: Caracteres ingresados desde el último cuadro.
+        """
+        self.invalidar_cuadro()
+        self.maquina.actual.texto(texto)
 
-        btn_vol_menos = pygame.Rect(500, ALTO - 50, 40, 40)
-        btn_vol_mas = pygame.Rect(545, ALTO - 50, 40, 40)
+    def ejecutar_eventos(self, pos: tuple):
+        """Delega un clic del mouse a la pantalla activa.
 
-        if btn_vol_menos.collidepoint(pos):
-            self._ajustar_volumen(-0.1)
-            return True
-        elif btn_vol_mas.collidepoint(pos):
-            self._ajustar_volumen(0.1)
-            return True
+        Los clics se ignoran mientras se muestra un error.
 
-        return False
+        Args:
+            pos: Tupla (x, y) con la posición del clic.
+        """
+        self.invalidar_cuadro()
+        ignorado = self.tarea_error is not None
+        if self.telemetria is not None and self.pantalla == "jugando":
+            self._registrar_clic(pos, ignorado)
+        if not ignorado:
+            self.maquina.actual.clic(pos)
+
+    def _registrar_clic(self, pos: tuple, ignorado: bool):
+        """Registra un clic en el juego con el tiempo desde el anterior."""
+        ahora = self.reloj.real()
+        desde_anterior = ahora - self.ultimo_clic if self.ultimo_clic else 0
+        self.ultimo_clic = ahora
+        indice = self.disposicion.indice_en(pos, len(self.tablero))
+        id_carta = self.tablero[indice]["id"] if indice is not None else -1
+        self._registrar(telemetria.CLIC, desde_anterior, id_carta, int(ignorado))
+
+    def _reiniciar_nivel(self):
+        """Vuelve a mezclar el nivel y restablece los reintentos."""
+        self.mezclar_tablero()
+        self.reinicios_nivel = REINICIOS_MAXIMOS
 
     def _toggle_sonido(self):
         """Activa o desactiva todos los sonidos incluyendo la música de fondo."""
@@ -214,18 +457,19 @@ class Juego:
             sonido.set_volume(self.volumen)
 
     def _toggle_pausa(self):
-        """Alterna el estado de pausa y gestiona el tiempo pausado.
+        """Alterna el estado de pausa.
 
-        Al pausar, registra el momento de inicio de la pausa.
-        Al reanudar, acumula el tiempo transcurrido en pausa.
+        Detiene o reanuda el reloj de juego, con lo que el tiempo del
+        nivel y los timers programados quedan congelados durante la pausa.
         """
         if not self.pausado:
-            self.tiempo_pausa_inicio = time.time()
+            self.reloj.pausar()
+            self.inicio_pausa = self.reloj.real()
             pygame.mixer.music.pause()
         else:
-            self.tiempo_pausado += time.time() - self.tiempo_pausa_inicio
+            self.reloj.reanudar()
+            self._registrar(telemetria.PAUSA, self.reloj.real() - self.inicio_pausa)
             pygame.mixer.music.unpause()
-        self.pausado = not self.pausado
 
     def _procesar_clicks_tablero(self, pos: tuple):
         """Procesa clics en las cartas del tablero.
@@ -233,54 +477,48 @@ class Juego:
         Args:
             pos: Tupla (x, y) con la posición del clic.
         """
-        for item in self.tablero:
-            if item["rect"].collidepoint(pos):
-                self._gestionar_seleccion(item)
+        indice = self.disposicion.indice_en(pos, len(self.tablero))
+        if indice is not None:
+            self._gestionar_seleccion(self.tablero[indice])
 
-    def _procesar_clicks_comodines(self, pos: tuple):
-        """Procesa clics en los botones de comodines.
+    def _pulsar_comodin(self, clave: str):
+        """Usa el comodín `clave` si está disponible.
 
-        Verifica si el clic coincide con algún botón de comodín
-        disponible y ejecuta la acción correspondiente.
+        El de vida solo se usa si falta alguna vida; si no, suena el
+        error y el comodín se conserva.
 
         Args:
-            pos: Tupla (x, y) con la posición del clic.
+            clave: "pista", "par" o "vida".
         """
-        btn_pista = pygame.Rect(ANCHO - 150, 100, 130, 40)
-        btn_par = pygame.Rect(ANCHO - 150, 160, 130, 40)
-        btn_vida = pygame.Rect(ANCHO - 150, 220, 130, 40)
-
-        if btn_pista.collidepoint(pos) and self.comodines["pista"]:
-            self._reproducir_sonido("menu_select")
+        if not self.comodines[clave]:
+            return
+        if clave == "vida" and self.vidas >= VIDAS_INICIALES:
+            self._reproducir_sonido("error")
+            return
+        self._reproducir_sonido("menu_select")
+        if clave == "pista":
             self._usar_comodin_pista()
-        elif btn_par.collidepoint(pos) and self.comodines["par"]:
-            self._reproducir_sonido("menu_select")
+        elif clave == "par":
             self._usar_comodin_par()
-        elif btn_vida.collidepoint(pos) and self.comodines["vida"]:
-            if self.vidas < VIDAS_INICIALES:
-                self._reproducir_sonido("menu_select")
-                self._usar_comodin_vida()
-            else:
-                self._reproducir_sonido("error")
-
-    def _eventos_final(self, pos: tuple):
-        """Maneja los clics en la pantalla final.
-
-        Detecta si se presionó el botón de reintentar o el de salir.
-
-        Args:
-            pos: Tupla (x, y) con la posición del clic.
-        """
-        btn_retry = pygame.Rect(ANCHO // 2 - 185, ALTO - 100, 170, 50)
-        btn_exit = pygame.Rect(ANCHO // 2 + 15, ALTO - 100, 170, 50)
-
-        if btn_retry.collidepoint(pos):
-            self._reiniciar_partida()
-        elif btn_exit.collidepoint(pos):
-            pygame.quit()
-            import sys
-
-            sys.exit()
+        else:
+            self._usar_comodin_vida()
+
+    def cerrar(self):
+        """Termina de escribir los resultados pendientes antes de salir."""
+        self.escritor.cerrar()
+        if self.telemetria is not None:
+            self.telemetria.cerrar()
+        if self.exportador is not None:
+            self.exportador.cerrar()
+        if self.vigilante is not None:
+            self.vigilante.cerrar()
+
+    def _salir(self):
+        """Descarta la partida guardada, vacía la cola de resultados y sale."""
+        borrar_instantanea(RUTA_INSTANTANEA)
+        self.cerrar()
+        pygame.quit()
+        sys.exit()
 
     def _reiniciar_partida(self):
         """Reinicia todos los valores del juego para una nueva partida."""
@@ -288,28 +526,31 @@ class Juego:
         self.puntaje_acumulado = 0
         self.reinicios_nivel = REINICIOS_MAXIMOS
         self.tiempos_niveles = []
+        self.comparacion_niveles = []
         self.nombre = ""
         self.mezclar_tablero()
         self.cambiar_pantalla("final", "inicio")
+        borrar_instantanea(RUTA_INSTANTANEA)
 
     def _gestionar_seleccion(self, item):
         """Gestiona la selección y deselección de cartas.
 
-        Permite seleccionar hasta 4 cartas. Si ya hay 4 seleccionadas,
-        se verifica automáticamente el grupo.
+        Permite seleccionar tantas cartas como el tamaño de grupo. Al
+        completar la selección se verifica automáticamente el grupo.
 
         Args:
             item: Diccionario con los datos de la carta seleccionada.
         """
-        if item in self.seleccionados:
-            self.seleccionados.remove(item)
-        elif len(self.seleccionados) < 4:
-            self.seleccionados.append(item)
-            if len(self.seleccionados) == 4:
+        tamanio_grupo = self.disposicion.tamanio_grupo
+        if self.indice.esta_seleccionada(item):
+            self.indice.deseleccionar(item)
+        elif len(self.seleccionados) < tamanio_grupo:
+            self.indice.seleccionar(item)
+            if len(self.seleccionados) == tamanio_grupo:
                 self.verificar_grupo()
 
     def verificar_grupo(self):
-        """Valida si los 4 elementos seleccionados pertenecen a la misma categoría."""
+        """Valida si los elementos seleccionados pertenecen a la misma categoría."""
         if self._es_grupo_valido():
             self._procesar_acierto()
         else:
@@ -319,20 +560,7 @@ class Juego:
         """
         Verifica si todos los elementos seleccionados comparten categoría.
         """
-
-        es_valido = False
-
-        if self.seleccionados:
-
-            es_valido = True
-            categoria_referencia = self.seleccionados[0]["categoria"]
-
-            for elemento in self.seleccionados:
-                if elemento["categoria"] != categoria_referencia:
-                    es_valido = False
-                    break
-
-        return es_valido
+        return self.indice.seleccion_valida()
 
     def _procesar_acierto(self):
         """Procesa un agrupamiento correcto.
@@ -341,11 +569,17 @@ class Juego:
         y verifica si se completó el nivel.
         """
         self._reproducir_sonido("acierto")
-        self.categorias_completadas.append(list(self.seleccionados))
-        for i in self.seleccionados:
-            self.tablero.remove(i)
+        grupo = list(self.seleccionados)
+        self._registrar(
+            telemetria.ACIERTO, self.reloj.ahora() - self.inicio_nivel, grupo[0]["id"]
+        )
+        self.categorias_completadas.append(grupo)
+        self.panel_completadas.agregar_grupo(grupo)
+        ids = {item["id"] for item in grupo}
+        self.tablero = [item for item in self.tablero if item["id"] not in ids]
+        self.indice.quitar_grupo(grupo)
+        self.indice.limpiar_seleccion()
         self.puntaje_acumulado += 100
-        self.seleccionados = []
         if len(self.tablero) == 0:
             self.finalizar_nivel()
 
@@ -357,7 +591,16 @@ class Juego:
         """
         self._reproducir_sonido("error")
         self.vidas -= 1
-        self.timer_error = pygame.time.get_ticks() + 1000
+        primera = self.seleccionados[0]["id"]
+        for posicion, carta in enumerate(self.seleccionados):
+            self._registrar(telemetria.ERROR, carta["id"], primera, posicion)
+        self.tarea_error = self.planificador.programar(1000, self._terminar_error)
+
+    def _terminar_error(self):
+        """Limpia la selección incorrecta cuando vence el timer de error."""
+        self.indice.limpiar_seleccion()
+        self.tarea_error = None
+        self.invalidar_cuadro()
 
     def finalizar_nivel(self):
         """Calcula el tiempo del nivel y avanza al siguiente o finaliza el juego.
@@ -365,19 +608,21 @@ class Juego:
         Si quedan niveles por completar, inicia la transición al siguiente.
         Si se completaron todos, guarda las estadísticas como ganador.
         """
-        duracion = time.time() - self.tiempo_inicio_nivel - self.tiempo_pausado
+        duracion = (self.reloj.ahora() - self.inicio_nivel) / 1000
         self.tiempos_niveles.append(duracion)
         if self.nivel_actual < CANT_NIVELES:
             self._reproducir_sonido("next_level")
             self.nivel_actual += 1
-            self.timer_transicion = pygame.time.get_ticks() + TIEMPO_TRANSICION
+            self._iniciar_transicion(TIEMPO_TRANSICION)
             self.cambiar_pantalla("jugando", "transicion")
         else:
             self.guardar_estadisticas(ganador=True)
             self.cambiar_pantalla("jugando", "final")
 
     def guardar_estadisticas(self, ganador=False):
-        """Guarda las estadísticas del juego en un archivo JSON.
+        """Encola las estadísticas del juego para guardarlas en el JSON.
+
+        La escritura la hace `EscritorResultados` en segundo plano.
 
         Args:
             ganador: Indica si el jugador completó todos los niveles.
@@ -397,10 +642,194 @@ class Juego:
             "fecha": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         }
 
-        guardar_resultado_json("data/resultados.json", estadisticas)
+        self.comparacion_niveles = [
+            self.estadisticas.porcentaje_mas_rapido(i + 1, tiempo)
+            for i, tiempo in enumerate(self.tiempos_niveles)
+        ]
+        self.escritor.encolar(estadisticas)
+        borrar_instantanea(RUTA_INSTANTANEA)
+
+    def _actualizar_estadisticas(self, lote: list):
+        """Agrega al resumen por nivel los resultados recién escritos.
+
+        Se ejecuta en el hilo de `EscritorResultados`.
+
+        Args:
+            lote: Lista de diccionarios con estadísticas ya guardadas.
+        """
+        for resultado in lote:
+            self.estadisticas.registrar(resultado)
+        self.estadisticas.guardar(RUTA_ESTADISTICAS)
+
+    def capturar_estado(self) -> dict:
+        """Genera un diccionario con el estado de la partida en curso.
+
+        Las cartas se referencian por su id en el catálogo y los timers
+        se expresan como milisegundos restantes, de modo que el estado
+        se pueda serializar con `modules.instantanea`.
+
+        Returns:
+            dict: Estado de la partida listo para serializar.
+        """
+        tiempo_nivel = (self.reloj.ahora() - self.inicio_nivel) / 1000
+        restante = self.planificador.restante
+
+        return {
+            "pantalla": self.pantalla,
+            "nivel": self.nivel_actual,
+            "vidas": self.vidas,
+            "reinicios": self.reinicios_nivel,
+            "comodines": self.comodines,
+            "pausado": self.pausado,
+            "sonido_activo": self.sonido_activo,
+            "volumen": self.volumen,
+            "puntaje": self.puntaje_acumulado,
+            "tiempo_nivel": max(0.0, tiempo_nivel),
+            "timer_error": restante(self.tarea_error),
+            "timer_pista": restante(self.tarea_pista),
+            "timer_transicion": restante(self.tarea_transicion),
+            "pista": self.pista_activa["id"] if self.pista_activa else None,
+            "firma": self.catalogo.firma,
+            "firma_cartas": firma_cartas(
+                self.tablero
+                + [c for grupo in self.categorias_completadas for c in grupo]
+            ),
+            "nombre": self.nombre,
+            "tiempos_niveles": self.tiempos_niveles,
+            "tablero": [item["id"] for item in self.tablero],
+            "seleccionados": [item["id"] for item in self.seleccionados],
+            "completadas": [
+                [item["id"] for item in grupo] for grupo in self.categorias_completadas
+            ],
+        }
+
+    def restaurar_estado(self, estado: dict) -> bool:
+        """Restaura una partida a partir de un estado capturado.
+
+        Args:
+            estado: Diccionario generado por `capturar_estado`.
+
+        Returns:
+            bool: True si se restauró, False si el estado corresponde
+            a otro catálogo o a otro modo de tablero, o si alguna carta
+            ya no es la misma fila, y fue descartado.
+        """
+        if estado["firma"] != self.catalogo.firma:
+            return False
+        tamanio_grupo = self.disposicion.tamanio_grupo
+        grupos = estado["completadas"]
+        if (
+            len(estado["tablero"]) + len(grupos) * tamanio_grupo
+            > self.disposicion.cartas
+        ):
+            return False
+        if any(len(grupo) != tamanio_grupo for grupo in grupos):
+            return False
+
+        ids = estado["tablero"] + [i for grupo in grupos for i in grupo]
+        if any(i >= len(self.catalogo) for i in ids):
+            return False
+        if not set(estado["seleccionados"]) <= set(estado["tablero"]):
+            return False
+        elementos = {i: self.catalogo.carta(i) for i in ids}
+        # Cada id tiene que seguir siendo la misma categoría y elemento.
+        if firma_cartas(elementos[i] for i in ids) != estado["firma_cartas"]:
+            return False
+
+        self.nivel_actual = estado["nivel"]
+        self.vidas = estado["vidas"]
+        self.reinicios_nivel = estado["reinicios"]
+        self.puntaje_acumulado = estado["puntaje"]
+        self.comodines = dict(estado["comodines"])
+        self.nombre = estado["nombre"]
+        self.tiempos_niveles = list(estado["tiempos_niveles"])
+
+        self.tablero = [elementos[i] for i in estado["tablero"]]
+        self.indice.reconstruir(self.tablero)
+        self.seleccionados = [elementos[i] for i in estado["seleccionados"]]
+        self.categorias_completadas = [
+            [elementos[i] for i in grupo] for grupo in estado["completadas"]
+        ]
+        limpiar_sprites_cartas()
+        self.panel_completadas.limpiar()
+        for grupo in self.categorias_completadas:
+            self.panel_completadas.agregar_grupo(grupo)
+
+        self.planificador.limpiar()
+        self.reloj.reanudar()
+        self.inicio_nivel = self.reloj.ahora() - int(estado["tiempo_nivel"] * 1000)
+
+        self.tarea_error = None
+        if estado["timer_error"]:
+            self.tarea_error = self.planificador.programar(
+                estado["timer_error"], self._terminar_error
+            )
+        self.pista_activa = None
+        self.tarea_pista = None
+        if estado["timer_pista"]:
+            self.pista_activa = elementos.get(estado["pista"])
+            self.tarea_pista = self.planificador.programar(
+                estado["timer_pista"], self._terminar_pista
+            )
+        if estado["pantalla"] == "transicion":
+            self._iniciar_transicion(estado["timer_transicion"])
+
+        if estado["pausado"]:
+            self.reloj.pausar()
+            pygame.mixer.music.pause()
+
+        if estado["sonido_activo"] != self.sonido_activo:
+            self._toggle_sonido()
+        self._ajustar_volumen(estado["volumen"] - self.volumen)
+
+        self.maquina.reiniciar(estado["pantalla"])
+        self.invalidar_cuadro()
+        return True
+
+    def guardar_instantanea(self):
+        """Guarda la partida en curso en `RUTA_INSTANTANEA`."""
+        inicio = time.perf_counter()
+        guardar_instantanea(RUTA_INSTANTANEA, self.capturar_estado())
+        self.metrica_instantaneas.observar((time.perf_counter() - inicio) * 1000)
+        self.ultima_instantanea = self.reloj.real()
+
+    def guardar_instantanea_periodica(self, forzar=False):
+        """Guarda la partida cada `INTERVALO_INSTANTANEA` milisegundos.
+
+        Solo se guarda mientras hay una partida en curso (juego o
+        transición entre niveles).
+
+        Args:
+            forzar: Guarda aunque no haya pasado el intervalo, por
+            ejemplo al cerrar la ventana.
+        """
+        en_partida = self.pantalla in ("jugando", "transicion")
+        ahora = self.reloj.real()
+        vencido = ahora - self.ultima_instantanea >= INTERVALO_INSTANTANEA
+        if en_partida and (forzar or vencido):
+            self.guardar_instantanea()
+
+    def restaurar_instantanea(self) -> bool:
+        """Retoma la partida guardada en `RUTA_INSTANTANEA`, si existe.
+
+        Returns:
+            bool: True si se retomó una partida guardada.
+        """
+        estado = cargar_instantanea(RUTA_INSTANTANEA)
+        restaurada = False
+        if estado is not None and estado["pantalla"] in ("jugando", "transicion"):
+            try:
+                restaurada = self.restaurar_estado(estado)
+            except IndexError:
+                restaurada = False
+        if not restaurada:
+            borrar_instantanea(RUTA_INSTANTANEA)
+        return restaurada
 
     def mezclar_tablero(self, es_reintento=False):
         """Reinicia el tablero para el nivel actual."""
+        if self.vigilante is not None:
+            self._aplicar_cambios_contenido()
         categorias_validas = self._obtener_categorias_validas()
 
         if not categorias_validas:
@@ -413,71 +842,64 @@ class Juego:
         self._preparar_tablero(elementos_seleccionados, es_reintento)
 
     def _obtener_categorias_validas(self):
+        """Devuelve los grupos del nivel actual con el tamaño de grupo del tablero."""
+        return self.catalogo.grupos_nivel(
+            self.nivel_actual, self.disposicion.tamanio_grupo
+        )
 
-        grupos_temporales = {}
-
-        for elemento in self.elementos_totales:
-
-            dificultad_elem = elemento.get("dificultad", 1)
-
-            if dificultad_elem == self.nivel_actual:
-                categoria = elemento["categoria"]
-
-                if categoria not in grupos_temporales:
-                    grupos_temporales[categoria] = []
-                grupos_temporales[categoria].append(elemento)
-
-        resultado_final = {}
-
-        for categoria, lista_items in grupos_temporales.items():
-
-            if len(lista_items) == 4:
-                resultado_final[categoria] = lista_items
-
-        return resultado_final
-
-    def _seleccionar_elementos_aleatorios(self, categorias_dict):
-        """Selecciona 4 categorías aleatorias y retorna sus elementos."""
-        cantidad = min(4, len(categorias_dict))
+    def _seleccionar_elementos_aleatorios(self, grupos_validos):
+        """Selecciona las categorías que llenan el tablero y retorna sus elementos."""
+        grupos = self.disposicion.grupos
+        cantidad = min(grupos, len(grupos_validos))
 
-        if cantidad < 4:
+        if cantidad < grupos:
             print(f"AVISO: Nivel {self.nivel_actual} tiene solo {cantidad} categorías.")
 
-        categorias_seleccionadas = random.sample(list(categorias_dict.keys()), cantidad)
-
-        elementos = []
-        for cat in categorias_seleccionadas:
-            elementos.extend(categorias_dict[cat])
-
-        return elementos
+        grupos_seleccionados = self.catalogo.muestrear_grupos(
+            self.nivel_actual, cantidad, self.disposicion.tamanio_grupo
+        )
+        return self.catalogo.cartas_grupos(grupos_seleccionados)
 
     def _preparar_tablero(self, elementos, es_reintento):
         """Mezcla elementos y resetea el estado del nivel."""
         self.tablero = elementos
         random.shuffle(self.tablero)
+        self.indice.reconstruir(self.tablero)
 
         self.categorias_completadas = []
-        self.seleccionados = []
+        self.panel_completadas.limpiar()
+        limpiar_sprites_cartas()
 
         if not es_reintento:
             self.vidas = VIDAS_INICIALES
             self.reinicios_nivel = REINICIOS_MAXIMOS
 
-        self.tiempo_inicio_nivel = time.time()
-        self.tiempo_pausado = 0
+        self.inicio_nivel = self.reloj.ahora()
+        self._registrar(telemetria.NIVEL, self.vidas, int(es_reintento))
 
     def _usar_comodin_pista(self):
-        """Muestra una pista visual sobre una carta aleatoria durante 3 segundos.
+        """Muestra una pista visual sobre una carta durante 3 segundos.
 
-        Selecciona una carta al azar del tablero y la marca con un
-        indicador numérico temporal.
+        Si hay cartas seleccionadas, señala otra carta de la categoría
+        más cercana a completarse; si no, una carta al azar del tablero.
+        La carta se marca con un indicador numérico temporal.
         """
         if self.tablero:
-            carta_pista = random.choice(self.tablero)
+            carta_pista = self.indice.carta_pista() or random.choice(self.tablero)
 
             self.pista_activa = carta_pista
-            self.timer_pista = pygame.time.get_ticks() + 3000
+            self.planificador.cancelar(self.tarea_pista)
+            self.tarea_pista = self.planificador.programar(3000, self._terminar_pista)
             self.comodines["pista"] = False
+            self._registrar(
+                telemetria.COMODIN, carta_pista["id"], telemetria.COMODINES["pista"]
+            )
+
+    def _terminar_pista(self):
+        """Oculta la pista cuando vence su timer."""
+        self.pista_activa = None
+        self.tarea_pista = None
+        self.invalidar_cuadro()
 
     def _usar_comodin_par(self):
         """Selecciona automáticamente 2 elementos de la misma categoría.
@@ -486,176 +908,141 @@ class Juego:
         del tablero y preselecciona 2 de sus elementos.
         """
         if self.tablero:
-            self.seleccionados = []
-
-            categorias_en_tablero = {}
-            for item in self.tablero:
-                cat = item["categoria"]
-                if cat not in categorias_en_tablero:
-                    categorias_en_tablero[cat] = []
-                categorias_en_tablero[cat].append(item)
-
-            categoria = random.choice(list(categorias_en_tablero.keys()))
-            elementos = categorias_en_tablero[categoria][:2]
-            self.seleccionados = elementos
+            self.seleccionados = self.indice.par(2)
             self.comodines["par"] = False
+            self._registrar(
+                telemetria.COMODIN,
+                self.seleccionados[0]["id"],
+                telemetria.COMODINES["par"],
+            )
 
     def _usar_comodin_vida(self):
         """Recupera una vida perdida, sin exceder el máximo de vidas iniciales."""
         if self.vidas < VIDAS_INICIALES:
             self.vidas += 1
         self.comodines["vida"] = False
+        self._registrar(telemetria.COMODIN, -1, telemetria.COMODINES["vida"])
 
     def cambiar_pantalla(self, de: str, a: str):
-        """Cambia el estado activo entre pantallas del juego.
+        """Cambia la pantalla activa a través de la máquina de estados.
 
         Args:
-            de: Nombre de la pantalla a desactivar.
+            de: Nombre de la pantalla que debe estar activa.
             a: Nombre de la pantalla a activar.
-        """
-        self.estados[de] = False
-        self.estados[a] = True
 
-    def dibujar(self, pantalla, fuente, fuente_g):
-        """Orquesta el dibujo según el estado de pantalla activo.
-
-        Args:
-            pantalla: Superficie principal de Pygame.
-            fuente: Fuente de tamaño normal para textos del HUD.
-            fuente_g: Fuente de tamaño grande para títulos.
+        Raises:
+            ValueError: Si `de` no es la pantalla activa o la transición
+            no está permitida.
         """
-        if self.estados["inicio"]:
-            self._dibujar_inicio(pantalla, fuente, fuente_g)
-        elif self.estados["jugando"]:
-            self._actualizar_estado_jugando()
-            self._dibujar_jugando(pantalla, fuente)
-        elif self.estados["transicion"]:
-            self._actualizar_transicion()
-            self._dibujar_transicion(pantalla, fuente_g)
-        elif self.estados["final"]:
-            self._dibujar_final(pantalla, fuente, fuente_g)
+        self.maquina.cambiar(a, desde=de)
+        self.metrica_cambios_pantalla.inc(1, (de, a))
+        self.invalidar_cuadro()
 
-    def _dibujar_inicio(self, pantalla, fuente, fuente_g):
-        """Dibuja la pantalla de inicio delegando al módulo visuales.
-
-        Args:
-            pantalla: Superficie principal de Pygame.
-            fuente: Fuente normal.
-            fuente_g: Fuente grande.
-        """
-        dibujar_inicio(
-            pantalla,
-            fuente_g,
-            fuente,
-            self.nombre,
-            self.input_rect,
-            self.input_activo,
-        )
+    def invalidar_cuadro(self):
+        """Obliga a redibujar el próximo cuadro aunque la pantalla sea fija."""
+        self.clave_cuadro = None
 
-    def _actualizar_estado_jugando(self):
-        """Actualiza el estado del juego sin renderizar.
+    def actualizar(self):
+        """Avanza la lógica del juego un paso fijo, sin renderizar.
 
-        Verifica si se acabaron las vidas para reiniciar el nivel
-        o terminar la partida, y limpia la selección tras un error.
+        Ejecuta las tareas del planificador que vencieron y verifica el
+        estado de la partida. El bucle principal lo llama una cantidad
+        de veces que depende del tiempo transcurrido, no de los FPS.
         """
-        tiempo_actual = pygame.time.get_ticks()
+        self.planificador.ejecutar_vencidas()
+        self.maquina.actual.actualizar()
 
-        if self.vidas <= 0 and self.timer_error == 0:
-            if self.reinicios_nivel > 0:
-                self.reinicios_nivel -= 1
-                self.vidas = VIDAS_INICIALES
-                self.mezclar_tablero(es_reintento=True)
-            else:
-                self._reproducir_sonido("game_over")
-                self.guardar_estadisticas(ganador=False)
-                self.cambiar_pantalla("jugando", "final")
+    def animando(self) -> bool:
+        """Indica si el bucle tiene que ir a la tasa activa de la pantalla.
 
-        if self.timer_error > 0 and tiempo_actual > self.timer_error:
-            self.seleccionados = []
-            self.timer_error = 0
+        Es así durante `VENTANA_ACTIVIDAD` ms después de cada evento de
+        entrada, para que la respuesta a una selección se vea fluida, y
+        mientras la pantalla activa tenga algo en curso.
+        """
+        ultimo = self.entrada.ultimo_evento
+        if ultimo is not None and self.reloj.real() - ultimo < VENTANA_ACTIVIDAD:
+            return True
+        return self.maquina.actual.animando()
 
-    def _dibujar_jugando(self, pantalla, fuente):
-        """Dibuja la pantalla de juego con tablero, comodines, HUD y controles.
+    def ritmo(self, trabajo_ms: float, dibujado: bool) -> int:
+        """Registra el cuadro en el gobernador y devuelve la espera.
 
         Args:
-            pantalla: Superficie principal de Pygame.
-            fuente: Fuente para textos del juego.
+            trabajo_ms: Tiempo de trabajo del cuadro, sin la espera.
+            dibujado: Si el cuadro se dibujó o se reutilizó el anterior.
+
+        Returns:
+            int: Milisegundos que el bucle puede esperar: hasta el
+            próximo cuadro de la tasa elegida, o menos si antes vence
+            una tarea programada.
         """
-        dibujar_tablero(pantalla, self, fuente)
-        dibujar_comodines(pantalla, self, fuente)
-        self._dibujar_hud(pantalla, fuente)
-        dibujar_botones_control(pantalla, self, fuente)
+        espera = self.gobernador.cuadro(
+            self.pantalla, self.animando(), trabajo_ms, dibujado
+        )
+        return self.planificador.hasta_proximo(espera)
 
-    def _dibujar_hud(self, pantalla, fuente):
-        """Dibuja el HUD superior con puntos, vidas, reintentos, timer y nivel.
+    def dibujar(self, pantalla, fuente, fuente_g) -> bool:
+        """Orquesta el dibujo según el estado de pantalla activo.
+
+        Solo renderiza: la lógica avanza en `actualizar`. Si la pantalla
+        es fija y no cambió desde el último cuadro no dibuja nada, porque
+        lo que ya está en `pantalla` sigue siendo válido.
 
         Args:
             pantalla: Superficie principal de Pygame.
-            fuente: Fuente para los textos del HUD.
+            fuente: Fuente de tamaño normal para textos del HUD.
+            fuente_g: Fuente de tamaño grande para títulos.
+
+        Returns:
+            bool: True si se dibujó un cuadro nuevo y hay que mostrarlo.
         """
-        txt_puntos = fuente.render(
-            f"PUNTOS: {self.puntaje_acumulado}", True, (255, 215, 0)
-        )
-        txt_vidas = fuente.render(f"VIDAS: {self.vidas}", True, (255, 100, 100))
-        txt_reinicios = fuente.render(
-            f"REINTENTOS: {self.reinicios_nivel}/{REINICIOS_MAXIMOS}",
-            True,
-            (200, 200, 200),
-        )
+        self.interfaz.asignar_fuentes(fuente, fuente_g)
 
-        if self.pausado:
-            tiempo_transcurrido = int(
-                self.tiempo_pausa_inicio
-                - self.tiempo_inicio_nivel
-                - self.tiempo_pausado
-            )
-        else:
-            tiempo_transcurrido = int(
-                time.time() - self.tiempo_inicio_nivel - self.tiempo_pausado
-            )
-        minutos = tiempo_transcurrido // 60
-        segundos = tiempo_transcurrido % 60
-        txt_timer = fuente.render(
-            f"TIEMPO: {minutos:02d}:{segundos:02d}", True, (100, 200, 255)
-        )
+        if self.precarga is not None and not self.precarga.terminada:
+            self.precarga.avanzar()
 
-        txt_nivel = fuente.render(
-            f"NIVEL: {self.nivel_actual}/{CANT_NIVELES}", True, (150, 255, 150)
-        )
+        estado = self.maquina.actual
+        clave = estado.clave_cuadro()
+        if clave is not None and clave == self.clave_cuadro:
+            return False
+        self.clave_cuadro = clave
 
-        pantalla.blit(txt_puntos, (20, 10))
-        pantalla.blit(txt_vidas, (200, 10))
-        pantalla.blit(txt_reinicios, (350, 10))
-        pantalla.blit(txt_timer, (560, 10))
-        pantalla.blit(txt_nivel, (720, 10))
+        estado.dibujar(pantalla, fuente, fuente_g)
+        return True
 
-    def _actualizar_transicion(self):
-        """Actualiza el estado de la transición entre niveles.
+    def _progreso_precarga(self):
+        """Devuelve el progreso de la precarga, o None si no hay una en curso."""
+        progreso = None
+        if self.precarga is not None and not self.precarga.terminada:
+            progreso = self.precarga.progreso
+        return progreso
 
-        Cuando el timer expira, mezcla el tablero y cambia a la
-        pantalla de juego.
-        """
-        restante = (self.timer_transicion - pygame.time.get_ticks()) / 1000
-        if restante <= 0:
-            self.mezclar_tablero()
-            self.cambiar_pantalla("transicion", "jugando")
+    def _segundos_nivel(self) -> int:
+        """Calcula los segundos enteros transcurridos en el nivel sin contar pausas."""
+        return (self.reloj.ahora() - self.inicio_nivel) // 1000
 
-    def _dibujar_transicion(self, pantalla, fuente_g):
-        """Dibuja la pantalla de transición entre niveles.
+    def _iniciar_transicion(self, duracion: int):
+        """Programa el fin de la transición y el redibujo de la cuenta regresiva.
 
         Args:
-            pantalla: Superficie principal de Pygame.
-            fuente_g: Fuente grande para el texto de transición.
+            duracion: Milisegundos hasta empezar el próximo nivel.
         """
-        restante = (self.timer_transicion - pygame.time.get_ticks()) / 1000
-        dibujar_transicion(pantalla, restante, self.nivel_actual, fuente_g)
+        self.planificador.cancelar(self.tarea_transicion)
+        self.planificador.cancelar(self.tarea_cuenta)
+        self.tarea_transicion = self.planificador.programar(
+            duracion, self._terminar_transicion
+        )
+        self.tarea_cuenta = self.planificador.programar(
+            duracion % 1000 or 1000, self.invalidar_cuadro, intervalo=1000
+        )
 
-    def _dibujar_final(self, pantalla, fuente, fuente_g):
-        """Dibuja la pantalla final con el resumen de estadísticas.
+    def _terminar_transicion(self):
+        """Mezcla el tablero del nuevo nivel y vuelve a la pantalla de juego."""
+        self.tarea_transicion = None
+        self.mezclar_tablero()
+        self.cambiar_pantalla("transicion", "jugando")
 
-        Args:
-            pantalla: Superficie principal de Pygame.
-            fuente: Fuente normal para estadísticas.
-            fuente_g: Fuente grande para el título.
-        """
-        dibujar_pantalla_final(pantalla, self, fuente_g, fuente)
+    def _segundos_transicion(self) -> int:
+        """Devuelve el número que muestra la cuenta regresiva de la transición."""
+        restante = self.planificador.restante(self.tarea_transicion) / 1000
+        return int(restante) + 1
@@ -0,0 +1,340 @@
+import bisect
+import os
+import socket
+import sys
+import threading
+
+
+def rss_actual() -> int:
+    """Devuelve el RSS actual del proceso en bytes, o 0 si la plataforma
+    no permite medirlo.
+    """
+    try:
+        with open("/proc/self/statm") as archivo:
+            paginas = int(archivo.read().split()[1])
+        return paginas * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        # Windows no tiene `resource`.
+        return 0
+    # Sin /proc solo está disponible el máximo histórico, en bytes en
+    # macOS y en KiB en el resto.
+    maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maximo if sys.platform == "darwin" else maximo * 1024
+
+
+def _formato(valor) -> str:
+    """Formatea un valor numérico para el texto de exportación."""
+    if isinstance(valor, float) and not valor.is_integer():
+        return f"{valor:.6g}"
+    return str(int(valor))
+
+
+class Metrica:
+    """Métrica con nombre, descripción y etiquetas opcionales.
+
+    Los valores se guardan por tupla de valores de etiqueta, en el mismo
+    orden que `etiquetas`.
+
+    Attributes:
+        nombre: Nombre de la métrica.
+        ayuda: Descripción para el texto de exportación.
+        etiquetas: Nombres de las etiquetas.
+        valores: Diccionario tupla de valores de etiqueta -> valor.
+    """
+
+    tipo = ""
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: tuple = ()):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.etiquetas = etiquetas
+        self.valores = {}
+
+    def fijar(self, valor, etiquetas: tuple = ()):
+        """Reemplaza el valor, por ejemplo al tomarlo de un contador externo."""
+        self.valores[etiquetas] = valor
+
+    def _selector(self, valores: tuple) -> str:
+        pares = [f'{n}="{v}"' for n, v in zip(self.etiquetas, valores)]
+        return "{" + ",".join(pares) + "}" if pares else ""
+
+    def texto(self) -> list:
+        """Devuelve las líneas de la métrica en formato de texto de Prometheus."""
+        lineas = [
+            f"# HELP {self.nombre} {self.ayuda}",
+            f"# TYPE {self.nombre} {self.tipo}",
+        ]
+        # Copia: el juego puede agregar etiquetas mientras se exporta.
+        for valores, valor in list(self.valores.items()):
+            lineas.append(f"{self.nombre}{self._selector(valores)} {_formato(valor)}")
+        return lineas
+
+    def muestras(self):
+        """Devuelve tuplas (sufijo, valores de etiqueta, valor, es contador)."""
+        for valores, valor in list(self.valores.items()):
+            yield "", valores, valor, self.tipo == "counter"
+
+
+class Contador(Metrica):
+    """Métrica que solo crece."""
+
+    tipo = "counter"
+
+    def inc(self, cantidad=1, etiquetas: tuple = ()):
+        self.valores[etiquetas] = self.valores.get(etiquetas, 0) + cantidad
+
+
+class Indicador(Metrica):
+    """Métrica que puede subir o bajar (gauge)."""
+
+    tipo = "gauge"
+
+
+class Histograma(Metrica):
+    """Distribución de observaciones en intervalos fijos.
+
+    Cada observación suma uno al primer intervalo cuyo límite la
+    contiene, sin guardar las observaciones.
+    """
+
+    tipo = "histogram"
+
+    def __init__(self, nombre: str, ayuda: str, limites: tuple):
+        """Crea el histograma.
+
+        Args:
+            nombre: Nombre de la métrica.
+            ayuda: Descripción para el texto de exportación.
+            limites: Límites superiores de los intervalos, crecientes.
+        """
+        super().__init__(nombre, ayuda)
+        self.limites = tuple(limites)
+        self.conteos = [0] * (len(self.limites) + 1)
+        self.suma = 0.0
+        self.cantidad = 0
+
+    def observar(self, valor: float):
+        self.conteos[bisect.bisect_left(self.limites, valor)] += 1
+        self.suma += valor
+        self.cantidad += 1
+
+    def _acumulados(self):
+        acumulado = 0
+        for limite, conteo in zip(self.limites + ("+Inf",), self.conteos):
+            acumulado += conteo
+            yield limite, acumulado
+
+    def texto(self) -> list:
+        lineas = [
+            f"# HELP {self.nombre} {self.ayuda}",
+            f"# TYPE {self.nombre} {self.tipo}",
+        ]
+        for limite, acumulado in self._acumulados():
+            le = limite if limite == "+Inf" else _formato(limite)
+            lineas.append(f'{self.nombre}_bucket{{le="{le}"}} {acumulado}')
+        lineas.append(f"{self.nombre}_sum {_formato(self.suma)}")
+        lineas.append(f"{self.nombre}_count {self.cantidad}")
+        return lineas
+
+    def muestras(self):
+        for limite, acumulado in self._acumulados():
+            le = "inf" if limite == "+Inf" else _formato(limite).replace(".", "_")
+            yield f".le_{le}", (), acumulado, True
+        yield ".sum", (), self.suma, True
+        yield ".count", (), self.cantidad, True
+
+
+class RegistroMetricas:
+    """Conjunto de métricas de la aplicación.
+
+    Las métricas que se actualizan en cada cuadro se modifican
+    directamente; las que ya cuenta otro módulo (cachés, escritor de
+    resultados) se copian justo antes de exportar mediante colectores,
+    para no agregar trabajo a los caminos calientes.
+    """
+
+    def __init__(self):
+        self.metricas = {}
+        self._colectores = []
+
+    def _agregar(self, metrica):
+        self.metricas[metrica.nombre] = metrica
+        return metrica
+
+    def contador(self, nombre: str, ayuda: str, etiquetas: tuple = ()) -> Contador:
+        return self._agregar(Contador(nombre, ayuda, etiquetas))
+
+    def indicador(self, nombre: str, ayuda: str, etiquetas: tuple = ()) -> Indicador:
+        return self._agregar(Indicador(nombre, ayuda, etiquetas))
+
+    def histograma(self, nombre: str, ayuda: str, limites: tuple) -> Histograma:
+        return self._agregar(Histograma(nombre, ayuda, limites))
+
+    def agregar_colector(self, funcion):
+        """Registra una función sin argumentos que actualiza métricas antes
+        de cada exportación.
+        """
+        self._colectores.append(funcion)
+
+    def recolectar(self):
+        """Ejecuta los colectores registrados."""
+        for funcion in self._colectores:
+            funcion()
+
+    def texto_prometheus(self) -> str:
+        """Devuelve todas las métricas en formato de texto de Prometheus."""
+        lineas = []
+        for metrica in list(self.metricas.values()):
+            lineas.extend(metrica.texto())
+        return "\n".join(lineas) + "\n"
+
+
+class DestinoArchivo:
+    """Escribe las métricas a un archivo de texto de Prometheus.
+
+    El archivo se reemplaza de forma atómica, así que un recolector
+    (por ejemplo, el textfile collector de node_exporter) nunca lee un
+    archivo a medio escribir.
+    """
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+
+    def enviar(self, registro: RegistroMetricas):
+        directorio = os.path.dirname(self.ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        temporal = self.ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(registro.texto_prometheus())
+        os.replace(temporal, self.ruta)
+
+
+class DestinoStatsd:
+    """Envía las métricas por UDP a un receptor compatible con StatsD.
+
+    Los contadores y los histogramas se envían como incrementos desde
+    el envío anterior (`|c`) y los indicadores como valor actual
+    (`|g`). Los nombres llevan como prefijo el nombre del equipo, para
+    distinguir cada kiosco, y las etiquetas se agregan separadas por
+    puntos.
+    """
+
+    TAMANIO_DATAGRAMA = 512
+
+    def __init__(self, host: str, puerto: int, prefijo: str = None):
+        self.direccion = (host, puerto)
+        self.prefijo = prefijo or socket.gethostname().replace(".", "_")
+        self._enviados = {}
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def lineas(self, registro: RegistroMetricas) -> list:
+        """Devuelve las líneas StatsD con los cambios desde el envío anterior."""
+        lineas = []
+        for metrica in list(registro.metricas.values()):
+            for sufijo, valores, valor, es_contador in metrica.muestras():
+                nombre = ".".join(
+                    (self.prefijo, metrica.nombre + sufijo) + tuple(map(str, valores))
+                )
+                if es_contador:
+                    delta = valor - self._enviados.get(nombre, 0)
+                    self._enviados[nombre] = valor
+                    if delta:
+                        lineas.append(f"{nombre}:{_formato(delta)}|c")
+                else:
+                    lineas.append(f"{nombre}:{_formato(valor)}|g")
+        return lineas
+
+    def enviar(self, registro: RegistroMetricas):
+        paquete = b""
+        for linea in self.lineas(registro):
+            datos = linea.encode("utf-8")
+            if paquete and len(paquete) + 1 + len(datos) > self.TAMANIO_DATAGRAMA:
+                self._socket.sendto(paquete, self.direccion)
+                paquete = b""
+            paquete = paquete + b"\n" + datos if paquete else datos
+        if paquete:
+            self._socket.sendto(paquete, self.direccion)
+
+    def cerrar(self):
+        self._socket.close()
+
+
+class ExportadorMetricas:
+    """Exporta un registro de métricas periódicamente desde un hilo aparte.
+
+    Attributes:
+        exportaciones: Cantidad de exportaciones realizadas.
+        errores: Cantidad de exportaciones que fallaron.
+    """
+
+    def __init__(self, registro: RegistroMetricas, destino, intervalo: float = 10.0):
+        """Inicia el hilo exportador.
+
+        Args:
+            registro: Métricas a exportar.
+            destino: `DestinoArchivo` o `DestinoStatsd`.
+            intervalo: Segundos entre exportaciones.
+        """
+        self.registro = registro
+        self.destino = destino
+        self.intervalo = intervalo
+        self.exportaciones = 0
+        self.errores = 0
+        self._detener = threading.Event()
+        self._hilo = threading.Thread(
+            target=self._bucle, name="exportador-metricas", daemon=True
+        )
+        self._hilo.start()
+
+    def exportar(self):
+        """Recolecta y envía las métricas una vez.
+
+        Cualquier error (de red, de disco o de un colector) se cuenta y
+        se informa, sin detener las exportaciones siguientes.
+        """
+        try:
+            self.registro.recolectar()
+            self.destino.enviar(self.registro)
+        except Exception as error:
+            self.errores += 1
+            print(f"ERROR: No se pudieron exportar las métricas: {error}")
+        else:
+            self.exportaciones += 1
+
+    def cerrar(self, timeout=5.0):
+        """Exporta por última vez y detiene el hilo. Es seguro llamarlo más
+        de una vez.
+        """
+        if not self._detener.is_set():
+            self._detener.set()
+            self._hilo.join(timeout)
+            self.exportar()
+            if hasattr(self.destino, "cerrar"):
+                self.destino.cerrar()
+
+    def _bucle(self):
+        while not self._detener.wait(self.intervalo):
+            self.exportar()
+
+
+def crear_destino(tipo: str, ruta: str, direccion: tuple):
+    """Crea el destino de exportación configurado.
+
+    Args:
+        tipo: "archivo" o "statsd".
+        ruta: Ruta del archivo de texto, para "archivo".
+        direccion: Tupla (host, puerto) del receptor, para "statsd".
+
+    Raises:
+        ValueError: Si el tipo no es válido.
+    """
+    if tipo == "archivo":
+        return DestinoArchivo(ruta)
+    if tipo == "statsd":
+        return DestinoStatsd(*direccion)
+    raise ValueError(f"Destino de métricas desconocido: {tipo}")
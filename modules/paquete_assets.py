@@ -0,0 +1,243 @@
+import json
+import mmap
+import os
+import struct
+from multiprocessing import resource_tracker, shared_memory
+import pygame
+
+MAGIA = b"AGPK"
+VERSION = 1
+FORMATO_PIXELES = "BGRA"
+ALINEACION = 16
+
+# magia, versión, largo del índice JSON en bytes.
+_CABECERA = struct.Struct("<4sHI")
+
+
+def _clave(nombre: str, tamanio: tuple) -> str:
+    """Arma la clave del índice para una imagen escalada."""
+    return f"{nombre}|{tamanio[0]}x{tamanio[1]}"
+
+
+def _clave_sonido(ruta: str) -> str:
+    """Arma la clave del índice para un sonido decodificado."""
+    return f"{ruta}|pcm"
+
+
+# Formato del mezclador con el que se decodificaron los sonidos.
+_CLAVE_MEZCLADOR = "|mezclador"
+
+
+def serializar_paquete(entradas, sonidos=(), mezclador=None) -> bytes:
+    """Arma un paquete de imágenes ya escaladas y, opcionalmente, sonidos.
+
+    El paquete tiene una cabecera, un índice JSON con el offset y el
+    tamaño de cada imagen, y los píxeles crudos en formato BGRA (el
+    orden en memoria de las superficies de pantalla con alfa), cada
+    bloque alineado a 16 bytes. Los sonidos se guardan como muestras
+    PCM en el formato del mezclador, que queda anotado en el índice.
+
+    Args:
+        entradas: Iterable de tuplas (nombre, (ancho, alto), pixeles).
+        sonidos: Iterable de tuplas (ruta, muestras PCM).
+        mezclador: Tupla de `pygame.mixer.get_init()` con la que se
+        decodificaron los sonidos.
+
+    Returns:
+        bytes: Contenido completo del paquete.
+    """
+    indice = {}
+    bloques = []
+    offset = 0
+
+    def agregar(clave, datos, ancho, alto):
+        nonlocal offset
+        relleno = -offset % ALINEACION
+        if relleno:
+            bloques.append(b"\0" * relleno)
+            offset += relleno
+        indice[clave] = [offset, ancho, alto]
+        bloques.append(datos)
+        offset += len(datos)
+
+    for nombre, tamanio, pixeles in entradas:
+        agregar(_clave(nombre, tamanio), pixeles, tamanio[0], tamanio[1])
+    for ruta, muestras in sonidos:
+        agregar(_clave_sonido(ruta), muestras, len(muestras), 0)
+    if mezclador is not None:
+        indice[_CLAVE_MEZCLADOR] = list(mezclador)
+
+    indice_json = json.dumps(indice, separators=(",", ":")).encode("utf-8")
+    inicio_datos = _CABECERA.size + len(indice_json)
+    relleno = -inicio_datos % ALINEACION
+    indice_json += b" " * relleno
+
+    cabecera = _CABECERA.pack(MAGIA, VERSION, len(indice_json))
+    return cabecera + indice_json + b"".join(bloques)
+
+
+class PaqueteAssets:
+    """Paquete de imágenes pre-escaladas leído sin copiar los píxeles.
+
+    Las superficies se crean con `pygame.image.frombuffer` apuntando
+    directamente al buffer del paquete, que suele ser un archivo
+    mapeado en memoria. Varias instancias del juego que abren el mismo
+    paquete comparten las páginas a través del sistema operativo.
+
+    Las superficies devueltas son de solo lectura: se pueden usar como
+    origen de un blit, pero nunca se debe dibujar sobre ellas.
+
+    El mismo formato se puede publicar en un bloque de
+    `multiprocessing.shared_memory` con `publicar_paquete`, para que un
+    proceso servidor decodifique una sola vez y las instancias del juego
+    lo abran con `desde_memoria_compartida`.
+
+    Attributes:
+        indice: Diccionario clave -> [offset, ancho, alto].
+    """
+
+    def __init__(self, buffer):
+        """Interpreta un paquete a partir de un buffer.
+
+        Args:
+            buffer: Objeto que soporte el protocolo de buffer con el
+            contenido generado por `serializar_paquete`.
+
+        Raises:
+            ValueError: Si el buffer no es un paquete válido.
+        """
+        self._buffer = buffer
+        self._vista = memoryview(buffer)
+        if len(self._vista) < _CABECERA.size:
+            raise ValueError("Paquete de assets truncado")
+        magia, version, largo_indice = _CABECERA.unpack_from(self._vista, 0)
+        if magia != MAGIA or version != VERSION:
+            raise ValueError("El archivo no es un paquete de assets válido")
+
+        inicio = _CABECERA.size
+        self.indice = json.loads(bytes(self._vista[inicio : inicio + largo_indice]))
+        self._inicio_datos = inicio + largo_indice
+
+    @classmethod
+    def abrir(cls, ruta: str) -> "PaqueteAssets":
+        """Abre un paquete desde disco mapeándolo en memoria.
+
+        Args:
+            ruta: Ruta al archivo de paquete.
+
+        Returns:
+            PaqueteAssets: Paquete listo para usar.
+        """
+        with open(ruta, "rb") as archivo:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapa)
+
+    @classmethod
+    def desde_memoria_compartida(cls, nombre: str) -> "PaqueteAssets":
+        """Abre un paquete publicado por otro proceso con `publicar_paquete`.
+
+        Args:
+            nombre: Nombre del bloque de memoria compartida.
+
+        Returns:
+            PaqueteAssets: Paquete listo para usar.
+
+        Raises:
+            FileNotFoundError: Si no hay un bloque con ese nombre.
+            ValueError: Si el bloque no es un paquete válido.
+        """
+        memoria = shared_memory.SharedMemory(name=nombre)
+        if os.name != "posix":
+            # En Windows no hay descriptor ni rastreador de recursos: el
+            # paquete usa el buffer del bloque y lo mantiene abierto
+            # mientras viva.
+            paquete = cls(memoria.buf)
+            paquete._memoria = memoria
+            return paquete
+        try:
+            # Hasta Python 3.12 el proceso que se conecta también registra
+            # el bloque y lo borraría al terminar; lo borra el servidor.
+            resource_tracker.unregister(memoria._name, "shared_memory")
+            # Un mapeo propio de solo lectura: `SharedMemory` no se puede
+            # cerrar mientras haya superficies sobre su buffer, y fallaría
+            # al destruirse al salir.
+            mapa = mmap.mmap(memoria._fd, memoria.size, access=mmap.ACCESS_READ)
+        finally:
+            memoria.close()
+        return cls(mapa)
+
+    def __len__(self):
+        return len(self.indice)
+
+    def __contains__(self, clave):
+        nombre, tamanio = clave
+        return _clave(nombre, tamanio) in self.indice
+
+    def superficie(self, nombre: str, tamanio: tuple):
+        """Crea una superficie sobre los píxeles de una imagen del paquete.
+
+        Args:
+            nombre: Nombre del archivo de imagen original.
+            tamanio: Tupla (ancho, alto) de la versión escalada.
+
+        Returns:
+            pygame.Surface: Superficie sin copia de píxeles, o None si
+            la imagen no está en el paquete.
+        """
+        resultado = None
+        entrada = self.indice.get(_clave(nombre, tamanio))
+        if entrada is not None:
+            offset, ancho, alto = entrada
+            inicio = self._inicio_datos + offset
+            pixeles = self._vista[inicio : inicio + ancho * alto * 4]
+            resultado = pygame.image.frombuffer(pixeles, (ancho, alto), FORMATO_PIXELES)
+        return resultado
+
+    def sonido(self, ruta: str):
+        """Devuelve las muestras PCM de un sonido del paquete.
+
+        Args:
+            ruta: Ruta del archivo de sonido original.
+
+        Returns:
+            memoryview: Muestras en el formato del mezclador, o None si
+            el sonido no está o se decodificó para un mezclador con otro
+            formato que el actual.
+        """
+        entrada = self.indice.get(_clave_sonido(ruta))
+        mezclador = self.indice.get(_CLAVE_MEZCLADOR)
+        if entrada is None or mezclador != list(pygame.mixer.get_init() or ()):
+            return None
+        offset, largo, _ = entrada
+        inicio = self._inicio_datos + offset
+        return self._vista[inicio : inicio + largo]
+
+
+def publicar_paquete(contenido: bytes, nombre: str):
+    """Copia un paquete a un bloque nuevo de memoria compartida.
+
+    Si quedó un bloque con el mismo nombre de una ejecución anterior
+    que terminó mal, se reemplaza.
+
+    Args:
+        contenido: Paquete generado por `serializar_paquete`.
+        nombre: Nombre del bloque.
+
+    Returns:
+        shared_memory.SharedMemory: Bloque creado. Quien lo publica debe
+        mantenerlo abierto mientras haya instancias y llamar a `unlink`
+        al terminar.
+    """
+    try:
+        memoria = shared_memory.SharedMemory(
+            name=nombre, create=True, size=len(contenido)
+        )
+    except FileExistsError:
+        anterior = shared_memory.SharedMemory(name=nombre)
+        anterior.close()
+        anterior.unlink()
+        memoria = shared_memory.SharedMemory(
+            name=nombre, create=True, size=len(contenido)
+        )
+    memoria.buf[: len(contenido)] = contenido
+    return memoria
@@ -0,0 +1,172 @@
+import atexit
+import queue
+import threading
+import time
+
+_FIN = object()
+
+
+class EscritorResultados:
+    """Escritor en segundo plano de los resultados de cada partida.
+
+    Las estadísticas se encolan desde el hilo principal y un hilo
+    aparte las agrupa en lotes y las agrega al historial, de modo que
+    el cuadro de victoria o derrota no espera al disco.
+
+    Attributes:
+        historial: `HistorialResultados` donde se escriben.
+        cola: Cola acotada con los resultados pendientes de escribir.
+        lotes_escritos: Cantidad de escrituras realizadas.
+        registros_escritos: Cantidad de resultados escritos.
+        errores: Cantidad de lotes que fallaron al escribirse.
+        errores_al_escribir: Cantidad de veces que falló `al_escribir`.
+        descartados: Resultados descartados porque la cola estaba llena.
+        profundidad_maxima: Mayor cantidad de pendientes observada.
+        latencia_ultima: Duración en segundos de la última escritura.
+        latencia_maxima: Duración en segundos de la escritura más lenta.
+        latencia_total: Suma de las duraciones de todas las escrituras.
+    """
+
+    def __init__(
+        self, historial, capacidad: int, maximo_lote: int = 16, al_escribir=None
+    ):
+        """Crea la cola e inicia el hilo escritor.
+
+        Args:
+            historial: `HistorialResultados` donde se escriben.
+            capacidad: Cantidad máxima de resultados pendientes. Al
+            llenarse, `encolar` descarta el resultado en lugar de
+            bloquear el juego.
+            maximo_lote: Cantidad máxima de resultados por escritura.
+            al_escribir: Función opcional que recibe cada lote una vez
+            escrito. Se ejecuta en el hilo escritor.
+        """
+        self.historial = historial
+        self.cola = queue.Queue(maxsize=capacidad)
+        self.maximo_lote = maximo_lote
+        self.al_escribir = al_escribir
+
+        self.lotes_escritos = 0
+        self.registros_escritos = 0
+        self.errores = 0
+        self.errores_al_escribir = 0
+        self.descartados = 0
+        self.profundidad_maxima = 0
+        self.latencia_ultima = 0.0
+        self.latencia_maxima = 0.0
+        self.latencia_total = 0.0
+
+        self._cerrado = False
+        self._hilo = threading.Thread(
+            target=self._bucle, name="escritor-resultados", daemon=True
+        )
+        self._hilo.start()
+        atexit.register(self.cerrar)
+
+    def encolar(self, datos: dict):
+        """Agrega un resultado a la cola de escritura, sin bloquear.
+
+        Si la cola está llena (el hilo escritor no da abasto o está
+        trabado) el resultado se descarta y se cuenta en `descartados`.
+
+        Args:
+            datos: Diccionario con las estadísticas a guardar.
+        """
+        try:
+            self.cola.put_nowait(datos)
+        except queue.Full:
+            self.descartados += 1
+            print("ERROR: Cola de resultados llena, se descarta un resultado.")
+            return
+        self.profundidad_maxima = max(self.profundidad_maxima, self.cola.qsize())
+
+    def cerrar(self, timeout=5.0):
+        """Escribe los resultados pendientes y detiene el hilo.
+
+        Es seguro llamarlo más de una vez.
+
+        Args:
+            timeout: Segundos máximos a esperar que termine el hilo.
+        """
+        if not self._cerrado:
+            self._cerrado = True
+            try:
+                self.cola.put(_FIN, timeout=timeout)
+            except queue.Full:
+                return
+            self._hilo.join(timeout)
+
+    def metricas(self) -> dict:
+        """Devuelve las métricas de la cola y de las escrituras.
+
+        Returns:
+            dict: Profundidad actual y máxima de la cola, cantidad de
+            lotes, registros, errores y descartados, y latencias de
+            escritura en ms.
+        """
+        promedio = (
+            self.latencia_total / self.lotes_escritos if self.lotes_escritos else 0
+        )
+        return {
+            "profundidad": self.cola.qsize(),
+            "profundidad_maxima": self.profundidad_maxima,
+            "lotes": self.lotes_escritos,
+            "registros": self.registros_escritos,
+            "errores": self.errores,
+            "errores_al_escribir": self.errores_al_escribir,
+            "descartados": self.descartados,
+            "latencia_ultima_ms": self.latencia_ultima * 1000,
+            "latencia_maxima_ms": self.latencia_maxima * 1000,
+            "latencia_promedio_ms": promedio * 1000,
+        }
+
+    def _bucle(self):
+        """Toma resultados de la cola y los escribe en lotes."""
+        terminar = False
+        while not terminar:
+            lote = []
+            elemento = self.cola.get()
+            while elemento is not _FIN:
+                lote.append(elemento)
+                if len(lote) >= self.maximo_lote:
+                    break
+                try:
+                    elemento = self.cola.get_nowait()
+                except queue.Empty:
+                    break
+            terminar = elemento is _FIN
+
+            if lote:
+                self._escribir(lote)
+
+    def _escribir(self, lote: list):
+        """Escribe un lote al historial y registra la latencia.
+
+        Cualquier error de la escritura o de `al_escribir` se informa y
+        se cuenta, sin detener el hilo: si muriera, la cola se llenaría
+        y los resultados siguientes se perderían.
+
+        Args:
+            lote: Lista de diccionarios con estadísticas.
+        """
+        inicio = time.perf_counter()
+        try:
+            self.historial.agregar(lote)
+        except Exception as error:
+            self.errores += 1
+            print(f"ERROR: No se pudieron guardar {len(lote)} resultados: {error}")
+            return
+        duracion = time.perf_counter() - inicio
+        self.lotes_escritos += 1
+        self.registros_escritos += len(lote)
+        self.latencia_ultima = duracion
+        self.latencia_maxima = max(self.latencia_maxima, duracion)
+        self.latencia_total += duracion
+        if self.al_escribir is not None:
+            try:
+                self.al_escribir(lote)
+            except Exception as error:
+                self.errores_al_escribir += 1
+                print(
+                    f"ERROR: Falló el procesamiento de {len(lote)} resultados: {error}"
+                )
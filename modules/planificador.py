@@ -0,0 +1,359 @@
+import heapq
+import itertools
+import time
+
+
+class Reloj:
+    """Reloj monótono en milisegundos que se puede pausar.
+
+    `ahora` devuelve el tiempo de juego, que no avanza mientras el
+    reloj está pausado. `real` devuelve el tiempo monótono sin pausas,
+    útil para medir intervalos de la aplicación (cuadros, guardados).
+
+    Attributes:
+        pausado: Indica si el tiempo de juego está detenido.
+    """
+
+    def __init__(self, fuente=time.monotonic):
+        """Crea el reloj.
+
+        Args:
+            fuente: Función que devuelve segundos monótonos. Se puede
+            reemplazar para controlar el tiempo desde afuera.
+        """
+        self._fuente = fuente
+        self._pausado_desde = None
+        self._tiempo_pausado = 0
+
+    def real(self) -> int:
+        """Devuelve el tiempo monótono en milisegundos, sin descontar pausas."""
+        return int(self._fuente() * 1000)
+
+    def ahora(self) -> int:
+        """Devuelve el tiempo de juego en milisegundos."""
+        referencia = self._pausado_desde
+        if referencia is None:
+            referencia = self.real()
+        return referencia - self._tiempo_pausado
+
+    @property
+    def pausado(self) -> bool:
+        return self._pausado_desde is not None
+
+    def pausar(self):
+        """Detiene el tiempo de juego. No hace nada si ya estaba pausado."""
+        if self._pausado_desde is None:
+            self._pausado_desde = self.real()
+
+    def reanudar(self):
+        """Reanuda el tiempo de juego. No hace nada si no estaba pausado."""
+        if self._pausado_desde is not None:
+            self._tiempo_pausado += self.real() - self._pausado_desde
+            self._pausado_desde = None
+
+
+class Tarea:
+    """Llamada programada en un `Planificador`.
+
+    Attributes:
+        instante: Tiempo de juego (ms) en el que vence.
+        funcion: Función a llamar al vencer.
+        argumentos: Argumentos posicionales de la llamada.
+        intervalo: Período en ms si la tarea se repite, o None.
+        activa: False si ya se ejecutó (sin repetición) o se canceló.
+    """
+
+    __slots__ = ("instante", "funcion", "argumentos", "intervalo", "activa")
+
+    def __init__(self, instante, funcion, argumentos, intervalo):
+        self.instante = instante
+        self.funcion = funcion
+        self.argumentos = argumentos
+        self.intervalo = intervalo
+        self.activa = True
+
+
+class Planificador:
+    """Cola de prioridad de tareas ordenadas por vencimiento.
+
+    Las tareas se guardan en un heap, así que consultar el próximo
+    vencimiento es O(1) y programar o ejecutar una tarea es O(log n),
+    sin recorrer timers que todavía no vencieron. Cancelar solo marca
+    la tarea; se descarta cuando llega al frente del heap.
+
+    Usa el tiempo de juego del `Reloj`, por lo que las tareas no
+    avanzan mientras el juego está pausado.
+    """
+
+    def __init__(self, reloj: Reloj):
+        """Crea un planificador vacío.
+
+        Args:
+            reloj: Reloj del que se toma el tiempo de juego.
+        """
+        self.reloj = reloj
+        self._cola = []
+        self._secuencia = itertools.count()
+
+    def __len__(self):
+        return sum(1 for _, _, tarea in self._cola if tarea.activa)
+
+    def programar(self, retraso: int, funcion, *argumentos, intervalo=None) -> Tarea:
+        """Programa una llamada dentro de `retraso` milisegundos.
+
+        Args:
+            retraso: Milisegundos de juego hasta el vencimiento.
+            funcion: Función a llamar.
+            *argumentos: Argumentos de la llamada.
+            intervalo: Si se indica, la tarea se repite cada
+            `intervalo` milisegundos hasta cancelarla.
+
+        Returns:
+            Tarea: La tarea programada, para cancelarla o consultarla.
+        """
+        tarea = Tarea(self.reloj.ahora() + retraso, funcion, argumentos, intervalo)
+        self._encolar(tarea)
+        return tarea
+
+    def _encolar(self, tarea: Tarea):
+        heapq.heappush(self._cola, (tarea.instante, next(self._secuencia), tarea))
+
+    def cancelar(self, tarea):
+        """Cancela una tarea. Acepta None o tareas ya vencidas."""
+        if tarea is not None:
+            tarea.activa = False
+
+    def limpiar(self):
+        """Cancela todas las tareas pendientes."""
+        for _, _, tarea in self._cola:
+            tarea.activa = False
+        self._cola = []
+
+    def restante(self, tarea) -> int:
+        """Devuelve los milisegundos que faltan para que venza una tarea.
+
+        Returns:
+            int: Milisegundos restantes, o 0 si la tarea es None, ya se
+            ejecutó o fue cancelada.
+        """
+        resultado = 0
+        if tarea is not None and tarea.activa:
+            resultado = max(0, tarea.instante - self.reloj.ahora())
+        return resultado
+
+    def proximo_vencimiento(self):
+        """Devuelve el instante de la próxima tarea activa, o None."""
+        while self._cola and not self._cola[0][2].activa:
+            heapq.heappop(self._cola)
+        return self._cola[0][0] if self._cola else None
+
+    def hasta_proximo(self, maximo: int) -> int:
+        """Milisegundos de juego hasta la próxima tarea, como mucho `maximo`.
+
+        Mientras el reloj está pausado las tareas no vencen, así que se
+        devuelve `maximo`.
+        """
+        proximo = self.proximo_vencimiento()
+        espera = maximo
+        if proximo is not None and not self.reloj.pausado:
+            espera = min(maximo, max(0, proximo - self.reloj.ahora()))
+        return espera
+
+    def ejecutar_vencidas(self) -> int:
+        """Ejecuta en orden todas las tareas vencidas.
+
+        Las tareas que se programan durante la ejecución con retraso 0
+        también se ejecutan en esta misma llamada.
+
+        Returns:
+            int: Cantidad de tareas ejecutadas.
+        """
+        ahora = self.reloj.ahora()
+        ejecutadas = 0
+        while self._cola and self._cola[0][0] <= ahora:
+            _, _, tarea = heapq.heappop(self._cola)
+            if tarea.activa:
+                if tarea.intervalo:
+                    tarea.instante += tarea.intervalo
+                    self._encolar(tarea)
+                else:
+                    tarea.activa = False
+                tarea.funcion(*tarea.argumentos)
+                ejecutadas += 1
+        return ejecutadas
+
+
+class PasoFijo:
+    """Acumulador de tiempo para actualizar la lógica a paso fijo.
+
+    La lógica avanza en pasos de `paso` milisegundos independientemente
+    de los cuadros por segundo: a más FPS, menos pasos por cuadro. Si el
+    bucle se atrasa demasiado se ejecutan como mucho `maximo_pasos` y
+    se descarta el resto, para no entrar en una espiral de atraso.
+    """
+
+    def __init__(self, reloj: Reloj, paso: int, maximo_pasos: int = 5):
+        """Crea el acumulador.
+
+        Args:
+            reloj: Reloj del que se toma el tiempo real.
+            paso: Duración de cada paso en milisegundos.
+            maximo_pasos: Pasos máximos a ejecutar por llamada.
+        """
+        self.reloj = reloj
+        self.paso = paso
+        self.maximo_pasos = maximo_pasos
+        self._ultimo = reloj.real()
+        self._acumulado = 0
+
+    def pasos(self) -> int:
+        """Devuelve cuántos pasos de lógica corresponde ejecutar ahora."""
+        ahora = self.reloj.real()
+        self._acumulado += ahora - self._ultimo
+        self._ultimo = ahora
+        cantidad = self._acumulado // self.paso
+        if cantidad > self.maximo_pasos:
+            cantidad = self.maximo_pasos
+            self._acumulado = 0
+        else:
+            self._acumulado -= cantidad * self.paso
+        return cantidad
+
+
+class GobernadorCuadros:
+    """Elige los cuadros por segundo del bucle según la pantalla y la máquina.
+
+    Cada pantalla tiene dos presupuestos: uno mientras hay algo que
+    mostrar enseguida (entrada reciente, error o pista en pantalla,
+    transición) y otro en reposo, cuando a lo sumo cambia el reloj. Así
+    el bucle solo corre a la tasa máxima cuando hace falta; entre
+    cuadros espera con `pygame.event.wait`, que despierta apenas llega
+    un evento, de modo que la latencia de la entrada no depende de la
+    tasa elegida.
+
+    Además mide el costo de los cuadros dibujados (promedio móvil) y,
+    si no entra en `uso` del período de la tasa, baja el tope a un
+    escalón más lento, sin pasar de `minimo`; lo vuelve a subir cuando
+    el costo deja margen. Un cuadro que tarda más que su período cuenta
+    como perdido.
+
+    Attributes:
+        presupuestos: Diccionario pantalla -> (fps activa, fps en reposo).
+        maximo: Tasa máxima del bucle.
+        minimo: Tasa por debajo de la cual no baja el tope adaptativo.
+        tope: Tasa máxima que soporta la máquina, según lo medido.
+        costo: Promedio móvil del trabajo de un cuadro dibujado, en ms.
+        trazar: Imprime por consola cada cambio de tasa.
+    """
+
+    ESCALONES = (60, 30, 20, 15, 12, 10, 6, 5, 4, 3, 2, 1)
+
+    def __init__(
+        self,
+        presupuestos: dict,
+        maximo: int = 60,
+        minimo: int = 15,
+        uso: float = 0.75,
+        suavizado: float = 0.1,
+        trazar: bool = False,
+    ):
+        """Crea el gobernador.
+
+        Args:
+            presupuestos: Diccionario pantalla -> (fps activa, fps en
+            reposo). Las pantallas que no figuran usan `maximo`.
+            maximo: Tasa máxima del bucle.
+            minimo: Piso del tope adaptativo.
+            uso: Fracción del período que puede ocupar un cuadro.
+            suavizado: Peso de cada cuadro nuevo en el promedio móvil.
+            trazar: Imprime por consola cada cambio de tasa.
+        """
+        self.presupuestos = presupuestos
+        self.maximo = maximo
+        self.minimo = min(minimo, maximo)
+        self.uso = uso
+        self.suavizado = suavizado
+        self.trazar = trazar
+        self.tope = maximo
+        self.costo = 0.0
+        self._escalones = sorted(
+            {e for e in self.ESCALONES if self.minimo <= e < maximo} | {maximo},
+            reverse=True,
+        )
+        self._elegidos = {}
+        self._cuadros = {}
+        self._perdidos = {}
+
+    def fps(self, pantalla: str, activa: bool) -> int:
+        """Devuelve la tasa para `pantalla`, limitada por el tope actual."""
+        activa_fps, reposo_fps = self.presupuestos.get(
+            pantalla, (self.maximo, self.maximo)
+        )
+        objetivo = activa_fps if activa else reposo_fps
+        return max(1, min(objetivo, self.tope))
+
+    def cuadro(
+        self, pantalla: str, activa: bool, trabajo_ms: float, dibujado: bool
+    ) -> int:
+        """Registra un cuadro terminado y calcula la espera hasta el próximo.
+
+        Args:
+            pantalla: Nombre de la pantalla activa.
+            activa: Si hay algo que mostrar enseguida en la pantalla.
+            trabajo_ms: Tiempo de trabajo del cuadro, sin la espera.
+            dibujado: Si el cuadro se dibujó o se reutilizó el anterior.
+
+        Returns:
+            int: Milisegundos a esperar antes del próximo cuadro.
+        """
+        if dibujado:
+            self.costo += (trabajo_ms - self.costo) * self.suavizado
+            self._adaptar()
+        fps = self.fps(pantalla, activa)
+        if self.trazar and self._elegidos.get(pantalla) != fps:
+            print(f"[fps] {pantalla}: {fps} (tope {self.tope})")
+        self._elegidos[pantalla] = fps
+        self._cuadros[pantalla] = self._cuadros.get(pantalla, 0) + 1
+        periodo = 1000 / fps
+        if trabajo_ms > periodo:
+            perdidos = int(trabajo_ms // periodo)
+            self._perdidos[pantalla] = self._perdidos.get(pantalla, 0) + perdidos
+        return max(0, int(periodo - trabajo_ms))
+
+    def _adaptar(self):
+        """Mueve el tope un escalón según el costo medido."""
+        posicion = self._escalones.index(self.tope)
+        if self.costo > self.uso * 1000 / self.tope:
+            if posicion + 1 < len(self._escalones):
+                self.tope = self._escalones[posicion + 1]
+        elif posicion > 0:
+            # Sube con margen, para no oscilar entre dos escalones.
+            siguiente = self._escalones[posicion - 1]
+            if self.costo < 0.8 * self.uso * 1000 / siguiente:
+                self.tope = siguiente
+
+    def estadisticas(self) -> dict:
+        """Devuelve las tasas elegidas y los cuadros perdidos.
+
+        Se llama desde el hilo exportador de métricas mientras el bucle
+        principal sigue contando, así que recorre una copia de los
+        diccionarios.
+
+        Returns:
+            dict: Con "tope", "costo_ms" y "pantallas", un diccionario
+            pantalla -> {"fps", "cuadros", "perdidos"}.
+        """
+        cuadros = dict(self._cuadros)
+        perdidos = dict(self._perdidos)
+        return {
+            "tope": self.tope,
+            "costo_ms": self.costo,
+            "pantallas": {
+                pantalla: {
+                    "fps": fps,
+                    "cuadros": cuadros.get(pantalla, 0),
+                    "perdidos": perdidos.get(pantalla, 0),
+                }
+                for pantalla, fps in list(self._elegidos.items())
+            },
+        }
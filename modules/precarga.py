@@ -0,0 +1,107 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from modules.utilidades import (
+    directorio_imagenes,
+    imagen_disponible,
+    registrar_imagen,
+)
+
+
+def _decodificar(nombre: str, tamanios: tuple) -> list:
+    """Decodifica y escala una imagen en un hilo del pool.
+
+    No convierte al formato de pantalla: eso se hace en el hilo
+    principal en `PrecargaImagenes.avanzar`.
+
+    Returns:
+        list: Tuplas (tamaño, superficie escalada), o lista vacía si
+        la imagen no se pudo leer.
+    """
+    escaladas = []
+    try:
+        imagen = pygame.image.load(os.path.join(directorio_imagenes(), nombre))
+    except (pygame.error, OSError):
+        imagen = None
+    if imagen is not None:
+        for tamanio in tamanios:
+            escaladas.append((tamanio, pygame.transform.scale(imagen, tamanio)))
+    return escaladas
+
+
+class PrecargaImagenes:
+    """Precarga anticipada de imágenes del catálogo en un pool de hilos.
+
+    Los hilos decodifican y escalan; el hilo principal llama a
+    `avanzar` en cada cuadro para convertir al formato de pantalla las
+    imágenes ya listas y dejarlas en la caché de `cargar_imagen`. Solo
+    se precargan las imágenes que entran en `limite_bytes`, para no
+    llenar la caché con imágenes que se descartarían antes de usarse.
+
+    Attributes:
+        total: Cantidad de imágenes a precargar.
+        listas: Cantidad de imágenes ya registradas en la caché.
+    """
+
+    def __init__(
+        self, nombres, tamanios: tuple, hilos: int = None, limite_bytes: int = None
+    ):
+        """Inicia la decodificación de las imágenes que no estén disponibles.
+
+        Args:
+            nombres: Nombres de archivo de las imágenes.
+            tamanios: Tamaños a los que se escala cada imagen.
+            hilos: Cantidad de hilos del pool (None: según los núcleos).
+            limite_bytes: Bytes de píxeles máximos a precargar, o None
+            para precargar todas.
+        """
+        pendientes = [
+            nombre
+            for nombre in sorted(nombres)
+            if not all(imagen_disponible(nombre, t) for t in tamanios)
+        ]
+        if limite_bytes is not None:
+            # Superficies de 32 bits, como las deja `convert_alpha`.
+            por_imagen = sum(ancho * alto * 4 for ancho, alto in tamanios)
+            pendientes = pendientes[: limite_bytes // max(1, por_imagen)]
+        self.total = len(pendientes)
+        self.listas = 0
+        self._pool = ThreadPoolExecutor(
+            max_workers=hilos, thread_name_prefix="precarga"
+        )
+        self._futuros = [
+            (nombre, self._pool.submit(_decodificar, nombre, tamanios))
+            for nombre in pendientes
+        ]
+        self._pool.shutdown(wait=False)
+
+    @property
+    def progreso(self) -> float:
+        """Fracción de imágenes ya disponibles, entre 0.0 y 1.0."""
+        return self.listas / self.total if self.total else 1.0
+
+    @property
+    def terminada(self) -> bool:
+        """Indica si todas las imágenes quedaron en la caché."""
+        return self.listas >= self.total
+
+    def avanzar(self, maximo: int = 8):
+        """Registra en la caché las imágenes que ya terminaron de decodificarse.
+
+        Se llama desde el hilo principal. Convierte como mucho `maximo`
+        imágenes por llamada para no demorar el cuadro actual.
+
+        Args:
+            maximo: Cantidad máxima de imágenes a convertir.
+        """
+        procesadas = 0
+        restantes = []
+        for nombre, futuro in self._futuros:
+            if procesadas < maximo and futuro.done():
+                for tamanio, superficie in futuro.result():
+                    registrar_imagen(nombre, tamanio, superficie.convert_alpha())
+                self.listas += 1
+                procesadas += 1
+            else:
+                restantes.append((nombre, futuro))
+        self._futuros = restantes
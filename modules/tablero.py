@@ -0,0 +1,293 @@
+import random
+import pygame
+from modules.config import MARGEN, MODOS_TABLERO, TAMANIO_GRUPO
+
+
+class DisposicionTablero:
+    """Geometría del tablero para una cantidad de filas y columnas.
+
+    Calcula una sola vez el lado de las cartas, los tamaños de imagen y
+    la ubicación de las filas del panel de completadas. Los rectángulos
+    de la grilla se arman al cambiar el alto del panel y se reutilizan
+    entre cuadros, y la carta bajo el mouse se obtiene con aritmética,
+    sin recorrer el tablero.
+
+    Attributes:
+        filas: Filas de la grilla.
+        columnas: Columnas de la grilla.
+        tamanio_grupo: Cartas por grupo (categoría).
+        carta: Lado de cada carta en píxeles.
+        margen: Separación entre cartas en píxeles.
+        cartas: Cantidad de cartas del tablero completo.
+        grupos: Cantidad de grupos del tablero completo.
+        alto_fila_panel: Alto de cada fila del panel de completadas.
+        grupos_por_fila_panel: Grupos que entran en una fila del panel.
+        tamanio_imagen_carta: Tamaño de las imágenes en las cartas.
+        tamanio_imagen_completada: Tamaño de las imágenes en el panel.
+        y_grilla: Coordenada y de la primera fila de la grilla.
+    """
+
+    X_GRILLA = 100
+    Y_PANEL = 50
+    SEPARACION_PANEL = 20
+
+    def __init__(
+        self,
+        filas: int,
+        columnas: int,
+        carta: int,
+        margen: int = MARGEN,
+        tamanio_grupo: int = TAMANIO_GRUPO,
+    ):
+        """Calcula la geometría del tablero.
+
+        Args:
+            filas: Filas de la grilla.
+            columnas: Columnas de la grilla.
+            carta: Lado de cada carta en píxeles.
+            margen: Separación entre cartas en píxeles.
+            tamanio_grupo: Cartas por grupo.
+        """
+        self.filas = filas
+        self.columnas = columnas
+        self.tamanio_grupo = tamanio_grupo
+        self.carta = carta
+        self.margen = margen
+        self.cartas = filas * columnas
+        self.grupos = self.cartas // tamanio_grupo
+
+        self._celda = carta + margen
+        # Cada fila del panel libera al menos una fila de la grilla, así
+        # que panel y grilla juntos nunca superan filas + 1 celdas.
+        self.alto_fila_panel = min(carta // 2 + 50, self._celda)
+        self.grupos_por_fila_panel = -(-columnas // tamanio_grupo)
+        self.ancho_grupo_panel = tamanio_grupo * self._celda
+
+        self.tamanio_imagen_carta = (carta - 10, carta - 10)
+        lado = max(carta - 40, carta // 2)
+        self.tamanio_imagen_completada = (lado, lado)
+
+        self.y_grilla = None
+        self._rects = []
+
+    @classmethod
+    def desde_modo(cls, modo: str) -> "DisposicionTablero":
+        """Crea la disposición de un modo de `MODOS_TABLERO`.
+
+        Raises:
+            KeyError: Si el modo no existe.
+        """
+        filas, columnas, carta, margen = MODOS_TABLERO[modo]
+        return cls(filas, columnas, carta, margen)
+
+    @property
+    def tamanios_imagen(self) -> tuple:
+        """Tamaños a los que se escalan las imágenes en este tablero."""
+        return (self.tamanio_imagen_carta, self.tamanio_imagen_completada)
+
+    def alto_panel(self, grupos: int) -> int:
+        """Alto del panel de completadas con `grupos` grupos."""
+        filas = -(-grupos // self.grupos_por_fila_panel)
+        return filas * self.alto_fila_panel
+
+    def posicion_panel(self, indice: int) -> tuple:
+        """Esquina superior izquierda del grupo número `indice` en el panel,
+        relativa al panel.
+        """
+        fila, columna = divmod(indice, self.grupos_por_fila_panel)
+        x = self.X_GRILLA + columna * self.ancho_grupo_panel
+        return x, fila * self.alto_fila_panel
+
+    def ubicar(self, y_grilla: int) -> list:
+        """Ubica la grilla debajo del panel y devuelve sus rectángulos.
+
+        Los rectángulos solo se recalculan si cambió `y_grilla`.
+
+        Args:
+            y_grilla: Coordenada y de la primera fila de la grilla.
+
+        Returns:
+            list: Un pygame.Rect por posición de la grilla, por filas.
+        """
+        if y_grilla != self.y_grilla:
+            self.y_grilla = y_grilla
+            self._rects = [
+                pygame.Rect(
+                    self.X_GRILLA + columna * self._celda,
+                    y_grilla + fila * self._celda,
+                    self.carta,
+                    self.carta,
+                )
+                for fila in range(self.filas)
+                for columna in range(self.columnas)
+            ]
+        return self._rects
+
+    def indice_en(self, pos: tuple, cantidad: int):
+        """Devuelve la posición de la grilla bajo `pos`, en O(1).
+
+        Args:
+            pos: Tupla (x, y) en pantalla.
+            cantidad: Cartas que hay en el tablero.
+
+        Returns:
+            int: Índice de la carta, o None si `pos` cae en un margen,
+            fuera de la grilla o en una posición vacía.
+        """
+        if self.y_grilla is None:
+            return None
+        dx = pos[0] - self.X_GRILLA
+        dy = pos[1] - self.y_grilla
+        if dx < 0 or dy < 0:
+            return None
+        columna, resto_x = divmod(dx, self._celda)
+        fila, resto_y = divmod(dy, self._celda)
+        if columna >= self.columnas or resto_x >= self.carta or resto_y >= self.carta:
+            return None
+        indice = fila * self.columnas + columna
+        return indice if indice < cantidad else None
+
+
+class IndiceTablero:
+    """Índice por categoría de las cartas de un tablero y de la selección.
+
+    Se arma una vez por tablero y se actualiza con cada selección y cada
+    acierto, de modo que los comodines, la validación del grupo y el
+    resaltado de errores no recorren el tablero.
+
+    Attributes:
+        restantes: Diccionario categoría -> cartas que quedan en el
+        tablero, en el orden del tablero.
+        seleccionados: Cartas seleccionadas, en orden de selección.
+    """
+
+    def __init__(self, tablero=()):
+        """Crea el índice de un tablero.
+
+        Args:
+            tablero: Lista de cartas.
+        """
+        self.restantes = {}
+        self.seleccionados = []
+        self._ids_seleccionados = set()
+        self._conteo_seleccion = {}
+        self.reconstruir(tablero)
+
+    def reconstruir(self, tablero):
+        """Vuelve a indexar un tablero nuevo y vacía la selección."""
+        self.restantes = {}
+        for carta in tablero:
+            self.restantes.setdefault(carta["categoria"], []).append(carta)
+        self.limpiar_seleccion()
+
+    def quitar_grupo(self, grupo):
+        """Quita del índice las cartas de un grupo acertado."""
+        ids = {carta["id"] for carta in grupo}
+        for categoria in {carta["categoria"] for carta in grupo}:
+            quedan = [c for c in self.restantes[categoria] if c["id"] not in ids]
+            if quedan:
+                self.restantes[categoria] = quedan
+            else:
+                del self.restantes[categoria]
+
+    def esta_seleccionada(self, carta) -> bool:
+        """Indica si una carta está seleccionada."""
+        return carta["id"] in self._ids_seleccionados
+
+    def seleccionar(self, carta):
+        """Agrega una carta al final de la selección."""
+        self.seleccionados.append(carta)
+        self._ids_seleccionados.add(carta["id"])
+        categoria = carta["categoria"]
+        self._conteo_seleccion[categoria] = self._conteo_seleccion.get(categoria, 0) + 1
+
+    def deseleccionar(self, carta):
+        """Quita una carta de la selección."""
+        self.seleccionados.remove(carta)
+        self._ids_seleccionados.discard(carta["id"])
+        categoria = carta["categoria"]
+        self._conteo_seleccion[categoria] -= 1
+        if not self._conteo_seleccion[categoria]:
+            del self._conteo_seleccion[categoria]
+
+    def limpiar_seleccion(self):
+        """Vacía la selección."""
+        self.seleccionados = []
+        self._ids_seleccionados = set()
+        self._conteo_seleccion = {}
+
+    def fijar_seleccion(self, cartas):
+        """Reemplaza la selección por `cartas`."""
+        self.limpiar_seleccion()
+        for carta in cartas:
+            self.seleccionar(carta)
+
+    def seleccion_valida(self) -> bool:
+        """Indica si la selección no está vacía y es de una sola categoría."""
+        return len(self._conteo_seleccion) == 1
+
+    def estado_carta(self, carta) -> str:
+        """Devuelve el estado visual de una carta.
+
+        Returns:
+            str: "normal" si no está seleccionada, "error" si está
+            seleccionada y no es de la categoría de la primera carta
+            seleccionada, o "seleccion" en otro caso.
+        """
+        estado = "normal"
+        if carta["id"] in self._ids_seleccionados:
+            estado = "seleccion"
+            if (
+                len(self._conteo_seleccion) > 1
+                and carta["categoria"] != self.seleccionados[0]["categoria"]
+            ):
+                estado = "error"
+        return estado
+
+    def categoria_mas_cercana(self):
+        """Devuelve la categoría con más cartas seleccionadas.
+
+        Returns:
+            str: Categoría más cercana a completarse, o None si no hay
+            nada seleccionado. Los empates se resuelven al azar.
+        """
+        if not self._conteo_seleccion:
+            return None
+        maximo = max(self._conteo_seleccion.values())
+        candidatas = [c for c, n in self._conteo_seleccion.items() if n == maximo]
+        return random.choice(candidatas)
+
+    def carta_pista(self):
+        """Elige la carta a señalar con el comodín de pista.
+
+        Señala una carta no seleccionada de la categoría más cercana a
+        completarse.
+
+        Returns:
+            dict: Carta elegida, o None si no hay cartas seleccionadas o
+            ya están todas las de esa categoría.
+        """
+        categoria = self.categoria_mas_cercana()
+        candidatas = []
+        if categoria is not None:
+            candidatas = [
+                c
+                for c in self.restantes[categoria]
+                if c["id"] not in self._ids_seleccionados
+            ]
+        return random.choice(candidatas) if candidatas else None
+
+    def par(self, cantidad: int = 2) -> list:
+        """Elige una categoría al azar y devuelve sus primeras cartas.
+
+        Args:
+            cantidad: Cantidad de cartas a devolver.
+
+        Returns:
+            list: Cartas de una misma categoría, o lista vacía si el
+            tablero está vacío.
+        """
+        if not self.restantes:
+            return []
+        categoria = random.choice(list(self.restantes))
+        return self.restantes[categoria][:cantidad]
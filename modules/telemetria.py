@@ -0,0 +1,225 @@
+import atexit
+import os
+import struct
+import threading
+import time
+
+# Tipos de registro.
+CLIC = 1
+ERROR = 2
+ACIERTO = 3
+COMODIN = 4
+PAUSA = 5
+NIVEL = 6
+
+TIPOS = {
+    CLIC: "clic",
+    ERROR: "error",
+    ACIERTO: "acierto",
+    COMODIN: "comodin",
+    PAUSA: "pausa",
+    NIVEL: "nivel",
+}
+COMODINES = {"pista": 1, "par": 2, "vida": 3}
+
+# Registro: ms desde el inicio de la sesión, tipo, nivel, dato corto y
+# dos datos enteros. El significado de los datos depende del tipo:
+#   CLIC: ms desde el clic anterior, id de carta o -1, 1 si se ignoró.
+#   ERROR: id de una carta del grupo equivocado, id de la primera, posición.
+#   ACIERTO: ms desde el inicio del nivel, id de la primera carta.
+#   COMODIN: id de la carta señalada o -1, código en `COMODINES`.
+#   PAUSA: duración en ms.
+#   NIVEL: vidas, 1 si es un reintento.
+FORMATO_REGISTRO = struct.Struct("<IBBHii")
+# Encabezado de segmento: firma, versión, tamaño de registro, reservado
+# e instante de inicio de la sesión (ms desde epoch).
+FORMATO_ENCABEZADO = struct.Struct("<4sBBHQ")
+FIRMA = b"TLM1"
+VERSION = 1
+
+
+class Telemetria:
+    """Telemetría de la sesión en un buffer circular binario preasignado.
+
+    `registrar` escribe un registro de tamaño fijo en el buffer con
+    `struct.pack_into`, sin reservar memoria ni tocar el disco. Un hilo
+    aparte vuelca periódicamente los registros pendientes a archivos de
+    segmento compactos, y rota de segmento al llegar a
+    `registros_por_segmento`. Si el buffer se llena antes del volcado,
+    los registros nuevos se descartan y se cuentan en `descartados`.
+
+    Solo el hilo principal escribe y solo el hilo de volcado lee, así
+    que alcanza con que cada uno avance su propio contador.
+
+    Attributes:
+        directorio: Carpeta donde se escriben los segmentos.
+        capacidad: Cantidad de registros del buffer.
+        registros: Cantidad de registros escritos en el buffer.
+        descartados: Registros descartados por buffer lleno.
+        volcados: Registros escritos a disco.
+        segmentos: Cantidad de segmentos creados.
+        errores: Cantidad de volcados que fallaron.
+    """
+
+    def __init__(
+        self,
+        directorio: str,
+        capacidad: int = 4096,
+        intervalo: float = 5.0,
+        registros_por_segmento: int = 65536,
+    ):
+        """Reserva el buffer e inicia el hilo de volcado.
+
+        Args:
+            directorio: Carpeta donde se escriben los segmentos.
+            capacidad: Cantidad de registros del buffer.
+            intervalo: Segundos entre volcados.
+            registros_por_segmento: Registros máximos por archivo.
+        """
+        self.directorio = directorio
+        self.capacidad = capacidad
+        self.intervalo = intervalo
+        self.registros_por_segmento = registros_por_segmento
+
+        self.registros = 0
+        self.descartados = 0
+        self.volcados = 0
+        self.segmentos = 0
+        self.errores = 0
+
+        self._buffer = bytearray(capacidad * FORMATO_REGISTRO.size)
+        self._vista = memoryview(self._buffer)
+        self._leidos = 0
+        self._inicio = time.monotonic()
+        self._inicio_epoch = int(time.time() * 1000)
+        self._segmento = None
+        self._en_segmento = 0
+
+        self._cerrado = False
+        self._despertar = threading.Event()
+        self._candado_volcado = threading.Lock()
+        self._hilo = threading.Thread(
+            target=self._bucle, name="volcado-telemetria", daemon=True
+        )
+        self._hilo.start()
+        atexit.register(self.cerrar)
+
+    def registrar(self, tipo: int, nivel: int = 0, a: int = 0, b: int = 0, c: int = 0):
+        """Agrega un registro al buffer. No bloquea ni reserva memoria.
+
+        Args:
+            tipo: Tipo de registro (CLIC, ERROR, ...).
+            nivel: Nivel en curso.
+            a: Primer dato entero.
+            b: Segundo dato entero.
+            c: Dato corto (0 a 65535).
+        """
+        pendientes = self.registros - self._leidos
+        if pendientes >= self.capacidad:
+            self.descartados += 1
+            return
+        instante = int((time.monotonic() - self._inicio) * 1000)
+        posicion = (self.registros % self.capacidad) * FORMATO_REGISTRO.size
+        FORMATO_REGISTRO.pack_into(
+            self._buffer, posicion, instante, tipo, nivel, c, a, b
+        )
+        self.registros += 1
+        if pendientes + 1 >= self.capacidad // 2:
+            self._despertar.set()
+
+    def volcar(self):
+        """Escribe a disco los registros pendientes del buffer."""
+        with self._candado_volcado:
+            hasta = self.registros
+            while self._leidos < hasta:
+                inicio = self._leidos % self.capacidad
+                cantidad = min(
+                    hasta - self._leidos,
+                    self.capacidad - inicio,
+                    self.registros_por_segmento - self._en_segmento,
+                )
+                tamanio = FORMATO_REGISTRO.size
+                datos = self._vista[inicio * tamanio : (inicio + cantidad) * tamanio]
+                try:
+                    self._escribir(datos, cantidad)
+                except OSError as error:
+                    self.errores += 1
+                    print(f"ERROR: No se pudo volcar la telemetría: {error}")
+                else:
+                    self.volcados += cantidad
+                self._leidos += cantidad
+
+    def _escribir(self, datos, cantidad: int):
+        """Agrega registros al segmento actual, abriendo uno nuevo si hace falta."""
+        if self._segmento is None or self._en_segmento >= self.registros_por_segmento:
+            os.makedirs(self.directorio, exist_ok=True)
+            nombre = f"{self._inicio_epoch}-{self.segmentos:04d}.seg"
+            self._segmento = os.path.join(self.directorio, nombre)
+            self._en_segmento = 0
+            self.segmentos += 1
+            with open(self._segmento, "wb") as archivo:
+                archivo.write(
+                    FORMATO_ENCABEZADO.pack(
+                        FIRMA, VERSION, FORMATO_REGISTRO.size, 0, self._inicio_epoch
+                    )
+                )
+        with open(self._segmento, "ab") as archivo:
+            archivo.write(datos)
+        self._en_segmento += cantidad
+
+    def cerrar(self, timeout=5.0):
+        """Vuelca lo pendiente y detiene el hilo. Es seguro llamarlo más de una vez.
+
+        Args:
+            timeout: Segundos máximos a esperar que termine el hilo.
+        """
+        if not self._cerrado:
+            self._cerrado = True
+            self._despertar.set()
+            self._hilo.join(timeout)
+            self.volcar()
+
+    def metricas(self) -> dict:
+        """Devuelve los contadores del buffer y de los volcados."""
+        return {
+            "registros": self.registros,
+            "pendientes": self.registros - self._leidos,
+            "descartados": self.descartados,
+            "volcados": self.volcados,
+            "segmentos": self.segmentos,
+            "errores": self.errores,
+        }
+
+    def _bucle(self):
+        """Vuelca el buffer cada `intervalo` segundos o cuando se llena a medias."""
+        while not self._cerrado:
+            self._despertar.wait(self.intervalo)
+            self._despertar.clear()
+            self.volcar()
+
+
+def leer_segmento(ruta: str):
+    """Decodifica un archivo de segmento de telemetría.
+
+    Args:
+        ruta: Ruta al archivo .seg.
+
+    Returns:
+        tuple: (instante de inicio de la sesión en ms desde epoch,
+        lista de tuplas (ms, tipo, nivel, c, a, b)).
+
+    Raises:
+        ValueError: Si el archivo no es un segmento de telemetría o su
+        versión no es compatible.
+    """
+    with open(ruta, "rb") as archivo:
+        datos = archivo.read()
+    if len(datos) < FORMATO_ENCABEZADO.size:
+        raise ValueError(f"{ruta}: segmento truncado")
+    firma, version, tamanio, _, inicio = FORMATO_ENCABEZADO.unpack_from(datos)
+    if firma != FIRMA or version != VERSION or tamanio != FORMATO_REGISTRO.size:
+        raise ValueError(f"{ruta}: no es un segmento de telemetría compatible")
+    cuerpo = memoryview(datos)[FORMATO_ENCABEZADO.size :]
+    # Un registro incompleto al final (volcado interrumpido) se ignora.
+    cuerpo = cuerpo[: len(cuerpo) - len(cuerpo) % tamanio]
+    return inicio, list(FORMATO_REGISTRO.iter_unpack(cuerpo))
@@ -1,7 +1,8 @@
 import csv
-import json
 import pygame
 import os
+from collections import OrderedDict
+from modules.config import DIR_IMAGENES, LIMITE_CACHE_IMAGENES
 
 
 def leer_csv(ruta):
@@ -24,37 +25,138 @@ def leer_csv(ruta):
     return lista_elementos
 
 
-def guardar_resultado_json(ruta, datos):
-    """Guarda estadísticas finales en JSON de forma acumulativa.
+# Caché LRU de imágenes escaladas, acotada a LIMITE_CACHE_IMAGENES bytes
+# de píxeles: al pasarse se descartan las usadas hace más tiempo.
+_cache_imagenes = OrderedDict()
+_bytes_cache_imagenes = 0
+_estadisticas_imagenes = {"aciertos": 0, "fallos": 0, "descartes": 0}
+_paquete_assets = None
+_directorio_imagenes = DIR_IMAGENES
+# Imágenes modificadas en disco cuya versión del paquete quedó vieja.
+_fuera_de_paquete = set()
 
-    Lee el archivo existente (si lo hay), agrega los nuevos datos
-    a la lista y sobreescribe el archivo con la lista actualizada.
+
+def usar_paquete_assets(paquete):
+    """Registra un paquete de imágenes pre-escaladas para `cargar_imagen`.
+
+    Args:
+        paquete: Instancia de `PaqueteAssets`, o None para volver a
+        decodificar siempre desde la carpeta de imágenes.
+    """
+    global _paquete_assets, _bytes_cache_imagenes
+    _paquete_assets = paquete
+    _cache_imagenes.clear()
+    _bytes_cache_imagenes = 0
+    _fuera_de_paquete.clear()
+
+
+def usar_directorio_imagenes(directorio):
+    """Cambia la carpeta desde la que `cargar_imagen` decodifica.
+
+    Vacía la caché y deja de usar el paquete de assets, que se generó
+    a partir de otra carpeta.
+
+    Args:
+        directorio: Carpeta con las imágenes de las cartas.
+    """
+    global _directorio_imagenes
+    _directorio_imagenes = directorio
+    usar_paquete_assets(None)
+
+
+def directorio_imagenes():
+    """Devuelve la carpeta desde la que se decodifican las imágenes."""
+    return _directorio_imagenes
+
+
+def descartar_imagen(nombre):
+    """Quita de la caché todas las versiones escaladas de una imagen.
+
+    Se usa cuando el archivo cambió en disco: la próxima llamada a
+    `cargar_imagen` lo vuelve a decodificar, sin usar el paquete de
+    assets, que tiene la versión anterior.
 
     Args:
-        ruta: Ruta al archivo JSON de resultados.
-        datos: Diccionario con las estadísticas a guardar.
+        nombre: Nombre del archivo de imagen.
     """
-    lista_datos = []
+    global _bytes_cache_imagenes
+    for clave in [c for c in _cache_imagenes if c[0] == nombre]:
+        _bytes_cache_imagenes -= _bytes_superficie(_cache_imagenes.pop(clave))
+    _fuera_de_paquete.add(nombre)
 
-    if os.path.exists(ruta):
-        try:
-            with open(ruta, "r") as archivo:
-                contenido = json.load(archivo)
-                if isinstance(contenido, list):
-                    lista_datos = contenido
-                else:
-                    lista_datos = [contenido]
-        except (json.JSONDecodeError, ValueError):
-            lista_datos = []
 
-    lista_datos.append(datos)
+def _bytes_superficie(superficie):
+    """Bytes de píxeles estimados de una superficie."""
+    return superficie.get_pitch() * superficie.get_height()
 
-    with open(ruta, "w") as archivo:
-        json.dump(lista_datos, archivo, indent=4)
+
+def _guardar_en_cache(clave, superficie):
+    """Agrega una imagen a la caché y descarta las menos usadas si se pasa
+    del límite. La última agregada se conserva siempre.
+    """
+    global _bytes_cache_imagenes
+    _cache_imagenes[clave] = superficie
+    _bytes_cache_imagenes += _bytes_superficie(superficie)
+    while _bytes_cache_imagenes > LIMITE_CACHE_IMAGENES and len(_cache_imagenes) > 1:
+        _, descartada = _cache_imagenes.popitem(last=False)
+        _bytes_cache_imagenes -= _bytes_superficie(descartada)
+        _estadisticas_imagenes["descartes"] += 1
+
+
+def _en_paquete(clave):
+    """Indica si el paquete de assets tiene una versión vigente de la imagen."""
+    return (
+        _paquete_assets is not None
+        and clave[0] not in _fuera_de_paquete
+        and clave in _paquete_assets
+    )
+
+
+def estadisticas_cache_imagenes():
+    """Devuelve los aciertos, fallos, descartes, entradas, bytes de píxeles
+    estimados y límite en bytes de la caché de `cargar_imagen`.
+    """
+    return dict(
+        _estadisticas_imagenes,
+        tamanio=len(_cache_imagenes),
+        bytes=_bytes_cache_imagenes,
+        limite=LIMITE_CACHE_IMAGENES,
+    )
+
+
+def imagen_disponible(nombre, tamanio):
+    """Indica si una imagen se puede obtener sin decodificar el archivo.
+
+    Args:
+        nombre: Nombre del archivo de imagen.
+        tamanio: Tupla (ancho, alto) de la versión escalada.
+
+    Returns:
+        bool: True si está en la caché o en el paquete de assets.
+    """
+    clave = (nombre, tuple(tamanio))
+    return clave in _cache_imagenes or _en_paquete(clave)
+
+
+def registrar_imagen(nombre, tamanio, superficie):
+    """Guarda en la caché una imagen ya escalada, por ejemplo precargada.
+
+    Args:
+        nombre: Nombre del archivo de imagen.
+        tamanio: Tupla (ancho, alto) de la versión escalada.
+        superficie: Superficie en formato de pantalla.
+    """
+    clave = (nombre, tuple(tamanio))
+    if clave not in _cache_imagenes:
+        _guardar_en_cache(clave, superficie)
 
 
 def cargar_imagen(nombre, tamanio):
-    """Carga y escala una imagen desde la carpeta assets/img.
+    """Carga y escala una imagen desde la carpeta de imágenes.
+
+    Busca primero en la caché, luego en el paquete de assets
+    registrado con `usar_paquete_assets` y, si no está, decodifica el
+    archivo original. El resultado queda en la caché LRU.
 
     Args:
         nombre: Nombre del archivo de imagen.
@@ -64,21 +166,35 @@ def cargar_imagen(nombre, tamanio):
         pygame.Surface: Superficie con la imagen escalada, o una
         superficie roja si la imagen no se encuentra.
     """
-    ruta = os.path.join("assets", "img", nombre)
-    resultado = None
-    try:
-        img = pygame.image.load(ruta).convert_alpha()
-        resultado = pygame.transform.scale(img, tamanio)
-    except:
-        superficie = pygame.Surface(tamanio)
-        superficie.fill((200, 0, 0))
-        resultado = superficie
+    clave = (nombre, tuple(tamanio))
+    resultado = _cache_imagenes.get(clave)
+    if resultado is not None:
+        _estadisticas_imagenes["aciertos"] += 1
+        _cache_imagenes.move_to_end(clave)
+    else:
+        _estadisticas_imagenes["fallos"] += 1
+        if _en_paquete(clave):
+            resultado = _paquete_assets.superficie(nombre, tamanio)
+        if resultado is None:
+            ruta = os.path.join(_directorio_imagenes, nombre)
+            try:
+                img = pygame.image.load(ruta).convert_alpha()
+                resultado = pygame.transform.scale(img, tamanio)
+            except:
+                superficie = pygame.Surface(tamanio)
+                superficie.fill((200, 0, 0))
+                resultado = superficie
+        _guardar_en_cache(clave, resultado)
     return resultado
 
 
 def cargar_sonido(ruta, volumen=1.0):
     """Carga un archivo de sonido con volumen configurable.
 
+    Si el paquete de assets registrado trae el sonido ya decodificado,
+    se crea a partir de esas muestras sin volver a decodificar el
+    archivo.
+
     Args:
         ruta: Ruta al archivo de sonido.
         volumen: Nivel de volumen inicial entre 0.0 y 1.0.
@@ -86,6 +202,12 @@ def cargar_sonido(ruta, volumen=1.0):
     Returns:
         pygame.mixer.Sound: Objeto de sonido configurado.
     """
-    sonido = pygame.mixer.Sound(ruta)
+    muestras = None
+    if _paquete_assets is not None:
+        muestras = _paquete_assets.sonido(ruta)
+    if muestras is not None:
+        sonido = pygame.mixer.Sound(buffer=muestras)
+    else:
+        sonido = pygame.mixer.Sound(ruta)
     sonido.set_volume(volumen)
     return sonido
@@ -0,0 +1,120 @@
+import os
+import threading
+
+
+def _estado_archivo(ruta: str):
+    """Devuelve (mtime en ns, tamaño) de un archivo, o None si no existe."""
+    try:
+        datos = os.stat(ruta)
+    except OSError:
+        return None
+    return (datos.st_mtime_ns, datos.st_size)
+
+
+def _estado_directorio(directorio: str) -> dict:
+    """Devuelve nombre -> (mtime en ns, tamaño) de los archivos de un directorio."""
+    estados = {}
+    try:
+        with os.scandir(directorio) as entradas:
+            for entrada in entradas:
+                try:
+                    if entrada.is_file():
+                        datos = entrada.stat()
+                        estados[entrada.name] = (datos.st_mtime_ns, datos.st_size)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return estados
+
+
+class VigilanteContenido:
+    """Vigila en segundo plano el CSV del catálogo y la carpeta de imágenes.
+
+    Un hilo compara cada `intervalo` segundos la fecha de modificación
+    y el tamaño de los archivos con los de la revisión anterior, y
+    acumula qué cambió. El hilo solo consulta el disco: los cambios se
+    aplican desde el hilo principal con `pendientes`, en el momento
+    que convenga al juego.
+
+    Attributes:
+        ruta_csv: Ruta al CSV del catálogo.
+        dir_imagenes: Carpeta de las imágenes.
+        intervalo: Segundos entre revisiones.
+        revisiones: Cantidad de revisiones realizadas.
+    """
+
+    def __init__(self, ruta_csv: str, dir_imagenes: str, intervalo: float = 2.0):
+        """Toma el estado inicial de los archivos e inicia el hilo.
+
+        Args:
+            ruta_csv: Ruta al CSV del catálogo.
+            dir_imagenes: Carpeta de las imágenes.
+            intervalo: Segundos entre revisiones.
+        """
+        self.ruta_csv = ruta_csv
+        self.dir_imagenes = dir_imagenes
+        self.intervalo = intervalo
+        self.revisiones = 0
+
+        self._estado_csv = _estado_archivo(ruta_csv)
+        self._estado_imagenes = _estado_directorio(dir_imagenes)
+        self._csv_cambiado = False
+        self._imagenes_cambiadas = set()
+        self._candado = threading.Lock()
+
+        self._detener = threading.Event()
+        self._hilo = threading.Thread(
+            target=self._bucle, name="vigilante-contenido", daemon=True
+        )
+        self._hilo.start()
+
+    def revisar(self):
+        """Compara los archivos con la revisión anterior y acumula los cambios."""
+        estado_csv = _estado_archivo(self.ruta_csv)
+        estado_imagenes = _estado_directorio(self.dir_imagenes)
+
+        anteriores = self._estado_imagenes
+        cambiadas = {
+            nombre
+            for nombre in anteriores.keys() | estado_imagenes.keys()
+            if anteriores.get(nombre) != estado_imagenes.get(nombre)
+        }
+        with self._candado:
+            # Si el CSV desapareció (por ejemplo, mientras se guarda) se
+            # espera a que vuelva a estar.
+            if estado_csv is not None and estado_csv != self._estado_csv:
+                self._csv_cambiado = True
+            if estado_csv is not None:
+                self._estado_csv = estado_csv
+            self._imagenes_cambiadas |= cambiadas
+            self._estado_imagenes = estado_imagenes
+            self.revisiones += 1
+
+    def pendientes(self) -> tuple:
+        """Devuelve y olvida los cambios acumulados desde la última llamada.
+
+        Returns:
+            tuple: (True si cambió el CSV, conjunto de nombres de imagen
+            agregadas, modificadas o borradas).
+        """
+        with self._candado:
+            resultado = (self._csv_cambiado, self._imagenes_cambiadas)
+            self._csv_cambiado = False
+            self._imagenes_cambiadas = set()
+        return resultado
+
+    def cerrar(self, timeout=5.0):
+        """Detiene el hilo. Es seguro llamarlo más de una vez.
+
+        Args:
+            timeout: Segundos máximos a esperar que termine el hilo.
+        """
+        self._detener.set()
+        if self._hilo.is_alive():
+            self._hilo.join(timeout)
+
+    def _bucle(self):
+        """Revisa los archivos cada `intervalo` segundos hasta que se cierre."""
+        while not self._detener.wait(self.intervalo):
+            self.revisar()
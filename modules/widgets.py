@@ -0,0 +1,299 @@
+import pygame
+from modules.config import COLOR_FONDO, COLOR_TEXTO
+
+
+class Widget:
+    """Elemento de interfaz con superficie en caché.
+
+    La superficie se vuelve a generar solo cuando el widget se marca
+    como sucio, es decir, cuando cambia algo que se ve. En el resto de
+    los cuadros dibujarlo es un único blit.
+
+    Attributes:
+        rect: Rectángulo que ocupa el widget en pantalla.
+        visible: Indica si el widget se dibuja y recibe clics.
+    """
+
+    def __init__(self, rect):
+        """Crea el widget.
+
+        Args:
+            rect: Rectángulo o tupla (x, y, ancho, alto).
+        """
+        self.rect = pygame.Rect(rect)
+        self.visible = True
+        self._superficie = None
+        self._sucio = True
+        self._fuente = None
+
+    @property
+    def fuente(self):
+        """Fuente con la que el widget renderiza su texto."""
+        return self._fuente
+
+    @fuente.setter
+    def fuente(self, fuente):
+        if fuente is not self._fuente:
+            self._fuente = fuente
+            self._sucio = True
+
+    def marcar_sucio(self):
+        """Fuerza a regenerar la superficie en el próximo dibujo."""
+        self._sucio = True
+
+    def contiene(self, pos: tuple) -> bool:
+        """Indica si una posición cae dentro del widget visible."""
+        return self.visible and self.rect.collidepoint(pos)
+
+    def dibujar(self, pantalla):
+        """Dibuja el widget, regenerando su superficie si está sucio.
+
+        Args:
+            pantalla: Superficie principal de Pygame.
+        """
+        if self.visible:
+            if self._sucio or self._superficie is None:
+                self._superficie = self._renderizar()
+                self._sucio = False
+            pantalla.blit(self._superficie, self.rect)
+
+    def _renderizar(self):
+        """Genera la superficie del widget. Lo implementan las subclases."""
+        raise NotImplementedError
+
+
+class Etiqueta(Widget):
+    """Texto de una línea anclado a un punto de la pantalla."""
+
+    def __init__(self, posicion: tuple, color, ancla: str = "topleft", texto: str = ""):
+        """Crea la etiqueta.
+
+        Args:
+            posicion: Punto (x, y) donde se ancla el texto.
+            color: Color del texto.
+            ancla: Atributo de Rect que se ubica en `posicion`
+            ("topleft", "center", etc.).
+            texto: Texto inicial.
+        """
+        super().__init__((posicion, (0, 0)))
+        self.posicion = posicion
+        self.ancla = ancla
+        self.color = color
+        self.texto = texto
+
+    def configurar(self, texto: str = None, color=None):
+        """Cambia el texto o el color, marcando sucio solo si cambian.
+
+        Args:
+            texto: Texto nuevo, o None para mantenerlo.
+            color: Color nuevo, o None para mantenerlo.
+        """
+        if texto is not None and texto != self.texto:
+            self.texto = texto
+            self._sucio = True
+        if color is not None and color != self.color:
+            self.color = color
+            self._sucio = True
+
+    def _renderizar(self):
+        superficie = self._fuente.render(self.texto, True, self.color)
+        self.rect = superficie.get_rect(**{self.ancla: self.posicion})
+        return superficie
+
+
+class Boton(Widget):
+    """Botón rectangular redondeado con texto centrado."""
+
+    def __init__(self, rect, texto: str, color, fondo=COLOR_FONDO, radio: int = 5):
+        """Crea el botón.
+
+        Args:
+            rect: Rectángulo del botón.
+            texto: Texto del botón.
+            color: Color de relleno.
+            fondo: Color de la pantalla detrás del botón, usado en las
+            esquinas redondeadas para que la superficie sea opaca.
+            radio: Radio de las esquinas.
+        """
+        super().__init__(rect)
+        self.texto = texto
+        self.color = color
+        self.fondo = fondo
+        self.radio = radio
+
+    def configurar(self, texto: str = None, color=None):
+        """Cambia el texto o el color, marcando sucio solo si cambian."""
+        if texto is not None and texto != self.texto:
+            self.texto = texto
+            self._sucio = True
+        if color is not None and color != self.color:
+            self.color = color
+            self._sucio = True
+
+    def _renderizar(self):
+        superficie = pygame.Surface(self.rect.size).convert()
+        superficie.fill(self.fondo)
+        local = superficie.get_rect()
+        pygame.draw.rect(superficie, self.color, local, border_radius=self.radio)
+        txt = self._fuente.render(self.texto, True, COLOR_TEXTO)
+        superficie.blit(txt, txt.get_rect(center=local.center))
+        return superficie
+
+
+class CampoTexto(Widget):
+    """Campo de ingreso de texto con borde que indica si está activo."""
+
+    def __init__(self, rect, color_activo, color_inactivo, fondo=COLOR_FONDO):
+        """Crea el campo.
+
+        Args:
+            rect: Rectángulo del campo.
+            color_activo: Color del borde con el campo activo.
+            color_inactivo: Color del borde con el campo inactivo.
+            fondo: Color de la pantalla detrás del campo.
+        """
+        super().__init__(rect)
+        self.color_activo = color_activo
+        self.color_inactivo = color_inactivo
+        self.fondo = fondo
+        self.texto = ""
+        self.activo = False
+
+    def configurar(self, texto: str, activo: bool):
+        """Actualiza el texto y el estado, marcando sucio solo si cambian."""
+        if texto != self.texto or activo != self.activo:
+            self.texto = texto
+            self.activo = activo
+            self._sucio = True
+
+    def _renderizar(self):
+        superficie = pygame.Surface(self.rect.size).convert()
+        superficie.fill(self.fondo)
+        local = superficie.get_rect()
+        color_borde = self.color_activo if self.activo else self.color_inactivo
+        pygame.draw.rect(superficie, (50, 50, 50), local, border_radius=5)
+        pygame.draw.rect(superficie, color_borde, local, 3, border_radius=5)
+        txt = self._fuente.render(self.texto, True, COLOR_TEXTO)
+        superficie.blit(txt, (10, 10))
+        return superficie
+
+
+class BarraProgreso(Widget):
+    """Barra horizontal que muestra un valor entre 0.0 y 1.0."""
+
+    def __init__(
+        self,
+        rect,
+        color_relleno,
+        color_vacio=(50, 50, 50),
+        fondo=COLOR_FONDO,
+        mostrar_porcentaje=False,
+    ):
+        """Crea la barra.
+
+        Args:
+            rect: Rectángulo de la barra.
+            color_relleno: Color de la parte completa.
+            color_vacio: Color de la parte vacía.
+            fondo: Color de la pantalla detrás de la barra.
+            mostrar_porcentaje: Dibuja el porcentaje centrado en la barra.
+        """
+        super().__init__(rect)
+        self.color_relleno = color_relleno
+        self.color_vacio = color_vacio
+        self.fondo = fondo
+        self.mostrar_porcentaje = mostrar_porcentaje
+        self.valor = 0.0
+        self._relleno = 0
+        self._porcentaje = 0
+
+    def configurar(self, valor: float):
+        """Actualiza el valor, marcando sucio solo si cambia lo que se ve."""
+        self.valor = valor
+        relleno = int(self.rect.width * valor)
+        porcentaje = int(valor * 100)
+        if relleno != self._relleno or porcentaje != self._porcentaje:
+            self._relleno = relleno
+            self._porcentaje = porcentaje
+            self._sucio = True
+
+    def _renderizar(self):
+        superficie = pygame.Surface(self.rect.size).convert()
+        superficie.fill(self.fondo)
+        local = superficie.get_rect()
+        pygame.draw.rect(superficie, self.color_vacio, local, border_radius=3)
+        if self._relleno > 0:
+            relleno = pygame.Rect(0, 0, self._relleno, local.height)
+            pygame.draw.rect(superficie, self.color_relleno, relleno, border_radius=3)
+        if self.mostrar_porcentaje:
+            txt = self._fuente.render(f"{self._porcentaje}%", True, COLOR_TEXTO)
+            superficie.blit(txt, txt.get_rect(center=local.center))
+        return superficie
+
+
+class Overlay(Widget):
+    """Capa semitransparente de pantalla completa con un texto centrado."""
+
+    def __init__(self, tamanio: tuple, color_rgba: tuple, texto: str):
+        """Crea la capa.
+
+        Args:
+            tamanio: Tupla (ancho, alto) de la capa.
+            color_rgba: Color con alfa de la capa.
+            texto: Texto a mostrar en el centro.
+        """
+        super().__init__(((0, 0), tamanio))
+        self.color_rgba = color_rgba
+        self.texto = texto
+        self._capa = None
+
+    def dibujar(self, pantalla):
+        """Dibuja la capa y, encima, el texto sin transparencia."""
+        if self.visible:
+            if self._capa is None:
+                self._capa = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+                self._capa.fill(self.color_rgba)
+            pantalla.blit(self._capa, self.rect)
+            if self._sucio or self._superficie is None:
+                self._superficie = self._renderizar()
+                self._sucio = False
+            destino = self._superficie.get_rect(center=self.rect.center)
+            pantalla.blit(self._superficie, destino)
+
+    def _renderizar(self):
+        return self._fuente.render(self.texto, True, (255, 255, 255))
+
+
+class Contenedor:
+    """Agrupa widgets para dibujarlos y consultarlos juntos.
+
+    Attributes:
+        hijos: Lista de widgets en orden de dibujo.
+    """
+
+    def __init__(self, hijos=None):
+        """Crea el contenedor con una lista inicial de widgets."""
+        self.hijos = list(hijos or [])
+
+    def agregar(self, widget):
+        """Agrega un widget al final y lo devuelve."""
+        self.hijos.append(widget)
+        return widget
+
+    def asignar_fuente(self, fuente):
+        """Asigna la misma fuente a todos los widgets."""
+        for hijo in self.hijos:
+            hijo.fuente = fuente
+
+    def dibujar(self, pantalla):
+        """Dibuja todos los widgets en orden."""
+        for hijo in self.hijos:
+            hijo.dibujar(pantalla)
+
+    def widget_en(self, pos: tuple):
+        """Devuelve el último widget visible que contiene `pos`, o None."""
+        resultado = None
+        for hijo in self.hijos:
+            if hijo.contiene(pos):
+                resultado = hijo
+        return resultado